@@ -0,0 +1,194 @@
+import json
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import click
+
+
+def job_arguments(job):
+    """
+    Convert a job specification to command line arguments.
+
+    Parameters
+    ----------
+    job : dict
+        Options of the ``mortier`` command, by name, e.g.
+        ``{"tess_id": "t3006", "angle": 0.4, "lace": true}``. Flags are set
+        by true values, options with several values take lists, and null
+        values are left to their default.
+
+    Returns
+    -------
+    List[str]
+        Arguments of the ``mortier`` command.
+    """
+    args = []
+    for name, value in job.items():
+        option = f"--{name}"
+        if value is None or value is False:
+            continue
+        if value is True:
+            args.append(option)
+        elif isinstance(value, (list, tuple)):
+            args += [option, *map(str, value)]
+        else:
+            args += [option, str(value)]
+    return args
+
+
+def init_worker():
+    """
+    Load the database and the drawing backends once per worker process.
+
+    Returns
+    -------
+    None
+    """
+    # pylint: disable=import-outside-toplevel
+    import mortier.tesselation as tesselations
+    import mortier.writer as writers
+    from mortier.main import database
+
+    database.tiling_type()
+    for module in (tesselations, writers):
+        for name in module.__all__:
+            getattr(module, name)
+
+
+def run_job(index, job):
+    """
+    Render a single job.
+
+    The options are parsed by the ``mortier`` command itself, so a job
+    behaves exactly like the same command line.
+
+    Parameters
+    ----------
+    index : int
+        Position of the job in the batch.
+    job : dict
+        Options of the ``mortier`` command, see ``job_arguments``.
+
+    Returns
+    -------
+    dict
+        Report of the job: its index, output, status (``"ok"`` or
+        ``"error"``), duration in seconds, number of faces drawn and culled
+        outside the canvas, and error message if any.
+    """
+    # pylint: disable=import-outside-toplevel,broad-exception-caught
+    from mortier.main import render, tess_param
+
+    report = {"job": index, "output": job.get("output"), "status": "ok"}
+    start = time.perf_counter()
+    try:
+        context = tess_param.make_context("mortier", job_arguments(job))
+        report["faces_drawn"], report["faces_culled"] = render(**context.params)
+    except click.ClickException as e:
+        report["status"] = "error"
+        report["error"] = e.format_message()
+    except Exception as e:
+        report["status"] = "error"
+        report["error"] = f"{type(e).__name__}: {e}"
+    report["time"] = round(time.perf_counter() - start, 3)
+    return report
+
+
+def run_batch(jobs, processes=None):
+    """
+    Render jobs on a pool of worker processes.
+
+    The database and the backends are loaded before the workers are
+    started, so that forked workers inherit them, and the workers keep them
+    from one job to the next.
+
+    Parameters
+    ----------
+    jobs : iterable of dict
+        Options of every job, see ``job_arguments``.
+    processes : int, optional
+        Number of worker processes, defaults to the number of CPUs.
+
+    Yields
+    ------
+    dict
+        Report of every job, see ``run_job``, in the order in which they
+        are done. The jobs not started yet are cancelled when the generator
+        is closed before the end.
+    """
+    init_worker()
+    pool = ProcessPoolExecutor(max_workers=processes, initializer=init_worker)
+    try:
+        futures = [pool.submit(run_job, i, job) for i, job in enumerate(jobs)]
+        for future in as_completed(futures):
+            yield future.result()
+    finally:
+        # The queued jobs are dropped if the reports are no longer read
+        pool.shutdown(cancel_futures=True)
+
+
+def read_jobs(lines):
+    """
+    Parse job specifications written as JSON lines.
+
+    Parameters
+    ----------
+    lines : iterable of str
+        One JSON object per line, blank lines are ignored.
+
+    Returns
+    -------
+    List[dict]
+        Options of every job.
+
+    Raises
+    ------
+    click.BadParameter
+        If a line is not a JSON object.
+    """
+    jobs = []
+    for n, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        try:
+            job = json.loads(line)
+        except json.JSONDecodeError as e:
+            raise click.BadParameter(f"line {n}: {e}") from e
+        if not isinstance(job, dict):
+            raise click.BadParameter(f"line {n}: a job must be a JSON object")
+        jobs.append(job)
+    return jobs
+
+
+@click.command()
+@click.argument("jobs", type=click.File("r"))
+@click.option(
+    "--processes",
+    default=None,
+    type=click.IntRange(min=1),
+    help="Number of worker processes, defaults to the CPU count",
+)
+def batch(jobs, processes):
+    """
+    Render every job of the JSON lines file JOBS ("-" for stdin).
+
+    Each line holds the options of one ``mortier`` command, e.g.
+    {"tess_id": "t3006", "angle": 0.4, "output": "out/t3006"}. A JSON report
+    is printed for every job as soon as it is done.
+    """
+    jobs = read_jobs(jobs)
+
+    start = time.perf_counter()
+    failed = 0
+    for report in run_batch(jobs, processes):
+        failed += report["status"] != "ok"
+        click.echo(json.dumps(report))
+
+    elapsed = time.perf_counter() - start
+    click.echo(f"{len(jobs)} jobs, {failed} failed, in {elapsed:.2f} s", err=True)
+    if failed:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    batch()
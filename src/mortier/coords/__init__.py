@@ -1,4 +1,5 @@
 from mortier.coords.coords import Coords as Coords
 from mortier.coords.euclidean_coords import EuclideanCoords as EuclideanCoords
+from mortier.coords.lattice_coords import LatticeArray as LatticeArray
 from mortier.coords.lattice_coords import LatticeCoords as LatticeCoords
 from mortier.coords.line import Line as Line
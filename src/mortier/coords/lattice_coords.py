@@ -3,10 +3,130 @@ import numpy as np
 from mortier.coords import Coords
 from mortier.coords.euclidean_coords import EuclideanCoords
 
+# Images of the lattice basis (1, w, w^2, w^3), with w = exp(i * pi / 6),
+# in the Euclidean plane. Row k holds the [x, y] coordinates of w^k.
+LATTICE_TO_PLANE = np.array(
+    [
+        [1.0, 0.0],
+        [0.5 * np.sqrt(3), 0.5],
+        [0.5, 0.5 * np.sqrt(3)],
+        [0.0, 1.0],
+    ]
+)
+
+_HALF_SQRT_3 = float(LATTICE_TO_PLANE[1, 0])
+
+# Lattice vectors are packed into a single int64 as four signed 16 bits fields
+_PACK_BITS = 16
+_PACK_MIN = -(1 << (_PACK_BITS - 1))
+_PACK_MAX = (1 << (_PACK_BITS - 1)) - 1
+
+
+def lattice_to_plane(w):
+    """
+    Map an array of 4D lattice vectors to 2D Euclidean coordinates.
+
+    The projection is the product with the constant ``LATTICE_TO_PLANE``
+    matrix. It is accumulated term by term so that the result is exactly the
+    one of a single ``LatticeCoords``, whatever the shape of the input.
+
+    Parameters
+    ----------
+    w : array-like
+        Array of shape (..., 4) holding lattice vectors.
+
+    Returns
+    -------
+    np.ndarray
+        Array of shape (..., 2) holding the [x, y] coordinates.
+    """
+    w = np.asarray(w)
+    plane = w[..., 0, None] * LATTICE_TO_PLANE[0]
+    for k in range(1, 4):
+        plane = plane + w[..., k, None] * LATTICE_TO_PLANE[k]
+    return plane
+
+
+def pack_lattice(w):
+    """
+    Pack lattice vectors into single int64 keys.
+
+    Each component is stored as a signed 16 bits field, which makes the keys
+    cheap to hash, sort and compare with ``np.unique``.
+
+    Parameters
+    ----------
+    w : array-like of int
+        Array of shape (..., 4) holding lattice vectors.
+
+    Returns
+    -------
+    np.ndarray
+        Array of shape (...) of int64 keys.
+
+    Raises
+    ------
+    ValueError
+        If a component does not fit in 16 bits.
+    """
+    w = np.asarray(w, dtype=np.int64)
+    if w.size and (w.min() < _PACK_MIN or w.max() > _PACK_MAX):
+        raise ValueError("Lattice components do not fit in 16 bits.")
+
+    mask = (1 << _PACK_BITS) - 1
+    keys = np.zeros(w.shape[:-1], dtype=np.int64)
+    for k in range(4):
+        keys = (keys << _PACK_BITS) | (w[..., k] & mask)
+    return keys
+
+
+def reduce_lattice_basis(t1, t2):
+    """
+    Gauss-reduce a basis of a 2D sublattice.
+
+    The basis is replaced by the two shortest independent vectors of the
+    sublattice it spans, which are close to orthogonal. The computations
+    are done on exact integer lattice vectors, only the norms are measured
+    in the plane.
+
+    Parameters
+    ----------
+    t1, t2 : array-like of int
+        Lattice vectors [w0, w1, w2, w3] spanning the sublattice.
+
+    Returns
+    -------
+    b1, b2 : np.ndarray
+        Reduced basis as int64 lattice vectors, with |b1| <= |b2|. The input
+        is returned unchanged if the vectors are not independent.
+    """
+    b1 = np.asarray(t1, dtype=np.int64)
+    b2 = np.asarray(t2, dtype=np.int64)
+    p1, p2 = lattice_to_plane([b1, b2])
+    if abs(p1[0] * p2[1] - p1[1] * p2[0]) < 1e-9:
+        return b1, b2
+
+    while True:
+        p1, p2 = lattice_to_plane([b1, b2])
+        if p2 @ p2 < p1 @ p1 - 1e-9:
+            b1, b2 = b2, b1
+            p1, p2 = p2, p1
+
+        # Ties are rounded toward zero, so that rounding noise on equal
+        # length vectors cannot make the reduction cycle
+        r = (p1 @ p2) / (p1 @ p1)
+        mu = int(np.sign(r) * np.floor(abs(r) + 0.5 - 1e-9))
+        if mu == 0:
+            return b1, b2
+        b2 = b2 - mu * b1
+
 
 class LatticeCoords(Coords):
     """
     Represents a 4D lattice coordinate with a mapping to 2D Euclidean space.
+
+    The components are stored as exact integers, so lattice points can be
+    hashed and compared for equality.
     """
 
     def __init__(self, w):
@@ -18,11 +138,45 @@ class LatticeCoords(Coords):
         w : array-like of length 4
             Lattice vector [w0, w1, w2, w3].
         """
-        self.w = np.array([w[0], w[1], w[2], w[3]], dtype=complex)
+        w = np.real(np.asarray(w[:4]))
+        if np.issubdtype(w.dtype, np.integer) or np.all(w == np.round(w)):
+            w = w.astype(np.int64)
+        self.w = w
+        self.key = tuple(w.tolist())
 
         # Map 4D lattice to 2D Euclidean coordinates
-        self.x = (w[0] + 0.5 * np.sqrt(3) * w[1] + 0.5 * w[2]).real
-        self.y = (0.5 * w[1] + 0.5 * np.sqrt(3) * w[2] + w[3]).real
+        w0, w1, w2, w3 = self.key
+        self.x = w0 + _HALF_SQRT_3 * w1 + 0.5 * w2
+        self.y = 0.5 * w1 + _HALF_SQRT_3 * w2 + w3
+
+    def __hash__(self):
+        """
+        Hash of the lattice vector.
+
+        Returns
+        -------
+        int
+            Hash of the components.
+        """
+        return hash(self.key)
+
+    def __eq__(self, other):
+        """
+        Check whether two lattice coordinates are the same lattice point.
+
+        Parameters
+        ----------
+        other : LatticeCoords
+            Another lattice coordinate.
+
+        Returns
+        -------
+        bool
+            True if all four components are equal.
+        """
+        if not isinstance(other, LatticeCoords):
+            return NotImplemented
+        return self.key == other.key
 
     def translate(self, wc):
         """
@@ -38,8 +192,7 @@ class LatticeCoords(Coords):
         LatticeCoords
             Translated lattice coordinate.
         """
-        c = [w_ + wc_ for w_, wc_ in zip(self.w, wc.w)]
-        return LatticeCoords(c)
+        return LatticeCoords(self.w + wc.w)
 
     def scale(self, k):
         """
@@ -55,8 +208,7 @@ class LatticeCoords(Coords):
         LatticeCoords
             Scaled lattice coordinate.
         """
-        c = [w_ * k for w_ in self.w]
-        return LatticeCoords(c)
+        return LatticeCoords(self.w * k)
 
     def sum(self):
         """
@@ -67,7 +219,7 @@ class LatticeCoords(Coords):
         float
             Sum of the four components.
         """
-        return sum(self.w)
+        return sum(self.key)
 
     def rotate(self, angle):
         """
@@ -97,3 +249,91 @@ class LatticeCoords(Coords):
             Corresponding 2D point.
         """
         return EuclideanCoords([self.x, self.y])
+
+
+class LatticeArray:
+    """
+    Array of 4D lattice vectors stored as exact integers.
+
+    This is the bulk counterpart of ``LatticeCoords``: translations and
+    scalings are applied to every vector at once, and the projection to the
+    plane goes through ``lattice_to_plane``.
+    """
+
+    def __init__(self, w):
+        """
+        Initialize an array of lattice vectors.
+
+        Parameters
+        ----------
+        w : array-like of int
+            Array of shape (..., 4) holding lattice vectors.
+        """
+        self.w = np.asarray(w, dtype=np.int64)
+
+    def __len__(self):
+        """
+        Number of vectors along the first axis.
+
+        Returns
+        -------
+        int
+            Length of the array.
+        """
+        return len(self.w)
+
+    def translate(self, wc):
+        """
+        Translate every vector of the array.
+
+        Parameters
+        ----------
+        wc : LatticeCoords, LatticeArray or array-like of int
+            Translation, broadcast against the array.
+
+        Returns
+        -------
+        LatticeArray
+            Translated vectors.
+        """
+        if isinstance(wc, (LatticeCoords, LatticeArray)):
+            wc = wc.w
+        return LatticeArray(self.w + np.asarray(wc, dtype=np.int64))
+
+    def scale(self, k):
+        """
+        Scale every vector of the array by an integer factor.
+
+        Parameters
+        ----------
+        k : int
+            Scaling factor.
+
+        Returns
+        -------
+        LatticeArray
+            Scaled vectors.
+        """
+        return LatticeArray(self.w * k)
+
+    def to_plane(self):
+        """
+        Project every vector to the Euclidean plane.
+
+        Returns
+        -------
+        np.ndarray
+            Array of shape (..., 2) holding [x, y] coordinates.
+        """
+        return lattice_to_plane(self.w)
+
+    def keys(self):
+        """
+        Packed int64 keys of every vector, see ``pack_lattice``.
+
+        Returns
+        -------
+        np.ndarray
+            Array of shape (...) of int64 keys.
+        """
+        return pack_lattice(self.w)
@@ -0,0 +1,4 @@
+from mortier.database.tiling_database import \
+    TilingDatabase as TilingDatabase
+from mortier.database.tiling_database import \
+    compile_database as compile_database
@@ -0,0 +1,3 @@
+from mortier.database.tiling_database import DATABASE_PATH, compile_database
+
+compile_database(f"{DATABASE_PATH}.json", DATABASE_PATH)
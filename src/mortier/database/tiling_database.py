@@ -0,0 +1,249 @@
+import json
+import os
+import random
+from enum import Enum
+
+import numpy as np
+
+from mortier.tesselation.regular_tesselation import RegularTesselation
+
+DATABASE_PATH = "data/database"
+
+# Arrays making up a compiled database, stored as one .npy file each
+_FILES = (
+    "names",
+    "bases",
+    "seeds",
+    "offsets",
+    "face_vertices",
+    "face_sizes",
+    "face_offsets",
+)
+
+
+def compile_database(source, directory=DATABASE_PATH):
+    """
+    Compile a JSON tiling database into flat arrays.
+
+    Tilings are sorted by name. Their translation vectors are stacked in a
+    (N, 2, 4) array, their seeds are concatenated in a single (S, 4) array,
+    and the seeds of the i-th tiling are the rows ``offsets[i]`` to
+    ``offsets[i + 1]``.
+
+    The prototype faces of every tiling are generated once and for all, and
+    stored the same way: the vertices of every face are concatenated in a
+    single (V, 4) array, ``face_sizes`` holds the number of vertices of each
+    face, and row i of ``face_offsets`` holds the index of the first face
+    and of the first vertex of the i-th tiling.
+
+    Parameters
+    ----------
+    source : str
+        Path of the JSON database, mapping names to {"T1", "T2", "Seed"}.
+    directory : str, optional
+        Directory in which the arrays are saved.
+
+    Returns
+    -------
+    None
+    """
+    with open(source, "r", encoding="utf-8") as file:
+        js = json.load(file)
+
+    names = sorted(js)
+    bases = [[js[name]["T1"], js[name]["T2"]] for name in names]
+    seeds = [seed for name in names for seed in js[name]["Seed"]]
+    counts = [len(js[name]["Seed"]) for name in names]
+
+    faces = [
+        RegularTesselation(None, js[name], name).prototype_faces() for name in names
+    ]
+    face_sizes = [len(face) for tiling in faces for face in tiling]
+    face_counts = [[len(tiling), sum(map(len, tiling))] for tiling in faces]
+
+    os.makedirs(directory, exist_ok=True)
+    arrays = {
+        "names": np.array(names),
+        "bases": np.array(bases, dtype=np.int16).reshape(-1, 2, 4),
+        "seeds": np.array(seeds, dtype=np.int16).reshape(-1, 4),
+        "offsets": np.concatenate([[0], np.cumsum(counts)]).astype(np.int64),
+        "face_vertices": np.concatenate(
+            [face for tiling in faces for face in tiling]
+        ).astype(np.int16),
+        "face_sizes": np.array(face_sizes, dtype=np.int8),
+        "face_offsets": np.concatenate(
+            [[[0, 0]], np.cumsum(face_counts, axis=0)]
+        ).astype(np.int64),
+    }
+    for name, array in arrays.items():
+        np.save(os.path.join(directory, f"{name}.npy"), array)
+
+
+class TilingDatabase:
+    """
+    Read-only access to a compiled tiling database.
+
+    The arrays written by ``compile_database`` (which can be rerun with
+    ``python -m mortier.database``) are memory-mapped, so opening
+    the database reads nothing but the array headers, and looking a tiling up
+    only touches the pages holding its name and vectors.
+    """
+
+    def __init__(self, directory=DATABASE_PATH):
+        """
+        Open a compiled database.
+
+        Parameters
+        ----------
+        directory : str, optional
+            Directory holding the compiled arrays.
+        """
+        self.directory = directory
+        for name in _FILES:
+            path = os.path.join(directory, f"{name}.npy")
+            setattr(self, name, np.load(path, mmap_mode="r"))
+        self._tiling_type = None
+
+    def __len__(self):
+        """
+        Number of tilings in the database.
+
+        Returns
+        -------
+        int
+            Number of tilings.
+        """
+        return len(self.names)
+
+    def __contains__(self, tess_id):
+        """
+        Check whether a tiling is in the database.
+
+        Parameters
+        ----------
+        tess_id : str
+            Name of the tiling.
+
+        Returns
+        -------
+        bool
+            True if the tiling exists.
+        """
+        return self.index(tess_id) is not None
+
+    def __getitem__(self, tess_id):
+        """
+        Load a single tiling.
+
+        Parameters
+        ----------
+        tess_id : str
+            Name of the tiling.
+
+        Returns
+        -------
+        dict
+            Tiling as {"T1": list, "T2": list, "Seed": list of lists}, like
+            the entries of the JSON database, along with its precomputed
+            prototypes as "Faces", a list of lists of lattice vertices.
+
+        Raises
+        ------
+        KeyError
+            If the tiling is not in the database.
+        """
+        i = self.index(tess_id)
+        if i is None:
+            raise KeyError(tess_id)
+
+        t1, t2 = self.bases[i].tolist()
+        seeds = self.seeds[self.offsets[i] : self.offsets[i + 1]].tolist()
+
+        (f0, v0), (f1, v1) = self.face_offsets[i : i + 2].tolist()
+        vertices = self.face_vertices[v0:v1].tolist()
+        ends = np.cumsum(self.face_sizes[f0:f1]).tolist()
+        faces = [vertices[a:b] for a, b in zip([0] + ends, ends)]
+
+        return {"T1": t1, "T2": t2, "Seed": seeds, "Faces": faces}
+
+    def get(self, tess_id, default=None):
+        """
+        Load a single tiling, if it exists.
+
+        Parameters
+        ----------
+        tess_id : str
+            Name of the tiling.
+        default : optional
+            Value returned if the tiling is not in the database.
+
+        Returns
+        -------
+        dict
+            Tiling, see ``__getitem__``, or default.
+        """
+        try:
+            return self[tess_id]
+        except KeyError:
+            return default
+
+    def index(self, tess_id):
+        """
+        Find the row of a tiling by binary search on the sorted names.
+
+        Parameters
+        ----------
+        tess_id : str
+            Name of the tiling.
+
+        Returns
+        -------
+        int or None
+            Row of the tiling, None if it is not in the database.
+        """
+        tess_id = str(getattr(tess_id, "value", tess_id))
+        i = int(np.searchsorted(self.names, tess_id))
+        if i < len(self) and self.names[i] == tess_id:
+            return i
+        return None
+
+    def keys(self):
+        """
+        Names of every tiling, in sorted order.
+
+        Returns
+        -------
+        List[str]
+            Tiling names.
+        """
+        return self.names.tolist()
+
+    def random_id(self):
+        """
+        Pick the name of a random tiling.
+
+        Returns
+        -------
+        str
+            Tiling name.
+        """
+        return str(self.names[random.randrange(len(self))])
+
+    def tiling_type(self):
+        """
+        Enumeration of the tiling names, built on first use.
+
+        This is the counterpart of ``RegularTesselationType`` generated from
+        the content of the database, so it never gets out of sync with it.
+
+        Returns
+        -------
+        Enum
+            String enumeration with one member per tiling.
+        """
+        if self._tiling_type is None:
+            names = self.keys()
+            self._tiling_type = Enum(
+                "RegularTesselationType", list(zip(names, names)), type=str
+            )
+        return self._tiling_type
@@ -2,7 +2,13 @@ from mortier.enums.file_type import FileType as FileType
 from mortier.enums.hatch_type import HatchType as HatchType
 from mortier.enums.ornements_type import OrnementsType as OrnementsType
 from mortier.enums.param_type import ParamType as ParamType
-from mortier.enums.regular_tesselation_type import \
-    RegularTesselationType as RegularTesselationType
 from mortier.enums.tesselation_type import TesselationType as TesselationType
 from mortier.enums.tile_type import TileType as TileType
+from mortier.utils.lazy_import import lazy_attributes
+
+# The enumeration of the regular tilings has one member per database entry
+# and takes a while to build
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    {"RegularTesselationType": "mortier.enums.regular_tesselation_type"},
+)
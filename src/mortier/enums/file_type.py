@@ -5,4 +5,5 @@ class FileType(str, Enum):
     SVG = "svg"
     PNG = "png"
     JPG = "jpg"
+    GIF = "gif"
     tikz = "tex"
@@ -1,3 +1,5 @@
 from mortier.face.face import Face as Face
+from mortier.face.face_batch import FaceBatch as FaceBatch
 from mortier.face.p2_tile import P2Penrose as P2Penrose
 from mortier.face.p3_tile import P3Penrose as P3Penrose
+from mortier.face.half_edge_mesh import HalfEdgeMesh as HalfEdgeMesh
@@ -38,7 +38,7 @@ class Face:
         """
         self.vertices = vertices
         if type(self.vertices[0]) is LatticeCoords:
-            self._vertices = np.array([v.w for v in self.vertices], dtype=complex)
+            self._vertices = np.array([v.w for v in self.vertices])
 
         self.mid_points = mid_points
         self.param_mode = param_mode
@@ -133,7 +133,7 @@ class Face:
         """
         new_face = copy.copy(self)
         if type(self.vertices[0]).__name__ == "LatticeCoords":
-            translation = mult_i * dir_vec_1.w + mult_j * dir_vec_2.w  # both complex
+            translation = mult_i * dir_vec_1.w + mult_j * dir_vec_2.w
             new_face._vertices += translation
         else:
             new_face.vertices = [v.translate(dir_vec_1) for v in self.vertices]
@@ -179,17 +179,6 @@ class Face:
         new_face.vertices = vertices
         return new_face
 
-    def add_neigbors(self, face):
-        """
-        Add direct neighbors of the face in the tesselation
-
-        Parameters
-        ----------
-        face: Face
-            Current face
-        """
-        self.neighbors = [f for f in face if f.vertices != self.vertices]
-
     def ray_transform(self, angle, bounds=[0, 0, 1, 1], frame_num=0):
         """
         Apply the Polygon In Contact technique to the face.
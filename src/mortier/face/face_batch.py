@@ -0,0 +1,389 @@
+import numpy as np
+
+from mortier.coords import EuclideanCoords
+from mortier.face.face import Face
+from mortier.utils.math_utils import angle_field
+
+
+class FaceBatch:
+    """
+    Group of faces sharing the same number of vertices, stored as arrays.
+
+    A batch keeps every face of the group in a single contiguous
+    ``(N, V, 2)`` coordinate array instead of one ``Face`` object per
+    polygon, so that translated copies of a prototype can be generated,
+    transformed and drawn without materialising Python objects.
+    """
+
+    def __init__(
+        self,
+        vertices,
+        mid_points=None,
+        mid_angles=None,
+        param_mode=False,
+        assym_mode=False,
+        separated_site_mode=False,
+    ):
+        """
+        Initialize a batch of faces.
+
+        Parameters
+        ----------
+        vertices : array-like of float
+            Array of shape (N, V, 2) holding the vertices of every face.
+        mid_points : array-like of float, optional
+            Array of shape (N, M, 2) holding the ray launch sites of every face.
+        mid_angles : array-like of float, optional
+            Array of shape (N, M) holding the ray angle used at each launch site.
+        param_mode : ParamType
+            Type of angle parametrisation to be used
+        assym_mode : bool
+            If true, induce an assymetry in the ray angles
+        separated_site_mode : bool
+            If True, separate the launch sites of the rays
+        """
+        self.vertices = np.asarray(vertices, dtype=float)
+        n_faces = len(self.vertices)
+
+        if mid_points is None:
+            mid_points = np.empty((n_faces, 0, 2))
+            mid_angles = np.empty((n_faces, 0))
+        self.mid_points = np.asarray(mid_points, dtype=float)
+        self.mid_angles = np.asarray(mid_angles, dtype=float)
+
+        self.param_mode = param_mode
+        self.assym_mode = assym_mode
+        self.separated_site_mode = separated_site_mode
+        self.convex = False
+
+    def __len__(self):
+        """
+        Number of faces in the batch.
+
+        Returns
+        -------
+        int
+            Number of faces.
+        """
+        return len(self.vertices)
+
+    @property
+    def n_vertices(self):
+        """
+        Number of vertices shared by every face of the batch.
+
+        Returns
+        -------
+        int
+            Number of vertices per face.
+        """
+        return self.vertices.shape[1]
+
+    @staticmethod
+    def from_faces(faces):
+        """
+        Group a list of faces into batches of equal vertex count.
+
+        Batches are returned in the order in which their vertex count first
+        appears, and faces keep their relative order inside each batch.
+
+        Parameters
+        ----------
+        faces : List[Face]
+            Faces with Euclidean (or Lattice) vertices.
+
+        Returns
+        -------
+        batches : List[FaceBatch]
+            One batch per vertex count.
+        """
+        groups = {}
+        for face in faces:
+            groups.setdefault(len(face.vertices), []).append(face)
+
+        batches = []
+        for group in groups.values():
+            ref = group[0]
+            vertices = [[(v.x, v.y) for v in f.vertices] for f in group]
+            mid_points = [[(p.x, p.y) for p, _ in f.mid_points] for f in group]
+            mid_angles = [[a for _, a in f.mid_points] for f in group]
+
+            batch = FaceBatch(
+                vertices,
+                np.reshape(mid_points, (len(group), -1, 2)),
+                np.reshape(mid_angles, (len(group), -1)),
+                param_mode=ref.param_mode,
+                assym_mode=ref.assym_mode,
+                separated_site_mode=ref.separated_site_mode,
+            )
+            batch.convex = ref.convex
+            batches.append(batch)
+        return batches
+
+    def face(self, i):
+        """
+        Materialise a single face of the batch.
+
+        Parameters
+        ----------
+        i : int
+            Index of the face in the batch.
+
+        Returns
+        -------
+        face : Face
+            Face whose vertices are Euclidean coordinates.
+        """
+        vertices = [EuclideanCoords(p) for p in self.vertices[i]]
+        mid_points = [
+            (EuclideanCoords(p), a)
+            for p, a in zip(self.mid_points[i], self.mid_angles[i])
+        ]
+        face = Face(
+            vertices,
+            mid_points=mid_points,
+            param_mode=self.param_mode,
+            assym_mode=self.assym_mode,
+            separated_site_mode=self.separated_site_mode,
+        )
+        # Batches are already oriented, keep the stored vertex order
+        face.vertices = vertices
+        face.convex = self.convex
+        return face
+
+    def faces(self):
+        """
+        Materialise every face of the batch.
+
+        Returns
+        -------
+        faces : List[Face]
+            One face per row of the batch.
+        """
+        return [self.face(i) for i in range(len(self))]
+
+    def select(self, mask):
+        """
+        Extract a subset of the faces of the batch.
+
+        Parameters
+        ----------
+        mask : array-like of bool or int
+            Boolean mask or indices of the faces to keep.
+
+        Returns
+        -------
+        batch: FaceBatch
+            Batch holding the selected faces.
+        """
+        batch = FaceBatch(
+            self.vertices[mask],
+            self.mid_points[mask],
+            self.mid_angles[mask],
+            param_mode=self.param_mode,
+            assym_mode=self.assym_mode,
+            separated_site_mode=self.separated_site_mode,
+        )
+        batch.convex = self.convex
+        return batch
+
+    def visible(self, bounds, margin=0):
+        """
+        Find the faces whose bounding box meets a rectangle.
+
+        Parameters
+        ----------
+        bounds : list[float]
+            Rectangle as (x, y, width, height), usually ``writer.size``.
+        margin : float, optional
+            Distance by which the rectangle is grown on every side.
+
+        Returns
+        -------
+        np.ndarray
+            Boolean array of shape (N,), True for the faces that may touch
+            the rectangle.
+        """
+        x_min = bounds[0] - margin
+        y_min = bounds[1] - margin
+        x_max = bounds[0] + bounds[2] + margin
+        y_max = bounds[1] + bounds[3] + margin
+
+        lo = self.vertices.min(axis=1, initial=np.inf)
+        hi = self.vertices.max(axis=1, initial=-np.inf)
+        return (
+            (hi[:, 0] >= x_min)
+            & (lo[:, 0] <= x_max)
+            & (hi[:, 1] >= y_min)
+            & (lo[:, 1] <= y_max)
+        )
+
+    def cull(self, bounds, margin=0):
+        """
+        Drop the faces that cannot touch a rectangle.
+
+        Parameters
+        ----------
+        bounds : list[float]
+            Rectangle as (x, y, width, height), usually ``writer.size``.
+        margin : float, optional
+            Distance by which the rectangle is grown on every side.
+
+        Returns
+        -------
+        batch: FaceBatch
+            Batch holding the faces whose bounding box meets the rectangle.
+        """
+        return self.select(self.visible(bounds, margin))
+
+    def extent(self):
+        """
+        Largest side of the bounding boxes of the faces.
+
+        Returns
+        -------
+        float
+            Size of the largest face along x or y, 0 for an empty batch.
+        """
+        if not len(self):
+            return 0.0
+        return float(np.max(self.vertices.max(axis=1) - self.vertices.min(axis=1)))
+
+    def closed_vertices(self):
+        """
+        Vertices of every face with the first vertex repeated at the end.
+
+        Returns
+        -------
+        np.ndarray
+            Array of shape (N, V + 1, 2).
+        """
+        return np.concatenate([self.vertices, self.vertices[:, :1]], axis=1)
+
+    def ray_transform(self, angle, bounds=[0, 0, 1, 1], frame_num=0):
+        """
+        Apply the Polygon In Contact technique to every face of the batch.
+
+        This is the vectorized counterpart of ``Face.ray_transform``: the
+        headings, ray intersections, separated sites and asymmetric angle
+        clamp are computed for all the faces and all their sides at once,
+        and yield the same vertices and mid points as the per-face version.
+
+        Parameters
+        ----------
+        angle: float
+            Angle from the normal of the side, toward which the rays are shot.
+        bounds: list[float]
+            Bounds of the images. Should be the same as writer.size
+        frame_num: int
+            Num of the generated images, useful to create animation
+        Returns
+        -------
+        batch: FaceBatch
+            Computed faces.
+        """
+        n_faces = len(self)
+
+        if self.param_mode:
+            angle = angle_field(self.vertices[:, 0], self.param_mode, bounds, frame_num)
+        angle = np.broadcast_to(np.clip(angle, 0, np.pi / 2), (n_faces,))
+        # Safety in case of Penrose Tile
+        # Since some are not convex, we get instability so we clip the angle
+        if self.convex:
+            angle = np.clip(angle, 0, 0.5)
+        angle = angle[:, None]
+
+        p0 = self.vertices
+        p1 = np.roll(p0, -1, axis=1)
+        p2 = np.roll(p0, -2, axis=1)
+
+        heading_0 = np.arctan2(p1[..., 1] - p0[..., 1], p1[..., 0] - p0[..., 0])
+        heading_1 = np.roll(heading_0, -1, axis=1)
+
+        if self.separated_site_mode:
+            site = self.separated_site_mode
+            p_mid_0 = p1 + (p0 - p1) * 1 / site
+            p_mid_1 = p2 + (p1 - p2) * (site - 1) / site
+        else:
+            p_mid_0 = (p0 + p1) * 0.5
+            p_mid_1 = (p1 + p2) * 0.5
+
+        angle_0 = heading_0 + angle
+        angle_1 = heading_1 - angle
+
+        if self.assym_mode:
+            critical = self.critical_angle(p0, p1, p2)
+            angle_safe = np.where(critical < self.assym_mode, critical, self.assym_mode)
+            angle_1 = heading_1 - angle_safe
+
+        end_pt_0 = p_mid_0 + np.stack([np.cos(angle_0), np.sin(angle_0)], axis=-1)
+        end_pt_1 = p_mid_1 + np.stack([np.cos(angle_1), np.sin(angle_1)], axis=-1)
+
+        s0 = p_mid_0 - end_pt_0
+        s1 = p_mid_1 - end_pt_1
+        s0x, s0y = s0[..., 0], s0[..., 1]
+        s1x, s1y = s1[..., 0], s1[..., 1]
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            t = (
+                s1x * (p_mid_0[..., 1] - p_mid_1[..., 1])
+                - s1y * (p_mid_0[..., 0] - p_mid_1[..., 0])
+            ) / (-s1x * s0y + s0x * s1y)
+
+        c = np.stack(
+            [p_mid_0[..., 0] + (t * s0x), p_mid_0[..., 1] + (t * s0y)], axis=-1
+        )
+
+        angles = np.broadcast_to(angle, heading_0.shape)
+        if self.separated_site_mode:
+            vertices = np.stack([p_mid_0, c, p_mid_1], axis=2)
+            mid_points = np.stack([p_mid_0, p_mid_1], axis=2)
+            if self.assym_mode:
+                mid_1_angles = np.full_like(angles, self.assym_mode)
+            else:
+                mid_1_angles = angles
+            mid_angles = np.stack([angles, mid_1_angles], axis=2)
+        else:
+            vertices = np.stack([p_mid_0, c], axis=2)
+            mid_points = p_mid_0[:, :, None]
+            mid_angles = angles[:, :, None]
+
+        vertices = vertices.reshape(n_faces, -1, 2)
+        vertices = np.concatenate([vertices, vertices[:, :1]], axis=1)
+
+        batch = FaceBatch(
+            vertices,
+            mid_points.reshape(n_faces, -1, 2),
+            mid_angles.reshape(n_faces, -1),
+            param_mode=self.param_mode,
+            assym_mode=self.assym_mode,
+            separated_site_mode=self.separated_site_mode,
+        )
+        batch.convex = self.convex
+        return batch
+
+    @staticmethod
+    def critical_angle(p0, p1, p2):
+        """
+        Vectorized version of ``Face.critical_angle``.
+
+        Parameters
+        ----------
+        p0, p1, p2 : np.ndarray
+            Arrays of shape (..., 2) holding consecutive vertices.
+
+        Returns
+        -------
+        np.ndarray
+            Largest safe asymmetric angle at each vertex ``p1``.
+        """
+        v1 = p0 - p1
+        v2 = p2 - p1
+
+        # np.vecdot goes through the same dot kernel as np.linalg.norm/np.dot
+        # on a single vector, which keeps the result identical to Face
+        v1 = v1 / np.sqrt(np.vecdot(v1, v1))[..., None]
+        v2 = v2 / np.sqrt(np.vecdot(v2, v2))[..., None]
+
+        dot = np.clip(np.vecdot(v1, v2), -1.0, 1.0)
+        return (np.pi - np.arccos(dot)) * 0.5 - 1e-4
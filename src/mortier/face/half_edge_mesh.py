@@ -0,0 +1,387 @@
+import numpy as np
+
+from mortier.utils.crossings import quantize
+from mortier.utils.geometry import flatten_polygons
+
+
+def _unique_rows(rows):
+    """
+    Unique rows of an integer array, as ``np.unique(rows, axis=0)``.
+
+    The rows are sorted with ``np.lexsort``, much faster than the sort of
+    ``np.unique`` on rows.
+
+    Returns
+    -------
+    unique : np.ndarray
+        Unique rows, in increasing order.
+    first : np.ndarray
+        Index of the first occurrence of every unique row.
+    inverse : np.ndarray
+        Index of the unique row of every row.
+    """
+    order = np.lexsort(rows.T[::-1])
+    ordered = rows[order]
+    new = np.ones(len(rows), dtype=bool)
+    new[1:] = np.any(ordered[1:] != ordered[:-1], axis=1)
+    inverse = np.empty(len(rows), dtype=int)
+    inverse[order] = np.cumsum(new) - 1
+    return ordered[new], order[new], inverse
+
+
+def _unique_keys(keys):
+    """
+    Unique values of an integer array, as ``np.unique(keys)``.
+
+    Sorting and dropping the repeated values is much faster than
+    ``np.unique`` on large arrays.
+    """
+    keys = np.sort(keys)
+    new = np.ones(len(keys), dtype=bool)
+    new[1:] = keys[1:] != keys[:-1]
+    return keys[new]
+
+
+def weld(points, decimals=2):
+    """
+    Give the same ID to the points equal once rounded.
+
+    Parameters
+    ----------
+    points : np.ndarray
+        Array of shape (P, 2) holding the points.
+    decimals : int, optional
+        Number of decimals kept, see ``quantize``.
+
+    Returns
+    -------
+    ids : np.ndarray
+        ID of every point, -1 for the non-finite points.
+    welded : np.ndarray
+        Array of shape (W, 2) holding the rounded point of every ID, which
+        does not depend on the other points welded.
+    """
+    keys, finite = quantize(points, decimals)
+    ids = np.full(len(keys), -1)
+    if not finite.any():
+        return ids, np.empty((0, 2))
+    unique, _, inverse = _unique_rows(keys[finite])
+    ids[finite] = inverse
+    return ids, unique / 10.0**decimals
+
+
+def unique_segments(segments, decimals=2):
+    """
+    Drop the segments drawn more than once, in either direction.
+
+    Parameters
+    ----------
+    segments : np.ndarray
+        Array of shape (S, 2, 2) holding the end points of every segment.
+    decimals : int, optional
+        Number of decimals kept when comparing the end points.
+
+    Returns
+    -------
+    np.ndarray
+        Array of shape (E, 2, 2) holding the first of every set of equal
+        segments, in their original order.
+    """
+    ids, _ = weld(segments.reshape(-1, 2), decimals)
+    ends = np.sort(ids.reshape(-1, 2), axis=1)
+    valid = (ends[:, 0] >= 0) & (ends[:, 0] != ends[:, 1])
+    _, first, _ = _unique_rows(ends[valid])
+    return segments[np.flatnonzero(valid)[np.sort(first)]]
+
+
+class HalfEdgeMesh:
+    """
+    Polygons welded into a half-edge mesh.
+
+    The vertices closer than the rounding of ``quantize`` get the same ID,
+    and every side of a face becomes a half-edge, going from its ``origin``
+    to the origin of the ``next`` half-edge of the face. Two faces sharing
+    a side hold two ``twin`` half-edges, going in opposite directions.
+
+    The half-edges are stored face after face, the half-edges of face ``f``
+    being ``face_start[f]`` to ``face_start[f + 1]``, in the order of its
+    vertices. The sides shrunk to a point by the welding, such as the
+    closing side of a polygon whose first vertex is repeated at the end,
+    are dropped, and so are the faces with non-finite vertices.
+
+    ``face_start`` and ``origin`` thus hold the vertex IDs of every face in
+    compressed sparse rows, and ``face_neighbors`` gives the neighbouring
+    faces in the same layout.
+    """
+
+    def __init__(self, points, origin, face_start):
+        """
+        Initialize a mesh from its face loops.
+
+        Parameters
+        ----------
+        points : np.ndarray
+            Array of shape (P, 2) holding the welded vertices.
+        origin : np.ndarray
+            Vertex ID of the origin of every half-edge, face after face.
+        face_start : np.ndarray
+            Index of the first half-edge of every face, followed by the
+            number of half-edges.
+        """
+        self.points = points
+        self.origin = origin
+        self.face_start = face_start
+
+        sizes = np.diff(face_start)
+        self.face = np.repeat(np.arange(len(sizes)), sizes)
+        rank = np.arange(len(origin)) - face_start[self.face]
+        self.next = face_start[self.face] + (rank + 1) % sizes[self.face]
+
+        # Twins found by sorting the half-edges by their (origin, destination)
+        # key, and looking the reversed key up
+        n_points = len(points)
+        key = self.origin * n_points + self.destination
+        self.twin = np.full(len(key), -1)
+        if len(key):
+            order = np.argsort(key, kind="stable")
+            reverse = self.destination * n_points + self.origin
+            found = np.minimum(np.searchsorted(key[order], reverse), len(key) - 1)
+            found = order[found]
+            self.twin = np.where(key[found] == reverse, found, -1)
+
+    @staticmethod
+    def from_polygons(polygons, decimals=2):
+        """
+        Weld polygons into a mesh.
+
+        Parameters
+        ----------
+        polygons : np.ndarray or list of array-like
+            Array of shape (N, V, 2), or list of (V_i, 2) arrays, holding the
+            vertices of every polygon, in order.
+        decimals : int, optional
+            Number of decimals kept when welding the vertices.
+
+        Returns
+        -------
+        HalfEdgeMesh
+            Mesh with one face per polygon.
+        """
+        points, sizes = flatten_polygons(polygons)
+        return HalfEdgeMesh._weld_loops(points, sizes, decimals)
+
+    @staticmethod
+    def _weld_loops(points, sizes, decimals):
+        """
+        Weld concatenated polygons, see ``from_polygons``.
+        """
+        ids, welded = weld(points, decimals)
+
+        polygon = np.repeat(np.arange(len(sizes)), sizes)
+        starts = np.cumsum(sizes) - sizes
+        rank = np.arange(len(ids)) - starts[polygon]
+        following = ids[starts[polygon] + (rank + 1) % sizes[polygon]]
+
+        # Faces with a non-finite vertex are left empty
+        invalid = np.zeros(len(sizes), dtype=bool)
+        np.logical_or.at(invalid, polygon, ids < 0)
+        keep = ~invalid[polygon] & (ids != following)
+
+        counts = np.bincount(polygon[keep], minlength=len(sizes))
+        face_start = np.concatenate([[0], np.cumsum(counts)])
+        return HalfEdgeMesh(welded, ids[keep], face_start)
+
+    @staticmethod
+    def from_batches(batches, faces=(), decimals=2):
+        """
+        Weld the faces of a tesselation into a mesh.
+
+        Parameters
+        ----------
+        batches : list of FaceBatch
+            Batches of faces, welded first, batch after batch.
+        faces : list of Face, optional
+            Faces welded after the batches.
+        decimals : int, optional
+            Number of decimals kept when welding the vertices.
+
+        Returns
+        -------
+        HalfEdgeMesh
+            Mesh with one face per face of the batches, then per face.
+        """
+        points = [batch.vertices.reshape(-1, 2) for batch in batches]
+        points += [[(v.x, v.y) for v in face.vertices] for face in faces]
+        sizes = [np.full(len(batch), batch.n_vertices) for batch in batches]
+        sizes += [[len(face.vertices)] for face in faces]
+        if not points:
+            return HalfEdgeMesh.from_polygons([], decimals)
+        return HalfEdgeMesh._weld_loops(
+            np.concatenate(points).reshape(-1, 2),
+            np.concatenate(sizes).astype(int),
+            decimals,
+        )
+
+    @property
+    def n_faces(self):
+        """
+        Number of faces of the mesh.
+
+        Returns
+        -------
+        int
+            Number of faces, including the empty ones.
+        """
+        return len(self.face_start) - 1
+
+    @property
+    def destination(self):
+        """
+        Vertex ID of the end of every half-edge.
+
+        Returns
+        -------
+        np.ndarray
+            Origin of the next half-edge of every half-edge.
+        """
+        return self.origin[self.next]
+
+    def face_loop(self, f):
+        """
+        Vertex IDs of a face, in order.
+
+        Parameters
+        ----------
+        f : int
+            Index of the face.
+
+        Returns
+        -------
+        np.ndarray
+            Origin of every half-edge of the face.
+        """
+        return self.origin[self.face_start[f] : self.face_start[f + 1]]
+
+    def face_neighbors(self, by_edge=False):
+        """
+        Neighbouring faces of every face, in compressed sparse rows.
+
+        The faces sharing a vertex are found by sorting the (vertex, face)
+        incidences by vertex, and pairing the faces around every vertex.
+        The faces sharing a side are found from the twin half-edges.
+
+        Parameters
+        ----------
+        by_edge : bool, optional
+            Only count the faces sharing a side, instead of a vertex.
+
+        Returns
+        -------
+        start : np.ndarray
+            Index in ``neighbors`` of the first neighbour of every face,
+            followed by the number of neighbours.
+        neighbors : np.ndarray
+            Neighbours of every face, in increasing order, the neighbours of
+            face ``f`` being ``neighbors[start[f] : start[f + 1]]``.
+        """
+        n_faces = self.n_faces
+        if by_edge:
+            h = np.flatnonzero(self.twin >= 0)
+            a, b = self.face[h], self.face[self.twin[h]]
+        else:
+            incidence = _unique_keys(self.origin * n_faces + self.face)
+            vertex, face = np.divmod(incidence, max(n_faces, 1))
+            degree = np.bincount(vertex, minlength=len(self.points))
+            a, b = [face[:0]], [face[:0]]
+            # Faces k places apart around the same vertex, in both directions
+            for k in range(1, degree.max(initial=0)):
+                same = vertex[k:] == vertex[:-k]
+                a += [face[:-k][same], face[k:][same]]
+                b += [face[k:][same], face[:-k][same]]
+            a, b = np.concatenate(a), np.concatenate(b)
+
+        pairs = _unique_keys((a * n_faces + b)[a != b])
+        first, neighbors = np.divmod(pairs, max(n_faces, 1))
+        counts = np.bincount(first, minlength=n_faces)
+        return np.concatenate([[0], np.cumsum(counts)]), neighbors
+
+    def edges(self):
+        """
+        One half-edge of every edge of the mesh.
+
+        The half-edges going in the same direction between the same two
+        vertices, which only happen when faces overlap, also count as one
+        edge.
+
+        Returns
+        -------
+        np.ndarray
+            Index of the first half-edge of every edge, in increasing order.
+        """
+        ends = np.sort(np.stack([self.origin, self.destination], axis=1), axis=1)
+        _, first, _ = _unique_rows(ends)
+        return np.sort(first)
+
+    def edge_segments(self):
+        """
+        End points of every edge of the mesh.
+
+        Returns
+        -------
+        np.ndarray
+            Array of shape (E, 2, 2) holding the end points of every edge,
+            see ``edges``.
+        """
+        edges = self.edges()
+        return self.points[
+            np.stack([self.origin[edges], self.destination[edges]], axis=1)
+        ]
+
+    def edge_paths(self):
+        """
+        Every edge of the mesh once, chained into polylines.
+
+        At every vertex, the ends of the edges are sorted by angle and each
+        one is paired with the end across the vertex, so that the paths go
+        as straight as possible. The paths are then followed from the
+        unpaired ends, and the remaining edges form closed loops.
+
+        Returns
+        -------
+        List[np.ndarray]
+            Array of shape (K_i, 2) holding the points of every path, closed
+            loops ending on their first point.
+        """
+        edges = self.edges()
+        vertex = np.stack([self.origin[edges], self.destination[edges]], axis=1)
+        vertex = vertex.reshape(-1)
+        # End 2 * e is the origin of edge e, end 2 * e + 1 its destination
+        other = self.points[vertex.reshape(-1, 2)[:, ::-1].reshape(-1)]
+        delta = other - self.points[vertex]
+        angle = np.arctan2(delta[:, 1], delta[:, 0])
+
+        order = np.lexsort((angle, vertex))
+        degree = np.bincount(vertex, minlength=len(self.points))
+        starts = np.cumsum(degree) - degree
+        rank = np.arange(len(order)) - starts[vertex[order]]
+        half = degree[vertex[order]] // 2
+        paired = rank < half
+        link = np.full(len(vertex), -1)
+        link[order[paired]] = order[np.flatnonzero(paired) + half[paired]]
+        link[link[link >= 0]] = np.flatnonzero(link >= 0)
+
+        vertex = vertex.tolist()
+        link = link.tolist()
+        visited = [False] * len(edges)
+        paths = []
+        free_ends = [end for end, linked in enumerate(link) if linked < 0]
+        for end in free_ends + list(range(0, 2 * len(edges), 2)):
+            if visited[end >> 1]:
+                continue
+            path = [vertex[end]]
+            while end >= 0 and not visited[end >> 1]:
+                visited[end >> 1] = True
+                path.append(vertex[end ^ 1])
+                end = link[end ^ 1]
+            paths.append(self.points[path])
+        return paths
@@ -9,6 +9,17 @@ class P2Penrose(Face):
     Class that implement the P2 tile from Penrose
     """
 
+    # Subdivision rules used by ``inflate_arrays``. For each code, the new
+    # points are taken along the (beg, end) sides listed in the first tuple,
+    # and every sub-tile is given as (A, B, C, code), where the points are
+    # indices in [A, B, C, new points...].
+    RULES = {
+        0: (((1, 0), (0, 2)), ((0, 4, 3, 2), (1, 3, 4, 1), (1, 2, 4, 0))),
+        1: (((1, 0), (0, 2)), ((0, 4, 3, 3), (1, 3, 4, 0), (1, 2, 4, 1))),
+        2: (((0, 1),), ((0, 3, 2, 1), (1, 2, 3, 2))),
+        3: (((0, 1),), ((0, 3, 2, 0), (1, 2, 3, 3))),
+    }
+
     def __init__(self, A, B, C, code):
         # TODO: Use the normal face vertices.
         """
@@ -26,9 +37,20 @@ class P2Penrose(Face):
         self.A = A
         self.B = B
         self.C = C
-        self.edges = [Line(A, B), Line(B, C)]
         self.code = code
 
+    @property
+    def edges(self):
+        """
+        Drawn sides of the tile.
+
+        Returns
+        -------
+        edges: List[Line]
+            The sides AB and BC.
+        """
+        return [Line(self.A, self.B), Line(self.B, self.C)]
+
     @staticmethod
     def initialise(code=2, length=70, p=EuclideanCoords([0, 0])):
         """
@@ -115,3 +137,98 @@ class P2Penrose(Face):
             result.append(P2Penrose(self.A, p0, self.C, 0))
             result.append(P2Penrose(self.B, self.C, p0, 3))
             return result
+
+    @staticmethod
+    def to_arrays(tiles):
+        """
+        Convert a list of tiles to arrays.
+
+        Parameters
+        ----------
+        tiles: List[P2Penrose]
+            Tiles to convert.
+
+        Returns
+        -------
+        points: np.ndarray
+            Array of shape (N, 3, 2) holding the A, B and C points of the tiles.
+        codes: np.ndarray
+            Array of shape (N,) holding the code of the tiles.
+        """
+        points = np.array(
+            [[(t.A.x, t.A.y), (t.B.x, t.B.y), (t.C.x, t.C.y)] for t in tiles]
+        )
+        codes = np.array([t.code for t in tiles], dtype=int)
+        return points.reshape(-1, 3, 2), codes
+
+    @classmethod
+    def from_arrays(cls, points, codes):
+        """
+        Build tiles from arrays, see ``to_arrays``.
+
+        Parameters
+        ----------
+        points: np.ndarray
+            Array of shape (N, 3, 2) holding the A, B and C points of the tiles.
+        codes: np.ndarray
+            Array of shape (N,) holding the code of the tiles.
+
+        Returns
+        -------
+        tiles: List[P2Penrose]
+            One tile per row.
+        """
+        return [
+            cls(EuclideanCoords(a), EuclideanCoords(b), EuclideanCoords(c), int(code))
+            for (a, b, c), code in zip(points.tolist(), codes.tolist())
+        ]
+
+    @classmethod
+    def inflate_arrays(cls, points, codes):
+        """
+        Inflate every tile of an array at once.
+
+        This is the vectorized counterpart of ``inflate``: the tiles of each
+        code are subdivided together, and the sub-tiles are stored in the
+        same order, and with the same coordinates, as the ones ``inflate``
+        would give tile by tile.
+
+        Parameters
+        ----------
+        points: np.ndarray
+            Array of shape (N, 3, 2) holding the A, B and C points of the tiles.
+        codes: np.ndarray
+            Array of shape (N,) holding the code of the tiles.
+
+        Returns
+        -------
+        points: np.ndarray
+            Array of shape (M, 3, 2) holding the points of the sub-tiles.
+        codes: np.ndarray
+            Array of shape (M,) holding the code of the sub-tiles.
+        """
+        n_children = np.zeros(max(cls.RULES) + 1, dtype=int)
+        for code, (_, children) in cls.RULES.items():
+            n_children[code] = len(children)
+        n_children = n_children[codes]
+        offsets = np.cumsum(n_children) - n_children
+
+        new_points = np.empty((n_children.sum(), 3, 2))
+        new_codes = np.empty(n_children.sum(), dtype=int)
+        for code, (splits, children) in cls.RULES.items():
+            idx = np.flatnonzero(codes == code)
+            if not len(idx):
+                continue
+
+            tile = points[idx]
+            pts = [tile[:, 0], tile[:, 1], tile[:, 2]]
+            for beg, end in splits:
+                # Same as Line(beg, end).get_pq_point(2, 1 + sqrt(5))
+                p = pts[beg] + 2 * (pts[end] - pts[beg]) / (1 + np.sqrt(5))
+                pts.append(p)
+
+            for k, (a, b, c, child) in enumerate(children):
+                new_points[offsets[idx] + k] = np.stack([pts[a], pts[b], pts[c]], 1)
+                new_codes[offsets[idx] + k] = child
+
+        return new_points, new_codes
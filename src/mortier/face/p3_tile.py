@@ -9,6 +9,14 @@ class P3Penrose(P2Penrose):
     Class that implement the P3 tile from Penrose
     """
 
+    # Subdivision rules used by ``inflate_arrays``, see ``P2Penrose.RULES``
+    RULES = {
+        0: (((1, 0),), ((3, 2, 0, 0), (1, 3, 2, 3))),
+        1: (((1, 2),), ((2, 0, 3, 1), (0, 3, 1, 2))),
+        2: (((0, 1), (0, 2)), ((0, 3, 4, 3), (3, 4, 1, 0), (2, 4, 1, 2))),
+        3: (((2, 1), (2, 0)), ((1, 4, 0, 3), (1, 4, 3, 1), (4, 3, 2, 2))),
+    }
+
     def __init__(self, A, B, C, code):
         """
         Parameters
@@ -25,7 +33,6 @@ class P3Penrose(P2Penrose):
         self.A = A
         self.B = B
         self.C = C
-        self.edges = [Line(A, B), Line(B, C)]
         self.code = code
 
     @staticmethod
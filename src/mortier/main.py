@@ -1,20 +1,86 @@
-import json
-import random
+import functools
 
 import click
 import numpy as np
-from matplotlib import colormaps
 
-from mortier.enums import (FileType, HatchType, ParamType,
-                           RegularTesselationType, TesselationType, TileType)
-from mortier.tesselation import (HyperbolicTesselation, PenroseTesselation,
-                                 RegularTesselation)
-from mortier.writer import BitmapWriter, SVGWriter, TikzWriter
+import mortier.tesselation as tesselations
+import mortier.writer as writers
+from mortier.database import TilingDatabase
+from mortier.enums import (FileType, HatchType, ParamType, TesselationType,
+                           TileType)
 from mortier.writer.hatching import Hatching
 from mortier.writer.ornements import Ornements
 
-with open("data/database.json", "r") as file:
-    js = json.load(file)
+database = TilingDatabase()
+
+
+class LazyChoice(click.Choice):
+    """
+    Choice between values which are only listed when needed.
+
+    The choices are computed when an argument is validated or the help is
+    displayed, not when the command is defined.
+    """
+
+    def __init__(self, choices, case_sensitive=True):
+        """
+        Initialize the choice.
+
+        Parameters
+        ----------
+        choices : callable
+            Function returning the possible values.
+        case_sensitive : bool, optional
+            Whether the values are case sensitive.
+        """
+        super().__init__((), case_sensitive)
+        self.list_choices = choices
+
+    @property
+    def choices(self):
+        """
+        Possible values, computed on first access.
+
+        Returns
+        -------
+        tuple
+            Possible values.
+        """
+        if self.list_choices is not None:
+            self._choices = tuple(self.list_choices())
+            self.list_choices = None
+        return self._choices
+
+    @choices.setter
+    def choices(self, choices):
+        """
+        Set the possible values, replacing the function listing them.
+
+        Parameters
+        ----------
+        choices : iterable
+            Possible values.
+        """
+        self._choices = tuple(choices)
+        self.list_choices = None
+
+
+def colormaps():
+    """
+    Registry of the matplotlib colormaps.
+
+    matplotlib is slow to import, so it is only loaded when a colormap is
+    asked for.
+
+    Returns
+    -------
+    matplotlib.cm.ColormapRegistry
+        Colormaps by name.
+    """
+    # pylint: disable=import-outside-toplevel
+    from matplotlib import colormaps as registry
+
+    return registry
 
 
 @click.command()
@@ -26,8 +92,8 @@ with open("data/database.json", "r") as file:
 )
 @click.option(
     "--tess_id",
-    default=random.choice(list(js.keys())),
-    type=click.Choice(RegularTesselationType),
+    default=database.random_id,
+    type=LazyChoice(database.tiling_type),
     help="Tesselation ID in the database.",
 )
 @click.option(
@@ -56,6 +122,11 @@ with open("data/database.json", "r") as file:
 @click.option("--bands", is_flag=True, help="Bands mode")
 @click.option("--lace", is_flag=True, help="Lace mode")
 @click.option("--bezier", is_flag=True, help="Sides are drawn as bezier curves")
+@click.option(
+    "--edges_once",
+    is_flag=True,
+    help="Draw the sides shared by two faces once, the faces are only filled",
+)
 @click.option(
     "--bands_width", default=2, type=click.FloatRange(0, clamp=True), help="Bands width"
 )
@@ -73,6 +144,12 @@ with open("data/database.json", "r") as file:
     help="Hatch angle in degrees",
 )
 @click.option("--cross_hatch", is_flag=True, help="Cross hatching")
+@click.option(
+    "--hatch_dot_radius",
+    default=0.0,
+    type=click.FloatRange(min=0),
+    help="Radius of the hatching dots, in pixels (0 for single pixels)",
+)
 @click.option(
     "--pq",
     default=(3, 7),
@@ -115,15 +192,152 @@ with open("data/database.json", "r") as file:
 )
 @click.option(
     "--colormap",
-    type=click.Choice(list(colormaps)),
+    type=LazyChoice(colormaps),
     help="Color of the faces",
 )
-def tess_param(
+@click.option(
+    "--tile_size",
+    default=0,
+    type=click.IntRange(min=0),
+    help="Render bitmaps in square tiles of this size, in parallel (0 to disable)",
+)
+@click.option(
+    "--processes",
+    default=None,
+    type=click.IntRange(min=1),
+    help="Number of processes rendering the tiles, defaults to the CPU count",
+)
+@click.option(
+    "--frames",
+    default=0,
+    type=click.IntRange(min=0),
+    help="Number of frames of an animation (0 for a still image)",
+)
+@click.option(
+    "--frame_duration",
+    default=40,
+    type=click.IntRange(min=1),
+    help="Duration of the frames of an animation, in milliseconds",
+)
+def tess_param(**options):
+    kept, culled = render(**options)
+    click.echo(f"{kept} faces drawn, {culled} culled outside the canvas", err=True)
+
+
+def render(**options):
+    """
+    Render a tesselation to a file.
+
+    Parameters
+    ----------
+    **options
+        Options of the ``tess_param`` command, once parsed.
+
+    Returns
+    -------
+    kept, culled : int
+        Number of faces drawn and culled outside the canvas, summed over the
+        tiles of a tiled render, for the last frame of an animation.
+    """
+    file_type = options["file_type"]
+    output = options["output"]
+    output_size = options["output_size"]
+    size = (0, 0, output_size[0], output_size[1])
+
+    if options["frames"]:
+        return animate(size, **options)
+
+    if file_type in [FileType.JPG, FileType.PNG, FileType.GIF]:
+        filename = f"{output}.{file_type.value}"
+        if options["tile_size"]:
+            # Workers get the tiling name, the enumeration of the database
+            # does not pickle
+            options["tess_id"] = options["tess_id"].value
+            counts = writers.render_tiles(
+                functools.partial(draw, **options),
+                filename,
+                size,
+                tile_size=options["tile_size"],
+                processes=options["processes"],
+            )
+            kept, culled = zip(*counts)
+            return sum(kept), sum(culled)
+        writer = writers.BitmapWriter(filename, size=size)
+    elif file_type == FileType.SVG:
+        # The groups and the file are closed even if the drawing fails
+        with writers.SVGStreamWriter(f"{output}", size=size) as writer:
+            return draw(writer, **options)
+    else:
+        writer = writers.TikzWriter(f"{output}")
+    writer.size = size
+
+    return draw(writer, **options)
+
+
+def animate(size, **options):
+    """
+    Render an animation, as an animated GIF or PNG or as numbered JPG frames.
+
+    Parameters
+    ----------
+    size : tuple of int
+        Bounds of the frames, as (x, y, width, height).
+    **options
+        Options of the ``tess_param`` command, once parsed.
+
+    Returns
+    -------
+    kept, culled : int
+        Number of faces drawn and culled outside the canvas in the last
+        frame.
+
+    Raises
+    ------
+    click.BadParameter
+        If the file type is not a bitmap format.
+    """
+    file_type = options["file_type"]
+    if file_type == FileType.JPG:
+        filename = f"{options['output']}_{{:04d}}.jpg"
+    elif file_type in [FileType.PNG, FileType.GIF]:
+        filename = f"{options['output']}.{file_type.value}"
+    else:
+        raise click.BadParameter(
+            "animations need a png, gif or jpg file type", param_hint="--frames"
+        )
+
+    writer = writers.BitmapWriter(filename, size=size)
+    tesselation = setup(writer, **options)
+    with writers.FrameEncoder(filename, duration=options["frame_duration"]) as encoder:
+        tesselation.animate(options["frames"], encoder)
+    return tesselation.n_faces_kept, tesselation.n_faces_culled
+
+
+def draw(writer, **options):
+    """
+    Set a writer up from the command line options and draw the tesselation.
+
+    Parameters
+    ----------
+    writer : Writer
+        Writer drawing the tesselation, with its size already set.
+    **options
+        Options of the ``tess_param`` command, see ``setup``.
+
+    Returns
+    -------
+    kept, culled : int
+        Number of faces drawn and culled outside the canvas.
+    """
+    tesselation = setup(writer, **options)
+    tesselation.draw_tesselation()
+    return tesselation.n_faces_kept, tesselation.n_faces_culled
+
+
+def setup(
+    writer,
     tesselation_type,
     tess_id,
-    file_type,
-    output,
-    output_size,
     scale,
     angle,
     parametrised,
@@ -131,10 +345,12 @@ def tess_param(
     lace,
     bands_width,
     bezier,
+    edges_once,
     hatch_type,
     hatch_angle,
     hatch_spacing,
     cross_hatch,
+    hatch_dot_radius,
     tile,
     pq,
     depth,
@@ -146,18 +362,27 @@ def tess_param(
     color_bg,
     color_hatch,
     colormap,
+    **output_options,
 ):
-    tess = js[tess_id]
-    if file_type in [FileType.JPG, FileType.PNG]:
-        writer = BitmapWriter(
-            f"{output}.{file_type.value}", size=(0, 0, output_size[0], output_size[1])
-        )
-    elif file_type == FileType.SVG:
-        writer = SVGWriter(f"{output}", size=(0, 0, output_size[0], output_size[1]))
-    else:
-        writer = TikzWriter(f"{output}")
+    """
+    Set a writer and a tesselation up from the command line options.
+
+    Parameters
+    ----------
+    writer : Writer
+        Writer drawing the tesselation, with its size already set.
+    tesselation_type, tess_id, ..., colormap
+        Drawing options of ``tess_param``.
+    **output_options
+        Output options of ``tess_param``, ignored.
+
+    Returns
+    -------
+    Tesselation
+        Tesselation ready to be drawn on the writer.
+    """
+    tess = database[tess_id]
     writer.n_tiles = scale
-    writer.size = (0, 0, output_size[0], output_size[1])
     if lace:
         ornements = Ornements(type="lace")
         ornements.width = bands_width
@@ -167,10 +392,11 @@ def tess_param(
         ornements.width = bands_width
         writer.set_ornements(ornements)
     writer.bezier = bezier
+    writer.edges_once = edges_once
     writer.color_line = color
     writer.set_color_bg(color_bg)
     if colormap:
-        writer.set_colormap(colormaps[colormap])
+        writer.set_colormap(colormaps()[colormap])
     if hatch_type:
         hatch_type = Hatching(
             angle=hatch_angle,
@@ -178,22 +404,23 @@ def tess_param(
             crosshatch=cross_hatch,
             type=hatch_type,
             color=color_hatch,
+            radius=hatch_dot_radius,
         )
     writer.hatching = hatch_type
 
     if tesselation_type == TesselationType.REGULAR:
-        tesselation = RegularTesselation(writer, tess, tess_id)
+        tesselation = tesselations.RegularTesselation(writer, tess, tess_id)
     elif tesselation_type == TesselationType.HYPERBOLIC:
-        tesselation = HyperbolicTesselation(writer, pq[0], pq[1], depth)
+        tesselation = tesselations.HyperbolicTesselation(writer, pq[0], pq[1], depth)
         tesselation.half_plane = half_plane
         tesselation.refine_tiling(refine)
     else:
-        tesselation = PenroseTesselation(writer, tile=tile, level=depth)
+        tesselation = tesselations.PenroseTesselation(writer, tile=tile, level=depth)
     tesselation.set_angle(angle)
     tesselation.set_param_mode(parametrised)
     tesselation.set_assym_angle(assym_angle)
     tesselation.set_separated_site_mode(separated_sites)
-    tesselation.draw_tesselation()
+    return tesselation
 
 
 if __name__ == "__main__":
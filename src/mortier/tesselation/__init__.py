@@ -1,6 +1,12 @@
-from mortier.tesselation.hyperbolic import \
-    HyperbolicTesselation as HyperbolicTesselation
-from mortier.tesselation.penrose import \
-    PenroseTesselation as PenroseTesselation
-from mortier.tesselation.regular_tesselation import \
-    RegularTesselation as RegularTesselation
+from mortier.utils.lazy_import import lazy_attributes
+
+# Tesselations are only imported when used, since the hyperbolic one loads
+# hypertiling, and through it scipy and matplotlib
+_TESSELATIONS = {
+    "HyperbolicTesselation": "mortier.tesselation.hyperbolic",
+    "PenroseTesselation": "mortier.tesselation.penrose",
+    "RegularTesselation": "mortier.tesselation.regular_tesselation",
+}
+
+__all__ = list(_TESSELATIONS)
+__getattr__, __dir__ = lazy_attributes(__name__, _TESSELATIONS)
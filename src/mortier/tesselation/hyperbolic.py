@@ -1,17 +1,35 @@
+import numpy as np
 from hypertiling import HyperbolicTiling
-from hypertiling.graphics.plot import convert_polygons_to_patches
 
-from mortier.coords import EuclideanCoords
-from mortier.face.face import Face
+from mortier.face import FaceBatch
 from mortier.tesselation.tesselation import Tesselation
 
 
+def disk_to_half_plane(z):
+    """
+    Map points of the Poincaré disk to the half plane model.
+
+    Parameters
+    ----------
+    z : np.ndarray
+        Complex array of points of the unit disk.
+
+    Returns
+    -------
+    np.ndarray
+        Complex array of the same shape holding the mapped points, as in
+        ``Face.half_plane``.
+    """
+    z = (-1j * z - 1j) / (z - 1)
+    return 2 / np.pi * np.log((1 + z) / (1 - z))
+
+
 class HyperbolicTesselation(Tesselation):
     """
     Hyperbolic polygonal tessellation based on the {p, q} tiling.
 
     This class wraps a ``HyperbolicTiling`` object and converts its output
-    into ``Face`` objects suitable for rendering using a ``Tesselation``
+    into ``FaceBatch`` objects suitable for rendering using a ``Tesselation``
     writer backend.
     """
 
@@ -65,18 +83,6 @@ class HyperbolicTesselation(Tesselation):
         """
         self.scale = min(self.writer.size[3], self.writer.size[2]) / 2 * scale
 
-    def convert_to_half_plane(self):
-        """
-        Convert all faces to the half-plane model.
-
-        This replaces the current list of faces with their half-plane
-        equivalents.
-        """
-        faces = []
-        for face in self.faces:
-            faces.append(face.half_plane())
-        self.faces = faces
-
     def set_draw_unit_circle(self, draw):
         """
         Enable or disable drawing of the unit circle.
@@ -100,34 +106,47 @@ class HyperbolicTesselation(Tesselation):
         self.tess.refine_lattice(iterations)
         self.tesselate_face()
 
+    def polygon_arrays(self):
+        """
+        Vertices of the polygons of the hyperbolic tiling.
+
+        Returns
+        -------
+        List[np.ndarray]
+            Complex arrays of shape (N, V) holding the vertices of the
+            polygons in the Poincaré disk, one array per vertex count.
+        """
+        groups = {}
+        for polygon in self.tess:
+            # (center, vertex_1, vertex_2, ..., vertex_p)
+            groups.setdefault(len(polygon) - 1, []).append(polygon[1:])
+        return [np.stack(polygons) for polygons in groups.values()]
+
     def tesselate_face(self):
         """
         Generate faces from the hyperbolic tiling.
 
-        This method converts the internal ``HyperbolicTiling`` polygons
-        into ``Face`` objects, applies scaling and translation, and
-        optionally converts them to the half-plane model.
+        The vertices of the ``HyperbolicTiling`` polygons are extracted as
+        complex arrays, optionally mapped to the half-plane model, then
+        scaled and translated to the center of the canvas. The faces are
+        stored in ``self.batches`` as one ``FaceBatch`` per vertex count.
         """
         # Reference translation point (center of the canvas)
-        z_point = EuclideanCoords([self.writer.size[2] / 2, self.writer.size[3] / 2])
-
-        # Extract faces from a Matplotlib PolygonCollection
-        convert_polygons_to_patches(self.tess)
-
-        self.faces = []
-        for polygon in self.tess:
-            points = polygon[1:]
-            vertices = [EuclideanCoords([p.real, p.imag]) for p in points]
-            face = Face(vertices, param_mode=self.param_mode)
-            self.faces.append(face)
-
+        z_point = self.writer.size[2] / 2 + 1j * self.writer.size[3] / 2
         if self.half_plane:
-            self.convert_to_half_plane()
-            z_point = EuclideanCoords([self.writer.size[2] / 2, 0])
+            z_point = self.writer.size[2] / 2
 
-        faces = []
-        for face in self.faces:
-            face = face.scale(self.scale).translate(z_point)
-            faces.append(face)
-
-        self.faces = faces
+        self.faces = []
+        self.batches = []
+        for z in self.polygon_arrays():
+            # Same orientation as the one enforced by Face
+            z_next = np.roll(z, -1, axis=1)
+            area = np.sum((z_next.real - z.real) * (z_next.imag + z.imag), axis=1)
+            z[area > 0] = z[area > 0, ::-1]
+
+            if self.half_plane:
+                z = disk_to_half_plane(z)
+            z = z * self.scale + z_point
+
+            vertices = np.stack([z.real, z.imag], axis=-1)
+            self.batches.append(FaceBatch(vertices, param_mode=self.param_mode))
@@ -1,6 +1,9 @@
+import numpy as np
+
 from mortier.coords import EuclideanCoords
 from mortier.enums import TileType
-from mortier.face import Face, P2Penrose, P3Penrose
+from mortier.face import FaceBatch, P2Penrose, P3Penrose
+from mortier.face.half_edge_mesh import unique_segments
 from mortier.tesselation.tesselation import Tesselation
 
 
@@ -32,6 +35,8 @@ class PenroseTesselation(Tesselation):
         self.tile = tile
         self.tess_id = None
         self.faces = []
+        self.points = None
+        self.codes = None
 
         if tile == TileType.P2:
             self.pen = P2Penrose.initialise(
@@ -51,42 +56,145 @@ class PenroseTesselation(Tesselation):
         This method recursively inflates the Penrose triangles and
         identifies adjacent triangle pairs that can be merged into
         quadrilateral faces.
+
+        The inflation works on arrays, the inflated triangles are stored in
+        ``self.points`` and ``self.codes`` (see ``P2Penrose.to_arrays``),
+        while ``self.pen`` keeps the level 0 tiles.
         """
+        tile_class = type(self.pen[0])
+
         # Apply recursive inflation
+        points, codes = tile_class.to_arrays(self.pen)
         for _ in range(self.level):
-            triangles = []
-            for penrose_triangle in self.pen:
-                triangles.extend(penrose_triangle.inflate())
-            self.pen = triangles
-
-        if not self.angle:
-            for i, p in enumerate(self.pen):
-                for edge in p.edges:
-                    self.writer.line(edge.beg_pt, edge.end_pt)
-        else:
+            points, codes = tile_class.inflate_arrays(points, codes)
+        self.points = points
+        self.codes = codes
+
+        self.batches = []
+        if self.angle:
             # Merge compatible triangle pairs into faces
-            for i, p in enumerate(self.pen):
-                for p_ in self.pen[i + 1 :]:
-                    if (p.A.isclose(p_.A) and p.C.isclose(p_.C)) or (
-                        p.A.isclose(p_.C) and p.C.isclose(p_.A)
-                    ):
-                        vertices = [p.A, p.B, p.C, p_.B]
-
-                        # Orientation test (shoelace-like criterion)
-                        s = 0.0
-                        for j in range(4):
-                            s += (vertices[(j + 1) % 4].x - vertices[j].x) / (
-                                vertices[(j + 1) % 4].y + vertices[j].y
-                            )
-
-                        if s < 0:
-                            vertices = vertices[::-1]
-
-                        face = Face(
-                            vertices,
-                            param_mode=self.param_mode,
-                            assym_mode=self.assym_angle,
-                            separated_site_mode=self.separated_site_mode,
-                        )
-                        face.convex = True
-                        self.faces.append(face)
+            first, second = self.pair_triangles(points)
+            vertices = np.concatenate([points[first], points[second, 1:2]], axis=1)
+
+            # Orientation test (shoelace-like criterion)
+            x, y, x_next, y_next = self.sides(vertices)
+            terms = (x_next - x) / (y_next + y)
+            s = terms[:, 0] + terms[:, 1] + terms[:, 2] + terms[:, 3]
+            vertices[s < 0] = vertices[s < 0, ::-1]
+
+            # Same orientation as the one enforced by Face
+            x, y, x_next, y_next = self.sides(vertices)
+            terms = (x_next - x) * (y_next + y)
+            area = terms[:, 0] + terms[:, 1] + terms[:, 2] + terms[:, 3]
+            vertices[area > 0] = vertices[area > 0, ::-1]
+
+            batch = FaceBatch(
+                vertices,
+                param_mode=self.param_mode,
+                assym_mode=self.assym_angle,
+                separated_site_mode=self.separated_site_mode,
+            )
+            batch.convex = True
+            self.batches = [batch]
+
+    def draw_frame(self, frame_num=[0, 1]):
+        """
+        Draw the faces, or the sides of the triangles if there is no angle.
+
+        Parameters
+        ----------
+        frame_num : list of int, optional
+            Animation frame information as [current_frame, total_frames].
+
+        Returns
+        -------
+        None
+        """
+        if not self.angle and self.writer.welds_edges():
+            # AB and BC sides, the AC side is inside a face
+            sides = self.points[:, [0, 1, 1, 2]].reshape(-1, 2, 2)
+            self.writer.lines(unique_segments(sides))
+        elif not self.angle:
+            for a, b, c in self.points.tolist():
+                b = EuclideanCoords(b)
+                self.writer.line(EuclideanCoords(a), b)
+                self.writer.line(b, EuclideanCoords(c))
+        super().draw_frame(frame_num)
+
+    @staticmethod
+    def sides(vertices):
+        """
+        Split the sides of a batch of polygons into coordinates arrays.
+
+        Parameters
+        ----------
+        vertices : np.ndarray
+            Array of shape (N, V, 2) holding the polygons vertices.
+
+        Returns
+        -------
+        x, y, x_next, y_next : np.ndarray
+            Arrays of shape (N, V) holding the coordinates of the start and
+            end point of every side.
+        """
+        x = vertices[..., 0]
+        y = vertices[..., 1]
+        return x, y, np.roll(x, -1, axis=1), np.roll(y, -1, axis=1)
+
+    @staticmethod
+    def pair_triangles(points, tol=1e-4):
+        """
+        Find the pairs of triangles sharing their AC side.
+
+        The AC sides are hashed by snapping their end points on a grid of
+        step ``tol``. Points closer than ``tol`` that land on both sides of
+        a grid line are caught by a second pass on a grid shifted by half a
+        step.
+
+        Parameters
+        ----------
+        points : np.ndarray
+            Array of shape (N, 3, 2) holding the A, B and C points of the
+            triangles.
+        tol : float, optional
+            Distance under which two points are considered equal.
+
+        Returns
+        -------
+        first : np.ndarray
+            Index of the first triangle of each pair, in increasing order.
+        second : np.ndarray
+            Index of the second triangle of each pair, always greater than
+            the first one.
+        """
+        first = []
+        second = []
+        unpaired = np.arange(len(points))
+        for shift in [0, 0.5]:
+            ends = np.round(points[unpaired][:, [0, 2]] / tol + shift)
+            ends = ends.astype(np.int64)
+
+            # Sort the two end points so that AC and CA give the same key
+            swap = (ends[:, 0, 0] > ends[:, 1, 0]) | (
+                (ends[:, 0, 0] == ends[:, 1, 0]) & (ends[:, 0, 1] > ends[:, 1, 1])
+            )
+            ends[swap] = ends[swap, ::-1]
+            keys = ends.reshape(-1, 4)
+
+            order = np.lexsort(keys.T[::-1])
+            same = np.all(keys[order[1:]] == keys[order[:-1]], axis=1)
+
+            # Only keep runs of exactly two equal keys
+            run = np.concatenate([[False], same, [False]])
+            pair = same & ~run[:-2] & ~run[2:]
+
+            i = unpaired[order[:-1][pair]]
+            j = unpaired[order[1:][pair]]
+            first.append(np.minimum(i, j))
+            second.append(np.maximum(i, j))
+            unpaired = np.setdiff1d(unpaired, np.concatenate([i, j]))
+
+        first = np.concatenate(first)
+        second = np.concatenate(second)
+        order = np.argsort(first)
+        return first[order], second[order]
@@ -1,12 +1,11 @@
-import copy
 import math
 
 import numpy as np
 
-from mortier.coords import LatticeCoords
-from mortier.face.face import Face
+from mortier.coords import LatticeArray, LatticeCoords
+from mortier.coords.lattice_coords import lattice_to_plane, reduce_lattice_basis
+from mortier.face import Face, FaceBatch, HalfEdgeMesh
 from mortier.tesselation.tesselation import Tesselation
-from mortier.utils.math_utils import plane_to_tile_coords
 
 
 class RegularTesselation(Tesselation):
@@ -68,29 +67,38 @@ class RegularTesselation(Tesselation):
         self.separated_site_mode = False
         self.lacing_mode = False
 
-    def fill_neighbor(self, faces):
+    def fill_neighbor(self, by_edge=False):
         """
-        Populate neighbor relationships between faces.
+        Compute the neighbor relationships between the faces of the batches.
 
-        Two faces are considered neighbors if they share a vertex.
+        Two faces are considered neighbors if they share a vertex, or a side
+        with ``by_edge``. The faces of ``self.batches`` are welded into a
+        ``HalfEdgeMesh``, on the rounded coordinates of their vertices, and
+        numbered batch after batch. The mesh holds the vertex IDs of every
+        face in compressed sparse rows (``face_start`` and ``origin``), and
+        the neighbors are read in the same layout from
+        ``HalfEdgeMesh.face_neighbors``.
+
+        The mesh and the neighbors are stored in ``self.mesh``,
+        ``self.neighbor_start`` and ``self.neighbors``.
 
         Parameters
         ----------
-        faces : list of Face
-            Faces for which neighbor relationships are computed.
-        """
-        vertex_map = {}
+        by_edge : bool, optional
+            Only count the faces sharing a side, instead of a vertex.
 
-        for face in faces:
-            for vertex in face.vertices:
-                if vertex in vertex_map:
-                    vertex_map[vertex].append(face)
-                else:
-                    vertex_map[vertex] = [face]
-
-        for vertex in vertex_map:
-            for face in vertex_map[vertex]:
-                face.add_neigbors(vertex_map[vertex])
+        Returns
+        -------
+        start : np.ndarray
+            Index in ``neighbors`` of the first neighbor of every face,
+            followed by the number of neighbors.
+        neighbors : np.ndarray
+            Index of the neighbors of every face, the neighbors of face ``f``
+            being ``neighbors[start[f] : start[f + 1]]``.
+        """
+        self.mesh = HalfEdgeMesh.from_batches(self.batches)
+        self.neighbor_start, self.neighbors = self.mesh.face_neighbors(by_edge)
+        return self.neighbor_start, self.neighbors
 
     def draw_seed(self):
         """
@@ -126,7 +134,7 @@ class RegularTesselation(Tesselation):
         """
         Draw a star-shaped neighborhood around the seed.
         """
-        neighbor_arr = {}
+        neighbor_arr = set()
         self.draw_cell()
 
         for x in [-1, 0, 1]:
@@ -137,7 +145,7 @@ class RegularTesselation(Tesselation):
                 for s in self.seed:
                     s = LatticeCoords(s)
                     p = s.translate(self.T1.scale(x).translate(self.T2.scale(y)))
-                    neighbor_arr[str(p.w)] = 1
+                    neighbor_arr.add(p)
                     self.writer.point(p)
                     self.writer.point(s)
 
@@ -147,7 +155,7 @@ class RegularTesselation(Tesselation):
             for k in range(6):
                 p = self.wpow[k]
                 sk = s.translate(p)
-                if str(sk.w) in neighbor_arr:
+                if sk in neighbor_arr:
                     self.writer.line(s, sk)
                     self.writer.point(sk)
 
@@ -157,7 +165,7 @@ class RegularTesselation(Tesselation):
         """
         Draw edges connecting neighboring seed points.
         """
-        neighbor_arr = {}
+        neighbor_arr = set()
 
         self.writer.face(self.cell, dotted=True)
 
@@ -166,7 +174,7 @@ class RegularTesselation(Tesselation):
                 for s in self.seed:
                     s = LatticeCoords(s)
                     p = s.translate(self.T1.scale(x).translate(self.T2.scale(y)))
-                    neighbor_arr[str(p.w)] = 1
+                    neighbor_arr.add(p)
 
         for s in self.seed:
             s = LatticeCoords(s)
@@ -174,125 +182,250 @@ class RegularTesselation(Tesselation):
             for k in range(6):
                 p = self.wpow[k]
                 sk = s.translate(p)
-                if str(sk.w) in neighbor_arr:
+                if sk in neighbor_arr:
                     self.writer.line(s, sk)
 
         self.writer.write()
 
-    def tesselate_face(self):
-        """
-        Generate all faces covering the visible region.
+    def prototype_faces(self):
         """
-        i_min, i_max, j_min, j_max = self.find_corners()
-        neighbor_arr = {}
+        Generate the prototype faces of the tessellation from its seeds.
 
-        for x in [-1, 0, 1]:
-            for y in [-1, 0, 1]:
-                for s in self.seed:
-                    s = LatticeCoords(s)
-                    p = s.translate(self.T1.scale(x).translate(self.T2.scale(y)))
-                    neighbor_arr[str(p.w)] = 1
+        Every face of the tessellation is a translated copy of exactly one
+        prototype. The prototypes only depend on the tessellation itself, so
+        they are precomputed for the whole database (see
+        ``mortier.database.compile_database``).
+
+        Returns
+        -------
+        List[np.ndarray]
+            Lattice vertices of every prototype, as (Vf, 4) int64 arrays in
+            drawing order.
+        """
+        # Packed keys of the seeds in the cell and its eight neighbours
+        shifts = [
+            self.T1.scale(x).translate(self.T2.scale(y)).w
+            for x in [-1, 0, 1]
+            for y in [-1, 0, 1]
+        ]
+        seeds = LatticeArray([LatticeCoords(s).w for s in self.seed])
+        neighbor_keys = seeds.translate(np.array(shifts)[:, None]).keys()
+        neighbor_keys = set(neighbor_keys.ravel().tolist())
+        directions = LatticeArray([p.w for p in self.wpow[:6]])
 
         faces = []
+        seen = set()
         for s in self.seed:
             s = LatticeCoords(s)
-            neighbors = []
-
-            for k in range(6):
-                p = self.wpow[k]
-                sk = s.translate(p)
-                if str(sk.w) in neighbor_arr:
-                    neighbors.append(k)
+            keys = directions.translate(s).keys().tolist()
+            neighbors = [k for k in range(6) if keys[k] in neighbor_keys]
 
             for i in range(len(neighbors) - 1):
                 h = 6 - (neighbors[i + 1] - neighbors[i])
                 m = 12 / h
-                faces.append(
-                    Face.generate(
-                        s,
-                        neighbors[i],
-                        m,
-                        param_mode=self.param_mode,
-                        assym_mode=self.assym_angle,
-                        separated_site_mode=self.separated_site_mode,
-                    )
+                face = Face.generate(
+                    s,
+                    neighbors[i],
+                    m,
+                    param_mode=self.param_mode,
+                    assym_mode=self.assym_angle,
+                    separated_site_mode=self.separated_site_mode,
+                )
+
+                # A face is generated once per vertex equivalent to a seed,
+                # only keep one representative of each translation class
+                key = self.translation_key(face)
+                if key not in seen:
+                    seen.add(key)
+                    faces.append(face)
+
+        return [np.array([v.w for v in face.vertices]) for face in faces]
+
+    def tesselate_face(self):
+        """
+        Generate all faces covering the visible region.
+
+        The prototypes are read from the ``"Faces"`` entry of the tessellation
+        description when it is there, and generated from the seeds otherwise.
+        The faces are stored in ``self.batches`` as one ``FaceBatch`` per
+        vertex count, each holding every translated copy of the prototypes.
+        """
+        if "Faces" in self.tess:
+            faces = [np.asarray(f, dtype=np.int64) for f in self.tess["Faces"]]
+        else:
+            faces = self.prototype_faces()
+
+        # Group prototypes by vertex count so that every group can be
+        # translated over the whole grid in a single broadcast
+        groups = {}
+        for verts in faces:
+            groups.setdefault(len(verts), []).append(verts)
+
+        if faces:
+            vertices = [v for group in groups.values() for v in group]
+            plane = lattice_to_plane(np.concatenate(vertices))
+            self.prototype_bounds = (*plane.min(axis=0), *plane.max(axis=0))
+        if self.laced_seams():
+            x_min, y_min, x_max, y_max = self.prototype_bounds
+            self.seam_margin = max(x_max - x_min, y_max - y_min) * self.writer.n_tiles
+        translations = self.translations()
+
+        self.batches = []
+        for prototypes in groups.values():
+            verts = LatticeArray(np.stack(prototypes)[:, None])  # (F, 1, Vf, 4)
+
+            transformed = verts.translate(translations[None, :, None, :])
+            transformed = transformed.scale(self.writer.n_tiles).to_plane()
+
+            self.batches.append(
+                FaceBatch(
+                    transformed.reshape(-1, transformed.shape[2], 2),
+                    param_mode=self.param_mode,
+                    assym_mode=self.assym_angle,
+                    separated_site_mode=self.separated_site_mode,
                 )
-        i_vals = np.arange(i_min, i_max)
-        j_vals = np.arange(j_min, j_max)
+            )
+
+    def translation_key(self, face):
+        """
+        Compute a key identifying a face up to a translation of the lattice.
 
-        I_grid, J_grid = np.meshgrid(i_vals, j_vals, indexing="ij")
+        The lexicographically smallest vertex of the face is brought back in
+        the fundamental cell of the reduced basis, and the face is translated
+        along with it. Two faces get the same key if and only if one is a
+        translated copy of the other.
 
-        translations = (
-            I_grid[..., None] * self.T1.w + J_grid[..., None] * self.T2.w
-        ).reshape(-1, 4)
+        Parameters
+        ----------
+        face : Face
+            Face with lattice vertices.
+
+        Returns
+        -------
+        tuple
+            Sorted packed keys of the translated vertices, see
+            ``LatticeArray.keys``.
+        """
+        w = LatticeArray([v.w for v in face.vertices])
+        if self.tile_inverse is not None:
+            ref = min(map(tuple, w.w.tolist()))
+            a, b = np.floor(self.tile_inverse @ lattice_to_plane(ref) + 1e-9)
+            w = w.translate(-int(a) * self.B1.w - int(b) * self.B2.w)
+        return tuple(np.sort(w.keys()).tolist())
+
+    def visible_region(self):
+        """
+        Compute the translations that can bring a prototype in the viewport.
 
-        for face in faces:
-            verts = face._vertices  # (Vf, 4)
+        A translated copy of the prototypes may touch the viewport, grown by
+        the culling margin, only if the translation lies in this rectangle.
 
-            transformed = verts[None, :, :] + translations[:, None, :]
+        Returns
+        -------
+        tuple of float
+            Rectangle as (x_min, y_min, x_max, y_max), in lattice units.
+        """
+        n_tiles = self.writer.n_tiles
+        margin = self.cull_margin()
+        viewport = self.viewport()
+        x_min = (viewport[0] - margin) / n_tiles
+        y_min = (viewport[1] - margin) / n_tiles
+        x_max = (viewport[0] + viewport[2] + margin) / n_tiles
+        y_max = (viewport[1] + viewport[3] + margin) / n_tiles
 
-            transformed *= self.writer.n_tiles
-            for tv in transformed:
-                new_face = copy.copy(face)
-                new_face.vertices = [LatticeCoords(t) for t in tv]
-                self.faces.append(new_face)
+        fx_min, fy_min, fx_max, fy_max = self.prototype_bounds
+        return x_min - fx_max, y_min - fy_max, x_max - fx_min, y_max - fy_min
 
     def find_corners(self):
         """
         Compute lattice bounds covering the visible canvas.
 
+        The bounds are indices along the reduced basis ``B1``, ``B2``, except
+        when the base is shown, where they index the ``T1``, ``T2`` cells
+        around the origin.
+
         Returns
         -------
         i_min : int
             Minimum lattice index along the first axis.
         i_max : int
-            Maximum lattice index along the first axis.
+            Maximum lattice index along the first axis (excluded).
         j_min : int
             Minimum lattice index along the second axis.
         j_max : int
-            Maximum lattice index along the second axis.
+            Maximum lattice index along the second axis (excluded).
         """
-        W = [
-            1,
-            0.8660254037844386 + 0.5j,
-            0.5 + 0.8660254037844386j,
-            1j,
-        ]
-
         if self.show_base:
             return -1, 2, -1, 2
 
-        i_min = 1000
-        i_max = -1000
-        j_min = 1000
-        j_max = -1000
+        if self.tile_inverse is None:
+            return 0, 1, 0, 1
 
-        corners = [
-            0,
-            self.writer.size[2],
-            self.writer.size[3] * 1j,
-            self.writer.size[2] + self.writer.size[3] * 1j,
-        ]
+        x_min, y_min, x_max, y_max = self.visible_region()
+        corners = np.array(
+            [[x_min, y_min], [x_max, y_min], [x_min, y_max], [x_max, y_max]]
+        )
+        ij = corners @ self.tile_inverse.T
 
-        for z in corners:
-            z_ = plane_to_tile_coords(
-                self.tess,
-                W,
-                z.real / self.writer.n_tiles,
-                z.imag / self.writer.n_tiles,
-            )
+        i_min, j_min = np.floor(ij.min(axis=0) - 1e-9).astype(int).tolist()
+        i_max, j_max = np.ceil(ij.max(axis=0) + 1e-9).astype(int).tolist()
+        return i_min, i_max + 1, j_min, j_max + 1
+
+    def translations(self):
+        """
+        Enumerate the lattice translations of the prototypes to draw.
+
+        The rows of constant ``j`` of the ``find_corners`` box are scanned,
+        and on each row only the interval of ``i`` for which ``i * B1 + j *
+        B2`` lies in ``visible_region`` is kept.
 
-            i_min = min(i_min, z_.real)
-            j_min = min(j_min, z_.imag)
-            i_max = max(i_max, z_.real)
-            j_max = max(j_max, z_.imag)
+        Returns
+        -------
+        np.ndarray
+            Array of shape (K, 4) of int64 lattice translations.
+        """
+        i_min, i_max, j_min, j_max = self.find_corners()
 
-        i_min = math.floor(i_min - 1)
-        i_max = math.ceil(i_max + 2)
-        j_min = math.floor(j_min - 1)
-        j_max = math.ceil(j_max + 2)
+        if self.show_base:
+            i_vals, j_vals = np.meshgrid(
+                np.arange(i_min, i_max), np.arange(j_min, j_max), indexing="ij"
+            )
+            return (
+                i_vals.reshape(-1, 1) * self.T1.w + j_vals.reshape(-1, 1) * self.T2.w
+            )
 
-        return i_min, i_max, j_min, j_max
+        if self.tile_inverse is None:
+            return np.zeros((1, 4), dtype=np.int64)
+
+        region = self.visible_region()
+        b1, b2 = lattice_to_plane([self.B1.w, self.B2.w])
+
+        i_vals = []
+        j_vals = []
+        for j in range(j_min, j_max):
+            lo, hi = i_min, i_max - 1
+            for k in range(2):
+                # Solve region[k] <= i * b1[k] + j * b2[k] <= region[k + 2]
+                r_min = region[k] - j * b2[k]
+                r_max = region[k + 2] - j * b2[k]
+                if abs(b1[k]) < 1e-9:
+                    if not r_min <= 0 <= r_max:
+                        hi = lo - 1
+                    continue
+                u, v = sorted([r_min / b1[k], r_max / b1[k]])
+                lo = max(lo, math.ceil(u - 1e-9))
+                hi = min(hi, math.floor(v + 1e-9))
+
+            if lo <= hi:
+                i_vals.append(np.arange(lo, hi + 1))
+                j_vals.append(np.full(hi + 1 - lo, j))
+
+        if not i_vals:
+            return np.zeros((0, 4), dtype=np.int64)
+
+        i_vals = np.concatenate(i_vals)[:, None]
+        j_vals = np.concatenate(j_vals)[:, None]
+        return i_vals * self.B1.w + j_vals * self.B2.w
 
     def set_param_mode(self, mode=False):
         """
@@ -335,9 +468,24 @@ class RegularTesselation(Tesselation):
         self.T2 = LatticeCoords(tess["T2"])
         self.T3 = self.T1.translate(self.T2)
 
+        # Short, near orthogonal basis of the translations lattice, and the
+        # map from plane coordinates to coordinates in this basis
+        b1, b2 = reduce_lattice_basis(self.T1.w, self.T2.w)
+        self.B1 = LatticeCoords(b1)
+        self.B2 = LatticeCoords(b2)
+
+        basis = lattice_to_plane([b1, b2]).T
+        if abs(np.linalg.det(basis)) > 1e-9:
+            self.tile_inverse = np.linalg.inv(basis)
+        else:
+            self.tile_inverse = None
+
         self.seed = self.tess["Seed"]
         self.cell = Face([self.T0, self.T1, self.T3, self.T2])
 
+        # Bounding box of the prototype faces, set by tesselate_face
+        self.prototype_bounds = (0, 0, 0, 0)
+
     def set_writer(self, writer):
         """
         Set the rendering backend.
@@ -2,6 +2,7 @@ import abc
 
 from mortier.coords import EuclideanCoords
 from mortier.enums import OrnementsType
+from mortier.face import HalfEdgeMesh
 
 
 class Tesselation:
@@ -25,6 +26,10 @@ class Tesselation:
         """
         self.writer = writer
         self.faces = []
+        self.batches = []
+        self.n_faces_kept = 0
+        self.n_faces_culled = 0
+        self.seam_margin = 0
 
         self.show_dual = False
         self.show_face = False
@@ -45,11 +50,81 @@ class Tesselation:
         """
         Generate the faces composing the tessellation.
 
-        This method is responsible for populating ``self.faces`` and
-        must be implemented by subclasses.
+        This method is responsible for populating ``self.faces`` (or
+        ``self.batches`` for array-backed tessellations) and must be
+        implemented by subclasses.
         """
         raise NotImplementedError
 
+    def viewport(self):
+        """
+        Region of the canvas drawn by the writer.
+
+        Returns
+        -------
+        tuple of float
+            Region as (x, y, width, height), ``writer.size`` unless the writer
+            only draws a part of the canvas.
+        """
+        return self.writer.viewport or self.writer.size
+
+    def laced_seams(self):
+        """
+        Whether laces can cross the borders of the viewport.
+
+        The over/under state of a lace crossing depends on which of the two
+        faces meeting there is drawn first. Every render, of the whole
+        canvas or of a part of it, must therefore also draw the faces
+        sharing a crossing with its visible faces, see ``seam_margin``, so
+        that the crossings on the borders match between renders.
+
+        Returns
+        -------
+        bool
+            True if the writer draws laces.
+        """
+        ornements = self.writer.ornements
+        return bool(ornements and ornements.type != OrnementsType.BANDS)
+
+    def cull_margin(self):
+        """
+        Distance outside the viewport at which a face can still be visible.
+
+        Returns
+        -------
+        float
+            Margin around the viewport, covering the outline stroke, the
+            width of the ornements and the ``seam_margin``.
+        """
+        margin = 1 + self.seam_margin
+        if self.writer.ornements:
+            margin += self.writer.ornements.width
+        return margin
+
+    def cull(self, batch, overshoot=0):
+        """
+        Drop the faces of a batch lying outside the canvas.
+
+        The number of removed faces is accumulated in
+        ``self.n_faces_culled``.
+
+        Parameters
+        ----------
+        batch : FaceBatch
+            Faces about to be drawn, or about to be ray transformed.
+        overshoot : float, optional
+            Distance by which the vertices can still move, added to the
+            ``cull_margin``.
+
+        Returns
+        -------
+        batch : FaceBatch
+            Faces that may touch the canvas.
+        """
+        culled = batch.cull(self.viewport(), self.cull_margin() + overshoot)
+        self.n_faces_culled += len(batch) - len(culled)
+        return culled
+
     def set_param_mode(self, mode=False):
         """
         Enable or disable parametric angle mode.
@@ -159,10 +234,57 @@ class Tesselation:
             Output produced by the writer backend.
         """
         self.tesselate_face()
+        self.draw_frame(frame_num)
+        self.set_caption()
+        output = self.writer.write()
+        return output
+
+    def animate(self, n_frames, encoder):
+        """
+        Draw the frames of an animation.
+
+        The faces are only generated once: each frame clears the writer and
+        draws them again, which only recomputes the ray transform, whose
+        angles depend on the frame through the angle parametrisation.
+
+        Parameters
+        ----------
+        n_frames : int
+            Number of frames of the animation.
+        encoder : FrameEncoder
+            Encoder receiving the image of every frame, the writer must be a
+            ``BitmapWriter``.
+
+        Returns
+        -------
+        None
+        """
+        self.tesselate_face()
+        for i in range(n_frames):
+            self.writer.clear()
+            self.draw_frame([i, n_frames])
+            encoder.add(self.writer.region())
+
+    def draw_frame(self, frame_num=[0, 1]):
+        """
+        Draw the faces generated by ``tesselate_face``.
+
+        Parameters
+        ----------
+        frame_num : list of int, optional
+            Animation frame information as [current_frame, total_frames].
+
+        Returns
+        -------
+        None
+        """
+        self.n_faces_kept = 0
+        self.n_faces_culled = 0
 
         if self.show_base:
             self.draw_cell()
 
+        drawn_faces = []
         for face in self.faces:
             if self.show_underlying:
                 self.writer.face(face, dotted=True)
@@ -176,6 +298,42 @@ class Tesselation:
                 )
 
             self.writer.face(f)
+            drawn_faces.append(f)
+
+        # The rays keep the vertices within one face size of the original
+        # face, unless they have different angles on both sides, where they
+        # can meet arbitrarily far
+        extent = max([b.extent() for b in self.batches], default=0)
+
+        # Faces sharing a crossing with a visible face are within one face
+        # size of the viewport, keep them so that the crossing is drawn
+        # the same way on both sides of a seam
+        if self.laced_seams():
+            self.seam_margin = extent
+
+        drawn_batches = []
+        for batch in self.batches:
+            # Only the drawn faces are counted, not their underlay
+            if self.show_underlying:
+                underlay = batch.cull(self.viewport(), self.cull_margin())
+                self.writer.face_batch(underlay, dotted=True)
+
+            # Only the faces which can still reach the viewport are
+            # transformed, and culled again once their vertices are known
+            b = batch
+            if self.angle:
+                if not self.assym_angle:
+                    b = self.cull(b, overshoot=extent)
+                b = b.ray_transform(self.angle, self.writer.size, frame_num)
+            b = self.cull(b)
+            self.n_faces_kept += len(b)
+            self.writer.face_batch(b)
+            drawn_batches.append(b)
+
+        # The faces were only filled, their edges are drawn once
+        if self.writer.welds_edges():
+            mesh = HalfEdgeMesh.from_batches(drawn_batches, drawn_faces)
+            self.writer.draw_edges(mesh)
 
         if self.draw_unit_circle:
             self.writer.circle(
@@ -188,10 +346,6 @@ class Tesselation:
                 self.scale,
             )
 
-        self.set_caption()
-        output = self.writer.write()
-        return output
-
     def set_tesselation(self):
         """
         Set or update the tessellation definition.
@@ -0,0 +1,306 @@
+import numpy as np
+
+
+def quantize(points, decimals=2):
+    """
+    Integer keys of points, on a grid of ``10 ** -decimals``.
+
+    The coordinates are rounded as by ``np.round(x, decimals)``, so that two
+    points get the same key exactly when their rounded coordinates are
+    equal.
+
+    Parameters
+    ----------
+    points : array-like of float
+        Array of shape (K, 2) holding the points.
+    decimals : int, optional
+        Number of decimals kept.
+
+    Returns
+    -------
+    keys : np.ndarray
+        Array of shape (K, 2) holding the integer keys, 0 for non-finite
+        points.
+    finite : np.ndarray
+        Boolean array, False for the points with non-finite coordinates.
+    """
+    points = np.asarray(points, dtype=float).reshape(-1, 2)
+    scaled = np.rint(points * 10.0**decimals)
+    finite = np.isfinite(scaled).all(axis=1)
+    keys = np.where(finite[:, None], scaled, 0).astype(np.int64)
+    return keys, finite
+
+
+def crossing_states(keys):
+    """
+    Initial over/under states of the laces crossing at some points.
+
+    The states are drawn from a hash of the keys of the points, instead of a
+    random generator, so that a crossing gets the same state whatever the
+    order in which the faces are drawn, and in every process rendering a
+    part of the image.
+
+    Parameters
+    ----------
+    keys : np.ndarray
+        Array of shape (K, 2) holding the keys of the points, see
+        ``quantize``.
+
+    Returns
+    -------
+    np.ndarray
+        Array of shape (K, 2) holding the two bits states.
+    """
+    keys = np.asarray(keys, dtype=np.int64).astype(np.uint64)
+    h = keys[:, 0] * np.uint64(0x9E3779B97F4A7C15)
+    h ^= keys[:, 1] * np.uint64(0xC2B2AE3D27D4EB4F)
+    h ^= h >> np.uint64(31)
+    h *= np.uint64(0x94D049BB133111EB)
+    h ^= h >> np.uint64(29)
+    return np.stack([(h >> np.uint64(1)) & np.uint64(1), h & np.uint64(1)], axis=1)
+
+
+class CrossingTable:
+    """
+    Crossings of the laces, in a spatial hash of the quantized points.
+
+    The points are quantized to integer keys by ``quantize``, and every key
+    gets a slot in NumPy arrays holding the state of the crossing. A
+    crossing registered for the second time, by the neighbouring face, has
+    its state flipped when it is even, so that the laces go over on one
+    side and under on the other. Flipping both bits keeps the parity, so
+    that the state only depends on the initial state and on the number of
+    registrations, and whole batches of faces are handled at once.
+    """
+
+    def __init__(self, decimals=2):
+        """
+        Initialize an empty table.
+
+        Parameters
+        ----------
+        decimals : int, optional
+            Number of decimals of the points kept, see ``quantize``.
+        """
+        self.decimals = decimals
+        self._slots = {}
+        self._initial = np.zeros((16, 2), dtype=int)
+        self._count = np.zeros(16, dtype=int)
+        self._angle = np.zeros(16)
+
+    def __len__(self):
+        """
+        Number of crossings in the table.
+
+        Returns
+        -------
+        int
+            Number of distinct quantized points registered.
+        """
+        return len(self._slots)
+
+    def __contains__(self, p):
+        """
+        Check whether a point is a registered crossing.
+
+        Parameters
+        ----------
+        p : EuclideanCoords
+            Point looked up, quantized like the registered points.
+
+        Returns
+        -------
+        bool
+            True if the point is in the table.
+        """
+        crossing, _, _ = self.lookup([[p.x, p.y]])
+        return bool(crossing[0])
+
+    def keys(self):
+        """
+        Keys of the crossings, see ``quantize``.
+
+        Returns
+        -------
+        dict_keys
+            Keys as tuples of int.
+        """
+        return self._slots.keys()
+
+    def _grow(self, size):
+        """
+        Make room for ``size`` slots, doubling the capacity of the arrays.
+        """
+        capacity = len(self._count)
+        if size <= capacity:
+            return
+        extra = max(size, 2 * capacity) - capacity
+        self._initial = np.concatenate([self._initial, np.zeros((extra, 2), int)])
+        self._count = np.concatenate([self._count, np.zeros(extra, int)])
+        self._angle = np.concatenate([self._angle, np.zeros(extra)])
+
+    def slots(self, points, create=False):
+        """
+        Slots of some points.
+
+        Parameters
+        ----------
+        points : array-like of float
+            Array of shape (K, 2) holding the points.
+        create : bool, optional
+            Give new slots to the points not in the table yet.
+
+        Returns
+        -------
+        np.ndarray
+            Slot of every point, -1 for the points not in the table and for
+            the non-finite points.
+        """
+        keys, finite = quantize(points, self.decimals)
+        slots = np.full(len(keys), -1)
+        table = self._slots
+        finite_keys = map(tuple, keys[finite].tolist())
+        if not create:
+            slots[finite] = [table.get(k, -1) for k in finite_keys]
+            return slots
+
+        n_slots = len(table)
+        slots[finite] = [table.setdefault(k, len(table)) for k in finite_keys]
+        if len(table) > n_slots:
+            self._grow(len(table))
+            new = slots >= n_slots
+            self._initial[slots[new]] = crossing_states(keys[new])
+        return slots
+
+    def register_faces(self, mid_points, mid_angles, vertices):
+        """
+        Register the crossings of faces, and look their vertices up.
+
+        This is the same as registering the crossings of every face then
+        looking its vertices up, face after face, but done at once for all
+        the faces.
+
+        Parameters
+        ----------
+        mid_points : array-like of float
+            Array of shape (N, M, 2) holding the crossing points of every
+            face.
+        mid_angles : array-like of float
+            Array of shape (N, M) holding the angle of the rays at the
+            crossing points.
+        vertices : array-like of float
+            Array of shape (N, V, 2) holding the points looked up for every
+            face.
+
+        Returns
+        -------
+        crossing : np.ndarray
+            Boolean array of shape (N, V), True where the vertex is a
+            crossing.
+        angles : np.ndarray
+            Array of shape (N, V) holding the angle of the rays at the
+            crossings, 0 elsewhere.
+        states : np.ndarray
+            Array of shape (N, V, 2) holding the state of the crossings, 0
+            elsewhere.
+        """
+        mid_points = np.asarray(mid_points, dtype=float)
+        vertices = np.asarray(vertices, dtype=float)
+        n_faces, n_vert = vertices.shape[:2]
+        n_mid = mid_points.shape[1] if mid_points.ndim == 3 else 0
+
+        # Registrations sorted by slot then face, keeping the drawing order
+        r_slot = self.slots(mid_points.reshape(-1, 2), create=True)
+        r_face = np.repeat(np.arange(n_faces), n_mid)
+        r_angle = np.asarray(mid_angles, dtype=float).reshape(-1)
+        keep = r_slot >= 0
+        order = np.lexsort((r_face[keep], r_slot[keep]))
+        r_slot = r_slot[keep][order]
+        r_angle = np.append(r_angle[keep][order], 0.0)
+        r_key = r_slot * n_faces + r_face[keep][order]
+
+        # Registrations of every vertex crossing, before and with its face
+        slot = self.slots(vertices.reshape(-1, 2))
+        face = np.repeat(np.arange(n_faces), n_vert)
+        found = slot >= 0
+        slot = np.where(found, slot, 0)
+        lo = np.searchsorted(r_key, slot * n_faces)
+        hi = np.searchsorted(r_key, slot * n_faces + face, side="right")
+        before = np.where(found, self._count[slot], 0)
+        count = np.where(found, before + hi - lo, 0)
+        crossing = count > 0
+
+        initial = self._initial[slot]
+        angle = self._angle[slot]
+        even = initial.sum(axis=1) % 2 == 0
+        flipped = even & ((count - 1) % 2 == 1)
+        states = np.where(crossing[:, None], initial ^ flipped[:, None], 0)
+        # Even crossings take the angle of their last registration, odd ones
+        # keep the angle of their first one
+        last = np.where(hi > lo, r_angle[hi - 1], angle)
+        first = np.where(before > 0, angle, r_angle[lo])
+        angles = np.where(crossing, np.where(even, last, first), 0.0)
+
+        self._update(r_slot, r_angle[:-1])
+        return (
+            crossing.reshape(n_faces, n_vert),
+            angles.reshape(n_faces, n_vert),
+            states.reshape(n_faces, n_vert, 2),
+        )
+
+    def _update(self, slot, angle):
+        """
+        Count sorted registrations of slots, and update the angles.
+        """
+        slots, start, counts = np.unique(slot, return_index=True, return_counts=True)
+        even = self._initial[slots].sum(axis=1) % 2 == 0
+        new = self._count[slots] == 0
+        last = angle[start + counts - 1]
+        first = angle[start]
+        kept = np.where(new, first, self._angle[slots])
+        self._angle[slots] = np.where(even, last, kept)
+        self._count[slots] += counts
+
+    def register(self, points, angles):
+        """
+        Register crossings, in order.
+
+        Parameters
+        ----------
+        points : array-like of float
+            Array of shape (K, 2) holding the crossing points.
+        angles : array-like of float
+            Angle of the rays at every crossing point.
+
+        Returns
+        -------
+        None
+        """
+        points = np.asarray(points, dtype=float).reshape(1, -1, 2)
+        angles = np.asarray(angles, dtype=float).reshape(1, -1)
+        self.register_faces(points, angles, np.empty((1, 0, 2)))
+
+    def lookup(self, points):
+        """
+        Crossings at some points.
+
+        Parameters
+        ----------
+        points : array-like of float
+            Array of shape (K, 2) holding the points looked up.
+
+        Returns
+        -------
+        crossing : np.ndarray
+            Boolean array, True where the point is a crossing.
+        angles : np.ndarray
+            Angle of the rays at the crossings, 0 elsewhere.
+        states : np.ndarray
+            Array of shape (K, 2) holding the state of the crossings, 0
+            elsewhere.
+        """
+        points = np.asarray(points, dtype=float).reshape(1, -1, 2)
+        crossing, angles, states = self.register_faces(
+            np.empty((1, 0, 2)), np.empty((1, 0)), points
+        )
+        return crossing[0], angles[0], states[0]
@@ -137,77 +137,258 @@ def compute_cut_length(theta, ornements):
     return cut_length, add_length
 
 
-def outline_lines(points, intersect_points, ornements):
+def _norm(v):
     """
-    Compute pairs of offset polylines (outer and inner) for a given polyline.
+    Norms of an array of 2D vectors, as ``np.linalg.norm`` of each vector.
     """
-    pts = points
-    n = len(pts)
-    if n < 2:
-        return [], []
+    return np.sqrt(np.vecdot(v, v))
+
+
+def _normalize(v):
+    """
+    Vectorized version of ``normalize``.
+    """
+    n = _norm(v)[..., None]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(n < 1e-9, 0.0, v / n)
 
-    pos_ring = []
-    neg_ring = []
 
-    for i in range(n):
-        p_prev = pts[(i - 1) % n]
-        p_curr = pts[i]
-        p_next = pts[(i + 1) % n]
+def _perp(v):
+    """
+    Vectorized version of ``perp``.
+    """
+    return np.stack([-v[..., 1], v[..., 0]], axis=-1)
 
-        if i == 0 or i == n - 1:
-            end = ornements.angle
-        else:
-            end = False
 
-        pos_midpoint, neg_midpoint = vertex_miter(
-            p_prev, p_curr, p_next, ornements, end
+def cut_lengths(theta, ornements):
+    """
+    Vectorized version of ``compute_cut_length``.
+
+    Parameters
+    ----------
+    theta : np.ndarray
+        Angles of the rays at the crossings.
+    ornements : Ornements
+        Ornements parameters.
+
+    Returns
+    -------
+    cut_length, add_length : np.ndarray
+        Lengths by which the bands are shortened when going under a
+        crossing, and lengthened when going over it.
+    """
+    half_w = ornements.width / 2
+    low = theta < np.pi / 4
+    theta_ = np.where(low, np.pi / 2 - theta * 2, theta * 2 - np.pi / 2)
+    secant = half_w / np.cos(theta_)
+    tangent = half_w * np.tan(theta_)
+    cut_length = np.where(low, secant + tangent, secant - tangent)
+    add_length = np.where(low, -(secant - tangent), -(secant + tangent))
+    if ornements.type == OrnementsType.BANDS:
+        add_length = cut_length
+    return cut_length, add_length
+
+
+def flatten_polygons(polygons):
+    """
+    Concatenate polygons with possibly different numbers of vertices.
+
+    Parameters
+    ----------
+    polygons : np.ndarray or list of array-like
+        Array of shape (N, V, 2), or list of (V_i, 2) arrays, holding the
+        vertices of every polygon.
+
+    Returns
+    -------
+    points : np.ndarray
+        Array of shape (P, 2) holding the vertices of every polygon.
+    sizes : np.ndarray
+        Number of vertices of every polygon.
+    """
+    if isinstance(polygons, np.ndarray):
+        n_polygons, n_vertices = polygons.shape[:2]
+        sizes = np.full(n_polygons, n_vertices)
+        return polygons.reshape(-1, 2).astype(float), sizes
+
+    polygons = [np.asarray(p, dtype=float).reshape(-1, 2) for p in polygons]
+    sizes = np.array([len(p) for p in polygons], dtype=int)
+    if not len(polygons):
+        return np.empty((0, 2)), sizes
+    return np.concatenate(polygons), sizes
+
+
+def outline_rings(vertices, crossing, angles, states, ornements):
+    """
+    Vectorized version of ``outline_lines``, for faces with the same number
+    of vertices.
+
+    The miter joins, the cut lengths at the crossings and both offset rings
+    are computed for every vertex of every face at once.
+
+    Parameters
+    ----------
+    vertices : np.ndarray
+        Array of shape (N, V, 2) holding the vertices of every face.
+    crossing : np.ndarray
+        Boolean array of shape (N, V), True where the vertex is a crossing
+        of the laces.
+    angles : np.ndarray
+        Array of shape (N, V) holding the angle of the rays at the crossings.
+    states : np.ndarray
+        Array of shape (N, V, 2) holding the over/under state of the
+        crossings.
+    ornements : Ornements
+        Ornements parameters.
+
+    Returns
+    -------
+    pos_ring : np.ndarray
+        Array of shape (N, V, 2) holding the inner ring of every face, whose
+        ends are joined at the crossing of its first and last sides.
+    neg_ring : np.ndarray
+        Array of shape (N, V, 3, 2) holding, for each vertex followed by a
+        crossing, the start, middle and end of the outer polyline around it.
+    has_neg : np.ndarray
+        Boolean array of shape (N, V), True where ``neg_ring`` holds a
+        polyline.
+    """
+    half_w = ornements.width / 2.0
+    n = vertices.shape[1]
+    p_curr = vertices
+    p_prev = np.roll(vertices, 1, axis=1)
+    p_next = np.roll(vertices, -1, axis=1)
+
+    # Ends of open polylines are cut at the angle of the rays
+    end = np.zeros(n)
+    end[[0, -1]] = ornements.angle or 0
+    end = end[None, :, None]
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        nv_prev = _normalize(p_curr - p_prev)
+        nv_next = _normalize(p_next - p_curr)
+        no_prev = (_norm(nv_prev) < 1e-9)[..., None]
+        no_next = (_norm(nv_next) < 1e-9)[..., None]
+
+        n_prev = _normalize(_perp(nv_prev))
+        n_next = _normalize(_perp(nv_next))
+        d_prev = _normalize(nv_prev)
+        d_next = _normalize(nv_next)
+        cut = half_w / np.tan(end + np.pi / 2)
+
+        bis = n_prev + n_next
+        bis_len = _norm(bis)[..., None]
+        b = bis / bis_len
+        miter_len = half_w / np.vecdot(b, n_next)[..., None]
+
+        pos = np.select(
+            [no_prev & no_next, no_prev, no_next, bis_len < 1e-6],
+            [
+                p_curr + np.array([half_w, 0]),
+                p_curr + n_next * half_w - d_next * cut,
+                p_curr + n_prev * half_w - d_prev * -cut,
+                p_curr + n_next * half_w,
+            ],
+            p_curr + b * miter_len,
+        )
+        neg = np.select(
+            [no_prev & no_next, no_prev, no_next, bis_len < 1e-6],
+            [
+                p_curr - np.array([half_w, 0]),
+                p_curr - n_next * half_w,
+                p_curr - n_prev * half_w,
+                p_curr - n_next * half_w,
+            ],
+            p_curr - b * miter_len,
         )
 
-        if str(p_curr) in intersect_points:
-            inter_p = intersect_points[str(p_curr)]
-            cut_length, add_length = compute_cut_length(inter_p["angle"], ornements)
-            beg_point = offset_segment(p_curr, p_next, cut_length, ornements)
-            if inter_p["state"][0] == 1:
-                beg_point = offset_segment(p_curr, p_next, cut_length, ornements)
-            else:
-                beg_point = offset_segment(p_curr, p_next, add_length, ornements)
-
-        elif str(p_next) in intersect_points:
-            inter_p = intersect_points[str(p_next)]
-            cut_length, add_length = compute_cut_length(inter_p["angle"], ornements)
-            end_point = offset_segment(
-                p_curr, p_next, cut_length, ornements, end_cut=True
-            )
-            if inter_p["state"][1] == 1:
-                end_point = offset_segment(
-                    p_curr, p_next, cut_length, ornements, end_cut=True
-                )
-            else:
-                end_point = offset_segment(
-                    p_curr, p_next, add_length, ornements, end_cut=True
-                )
-
-            neg_ring.append(beg_point)
-            neg_ring.append(neg_midpoint)
-            neg_ring.append(end_point)
-
-        pos_ring.append(pos_midpoint)
+        # Outer polylines, from the crossing before a vertex to the next one
+        cut_length, add_length = cut_lengths(angles, ornements)
+        direction = _normalize(p_next - p_curr)
+        off = _normalize(_perp(p_next - p_curr)) * (ornements.width / 2)
+
+        length = np.where(states[..., 0] == 1, cut_length, add_length)[..., None]
+        beg = p_curr + direction * length - off
+        length = np.roll(
+            np.where(states[..., 1] == 1, cut_length, add_length), -1, axis=1
+        )[..., None]
+        end_point = p_next - direction * length - off
+
+    index = np.arange(n)
+    last_crossing = np.maximum.accumulate(np.where(crossing, index, -1), axis=1)
+    has_neg = ~crossing & np.roll(crossing, -1, axis=1) & (last_crossing >= 0)
+    beg = np.take_along_axis(beg, np.maximum(last_crossing, 0)[..., None], axis=1)
+    neg_ring = np.stack([beg, neg, end_point], axis=2)
 
     # Hacky way to get the closing of the inside polygon
-    s0 = EuclideanCoords([pos_ring[0].x - pos_ring[1].x, pos_ring[0].y - pos_ring[1].y])
-    s1 = EuclideanCoords(
-        [pos_ring[-2].x - pos_ring[-1].x, pos_ring[-2].y - pos_ring[-1].y]
-    )
+    s0 = pos[:, 0] - pos[:, 1]
+    s1 = pos[:, -2] - pos[:, -1]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        t = (
+            s1[:, 0] * (pos[:, 0, 1] - pos[:, -2, 1])
+            - s1[:, 1] * (pos[:, 0, 0] - pos[:, -2, 0])
+        ) / (-s1[:, 0] * s0[:, 1] + s0[:, 0] * s1[:, 1])
+    closing = pos[:, 0] + t[:, None] * s0
+    pos[:, 0] = closing
+    pos[:, -1] = closing
+    return pos, neg_ring, has_neg
+
+
+def crossing_arrays(points, intersect_points):
+    """
+    Crossings of the laces at some points.
+
+    Parameters
+    ----------
+    points : list of EuclideanCoords
+        Points looked up.
+    intersect_points : CrossingTable
+        Crossings of the laces, see ``fill_intersect_points``.
+
+    Returns
+    -------
+    crossing : np.ndarray
+        Boolean array, True where the point is a crossing.
+    angles : np.ndarray
+        Angle of the rays at the crossings, 0 elsewhere.
+    states : np.ndarray
+        Array of shape (len(points), 2) holding the state of the crossings,
+        0 elsewhere.
+    """
+    return intersect_points.lookup([[p.x, p.y] for p in points])
+
 
-    t = (
-        s1.x * (pos_ring[0].y - pos_ring[-2].y)
-        - s1.y * (pos_ring[0].x - pos_ring[-2].x)
-    ) / (-s1.x * s0.y + s0.x * s1.y)
+def outline_lines(points, intersect_points, ornements):
+    """
+    Compute pairs of offset polylines (outer and inner) for a given polyline.
 
-    x = EuclideanCoords([pos_ring[0].x + (t * s0.x), pos_ring[0].y + (t * s0.y)])
+    Parameters
+    ----------
+    points : list of EuclideanCoords
+        Vertices of the face.
+    intersect_points : CrossingTable
+        Crossings of the laces, see ``fill_intersect_points``.
+    ornements : Ornements
+        Ornements parameters.
+
+    Returns
+    -------
+    pos_ring : List[EuclideanCoords]
+        Inner ring.
+    neg_ring : List[EuclideanCoords]
+        Outer polylines, three points for each vertex followed by a
+        crossing, see ``outline_rings``.
+    """
+    if len(points) < 2:
+        return [], []
 
-    pos_ring[0] = x
-    pos_ring[-1] = x
+    vertices = np.array([[p.x, p.y] for p in points], dtype=float)
+    crossing, angles, states = crossing_arrays(points, intersect_points)
+    pos, neg, has_neg = outline_rings(
+        vertices[None], crossing[None], angles[None], states[None], ornements
+    )
+    pos_ring = [EuclideanCoords(p) for p in pos[0]]
+    neg_ring = [EuclideanCoords(p) for p in neg[has_neg].reshape(-1, 2)]
     return pos_ring, neg_ring
 
 
@@ -222,17 +403,30 @@ def quadratic_bezier(p0, p1, p2, steps=10):
     return points
 
 
+def register_crossings(mid_points, intersect_points):
+    """
+    Register the crossings of the laces of a face.
+
+    A crossing seen for the second time, by the neighbouring face, gets its
+    state flipped when it is even, so that the laces go over on one side
+    and under on the other.
+
+    Parameters
+    ----------
+    mid_points : iterable of (EuclideanCoords, float)
+        Crossing points of the face and the angle of the rays there.
+    intersect_points : CrossingTable
+        Crossings of the laces, updated in place.
+
+    Returns
+    -------
+    None
+    """
+    mid_points = list(mid_points)
+    intersect_points.register(
+        [[p.x, p.y] for p, _ in mid_points], [a for _, a in mid_points]
+    )
+
+
 def fill_intersect_points(face, intersect_points):
-    for p, angle in face.mid_points:
-        if str(p) not in intersect_points:
-            intersect_points[str(p)] = {
-                "state": np.random.randint(2, size=2),
-                "angle": angle,
-            }
-        elif intersect_points[str(p)]["state"].sum() % 2 == 0:
-            intersect_points[str(p)] = {
-                "state": np.array(
-                    [(x + 1) % 2 for x in intersect_points[str(p)]["state"]]
-                ),
-                "angle": angle,
-            }
+    register_crossings(face.mid_points, intersect_points)
@@ -0,0 +1,38 @@
+import importlib
+import sys
+
+
+def lazy_attributes(package, attributes):
+    """
+    Build the module level hooks importing the attributes of a package lazily.
+
+    The returned functions are meant to be assigned to the ``__getattr__``
+    and ``__dir__`` of the package (see PEP 562): an attribute is imported
+    from its module the first time it is accessed, then cached in the
+    package namespace.
+
+    Parameters
+    ----------
+    package : str
+        Name of the package, usually ``__name__``.
+    attributes : dict
+        Mapping from attribute names to the modules defining them.
+
+    Returns
+    -------
+    getattr_, dir_ : callable
+        Module ``__getattr__`` and ``__dir__`` functions.
+    """
+
+    def getattr_(name):
+        if name not in attributes:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+
+        value = getattr(importlib.import_module(attributes[name]), name)
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def dir_():
+        return sorted(set(vars(sys.modules[package])) | set(attributes))
+
+    return getattr_, dir_
@@ -1,8 +1,8 @@
 import numpy as np
-from noise import pnoise3, snoise3
 
 from mortier.coords import LatticeCoords
 from mortier.enums import ParamType
+from mortier.utils.noise_field import pnoise3, snoise3
 
 
 def in_bounds(face, size):
@@ -68,7 +68,7 @@ def plane_coords(p, w):
     complex
         Complex number representing the plane coordinates.
     """
-    return LatticeCoords([p.w[i] * w[i] for i in range(4)]).sum()
+    return sum(p.w[i] * w[i] for i in range(4))
 
 
 def plane_to_tile_coords(tiling, w, x, y):
@@ -137,24 +137,56 @@ def angle_parametrisation(point, mode, bounds, frame_num=[0, 1]):
     ValueError
         If the parametrisation mode is not recognized.
     """
+    return float(angle_field([[point.x, point.y]], mode, bounds, frame_num)[0])
+
+
+def angle_field(points, mode, bounds, frame_num=[0, 1]):
+    """
+    Vectorized version of ``angle_parametrisation``.
+
+    The noise of every point is evaluated at once, see ``noise_field``.
+
+    Parameters
+    ----------
+    points : array-like of float
+        Array of shape (N, 2) holding the points used for the
+        parametrisation.
+    mode : ParamType
+        Type of parametrisation to use.
+    bounds : tuple of float
+        Bounding box as (xmin, ymin, xmax, ymax).
+    frame_num : list of int, optional
+        Animation frame information as [current_frame, total_frames].
+
+    Returns
+    -------
+    np.ndarray
+        Angle of every point, in radians.
+
+    Raises
+    ------
+    ValueError
+        If the parametrisation mode is not recognized.
+    """
+    points = np.asarray(points, dtype=float).reshape(-1, 2)
+    px, py = points[:, 0], points[:, 1]
     z = np.sin(map_num(frame_num[0], 0, frame_num[1], 0, 2 * np.pi))
 
     if mode == ParamType.CONSTANT:
-        z = np.sin(map_num(frame_num[0], 0, frame_num[1], 0, 2 * np.pi))
-        return map_num(z, -1, 1, 0.01, np.pi / 2)
+        return np.full(len(points), map_num(z, -1, 1, 0.01, np.pi / 2))
 
     if mode == ParamType.SIN:
-        return (np.sin(map_num(point.y, bounds[1], bounds[3], 0, 2 * np.pi)) + 1) / 2
+        return (np.sin(map_num(py, bounds[1], bounds[3], 0, 2 * np.pi)) + 1) / 2
 
     if mode == ParamType.PERLIN:
-        x = map_num(point.x, bounds[0], bounds[2], 0, 2)
-        y = map_num(point.y, bounds[1], bounds[3], 1, 2)
+        x = map_num(px, bounds[0], bounds[2], 0, 2)
+        y = map_num(py, bounds[1], bounds[3], 1, 2)
         angle = pnoise3(x, y, z, octaves=3)
         return map_num(angle, -1, 1, 0.01, np.pi / 2)
 
     if mode == ParamType.SIMPLEX:
-        x = map_num(point.x, bounds[0], bounds[2], -1, 0.5)
-        y = map_num(point.y, bounds[1], bounds[3], 3, 4)
+        x = map_num(px, bounds[0], bounds[2], -1, 0.5)
+        y = map_num(py, bounds[1], bounds[3], 3, 4)
         angle = snoise3(x, y, z, octaves=4)
         return map_num(angle, -1, 1, 0.01, np.pi / 2)
 
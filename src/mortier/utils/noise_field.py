@@ -0,0 +1,276 @@
+import numpy as np
+
+# Tables of the C implementation of the ``noise`` package (Casey Duncan),
+# whose scalar pnoise3 and snoise3 functions are ported here to arrays. The
+# computations are done in float32, in the same order as in C, so that the
+# values are the same.
+PERMUTATION = np.array(
+    [
+        151, 160, 137, 91, 90, 15, 131, 13, 201, 95, 96, 53, 194, 233, 7, 225,
+        140, 36, 103, 30, 69, 142, 8, 99, 37, 240, 21, 10, 23, 190, 6, 148,
+        247, 120, 234, 75, 0, 26, 197, 62, 94, 252, 219, 203, 117, 35, 11, 32,
+        57, 177, 33, 88, 237, 149, 56, 87, 174, 20, 125, 136, 171, 168, 68, 175,
+        74, 165, 71, 134, 139, 48, 27, 166, 77, 146, 158, 231, 83, 111, 229, 122,
+        60, 211, 133, 230, 220, 105, 92, 41, 55, 46, 245, 40, 244, 102, 143, 54,
+        65, 25, 63, 161, 1, 216, 80, 73, 209, 76, 132, 187, 208, 89, 18, 169,
+        200, 196, 135, 130, 116, 188, 159, 86, 164, 100, 109, 198, 173, 186, 3, 64,
+        52, 217, 226, 250, 124, 123, 5, 202, 38, 147, 118, 126, 255, 82, 85, 212,
+        207, 206, 59, 227, 47, 16, 58, 17, 182, 189, 28, 42, 223, 183, 170, 213,
+        119, 248, 152, 2, 44, 154, 163, 70, 221, 153, 101, 155, 167, 43, 172, 9,
+        129, 22, 39, 253, 19, 98, 108, 110, 79, 113, 224, 232, 178, 185, 112, 104,
+        218, 246, 97, 228, 251, 34, 242, 193, 238, 210, 144, 12, 191, 179, 162, 241,
+        81, 51, 145, 235, 249, 14, 239, 107, 49, 192, 214, 31, 181, 199, 106, 157,
+        184, 84, 204, 176, 115, 121, 50, 45, 127, 4, 150, 254, 138, 236, 205, 93,
+        222, 114, 67, 29, 24, 72, 243, 141, 128, 195, 78, 66, 215, 61, 156, 180,
+    ]
+    * 2
+)
+# fmt: on
+
+GRAD3 = np.array(
+    [
+        [1, 1, 0],
+        [-1, 1, 0],
+        [1, -1, 0],
+        [-1, -1, 0],
+        [1, 0, 1],
+        [-1, 0, 1],
+        [1, 0, -1],
+        [-1, 0, -1],
+        [0, 1, 1],
+        [0, -1, 1],
+        [0, 1, -1],
+        [0, -1, -1],
+        [1, 0, -1],
+        [-1, 0, -1],
+        [0, -1, 1],
+        [0, 1, 1],
+    ],
+    dtype=np.float32,
+)
+
+# Components of the gradients, taken separately from small contiguous tables
+_GRAD_X, _GRAD_Y, _GRAD_Z = np.ascontiguousarray(GRAD3.T)
+
+_F3 = np.float32(1.0) / np.float32(3.0)
+_G3 = np.float32(1.0) / np.float32(6.0)
+
+
+def _grad3(hash_, x, y, z):
+    """
+    Dot product of the position with the gradient selected by a hash.
+    """
+    h = hash_ & 15
+    return x * _GRAD_X.take(h) + y * _GRAD_Y.take(h) + z * _GRAD_Z.take(h)
+
+
+def _lerp(t, a, b):
+    """
+    Linear interpolation between two values.
+    """
+    return a + t * (b - a)
+
+
+def _perlin3(x, y, z, repeat, base):
+    """
+    Single octave of Perlin noise, see ``pnoise3``.
+    """
+    cells = []
+    for c, r in zip((x, y, z), repeat):
+        r = np.float32(r)
+        i = np.floor(np.fmod(c, r)).astype(np.int64)
+        ii = np.fmod(i + 1, int(r))
+        cells.append(((i & 255) + base, (ii & 255) + base))
+    (i, ii), (j, jj), (k, kk) = cells
+
+    x = x - np.floor(x)
+    y = y - np.floor(y)
+    z = z - np.floor(z)
+    fx = x * x * x * (x * (x * np.float32(6) - np.float32(15)) + np.float32(10))
+    fy = y * y * y * (y * (y * np.float32(6) - np.float32(15)) + np.float32(10))
+    fz = z * z * z * (z * (z * np.float32(6) - np.float32(15)) + np.float32(10))
+    one = np.float32(1)
+
+    p = PERMUTATION.take
+    a = p(i)
+    aa = p(a + j)
+    ab = p(a + jj)
+    b = p(ii)
+    ba = p(b + j)
+    bb = p(b + jj)
+
+    return _lerp(
+        fz,
+        _lerp(
+            fy,
+            _lerp(fx, _grad3(p(aa + k), x, y, z), _grad3(p(ba + k), x - one, y, z)),
+            _lerp(
+                fx,
+                _grad3(p(ab + k), x, y - one, z),
+                _grad3(p(bb + k), x - one, y - one, z),
+            ),
+        ),
+        _lerp(
+            fy,
+            _lerp(
+                fx,
+                _grad3(p(aa + kk), x, y, z - one),
+                _grad3(p(ba + kk), x - one, y, z - one),
+            ),
+            _lerp(
+                fx,
+                _grad3(p(ab + kk), x, y - one, z - one),
+                _grad3(p(bb + kk), x - one, y - one, z - one),
+            ),
+        ),
+    )
+
+
+# Offsets of the second and third corners of the simplex holding a point,
+# for the six orderings of its coordinates, one table per axis, see
+# ``_simplex3``
+_SIMPLEX_O1 = np.array([[1, 1, 0, 0, 0, 0], [0, 0, 0, 0, 1, 1], [0, 0, 1, 1, 0, 0]])
+_SIMPLEX_O2 = np.array([[1, 1, 1, 0, 0, 1], [1, 0, 0, 1, 1, 1], [0, 1, 1, 1, 1, 0]])
+
+
+def _simplex3(x, y, z):
+    """
+    Single octave of simplex noise, see ``snoise3``.
+    """
+    s = (x + y + z) * _F3
+    i = np.floor(x + s)
+    j = np.floor(y + s)
+    k = np.floor(z + s)
+    t = (i + j + k) * _G3
+
+    x0 = x - (i - t)
+    y0 = y - (j - t)
+    z0 = z - (k - t)
+
+    xy = x0 >= y0
+    yz = y0 >= z0
+    xz = x0 >= z0
+    order = np.select([xy & yz, xy & xz, xy, ~yz, ~xz], [0, 1, 2, 3, 4], 5)
+    o1 = [axis.take(order) for axis in _SIMPLEX_O1]
+    o2 = [axis.take(order) for axis in _SIMPLEX_O2]
+
+    g3 = _G3
+    one = np.float32(1.0)
+    corners = [
+        (x0, y0, z0, (0, 0, 0)),
+        (
+            x0 - o1[0].astype(np.float32) + g3,
+            y0 - o1[1].astype(np.float32) + g3,
+            z0 - o1[2].astype(np.float32) + g3,
+            o1,
+        ),
+        (
+            x0 - o2[0].astype(np.float32) + np.float32(2.0) * g3,
+            y0 - o2[1].astype(np.float32) + np.float32(2.0) * g3,
+            z0 - o2[2].astype(np.float32) + np.float32(2.0) * g3,
+            o2,
+        ),
+        (
+            x0 - one + np.float32(3.0) * g3,
+            y0 - one + np.float32(3.0) * g3,
+            z0 - one + np.float32(3.0) * g3,
+            (1, 1, 1),
+        ),
+    ]
+
+    ii = i.astype(np.int64) & 255
+    jj = j.astype(np.int64) & 255
+    kk = k.astype(np.int64) & 255
+    p = PERMUTATION
+
+    total = np.zeros_like(x)
+    for cx, cy, cz, (oi, oj, ok) in corners:
+        g = p.take(ii + oi + p.take(jj + oj + p.take(kk + ok))) % 12
+        f = np.float32(0.6) - cx * cx - cy * cy - cz * cz
+        n = f * f * f * f * _grad3(g, cx, cy, cz)
+        total = total + np.where(f > 0, n, np.float32(0))
+    return total * np.float32(32.0)
+
+
+def _float32_arrays(x, y, z):
+    """
+    Broadcast coordinates to float32 arrays of the same shape.
+    """
+    return np.broadcast_arrays(*(np.asarray(c, dtype=np.float32) for c in (x, y, z)))
+
+
+def pnoise3(x, y, z, octaves=1, persistence=0.5, lacunarity=2.0, repeat=1024, base=0):
+    """
+    Perlin noise of arrays of points, as ``noise.pnoise3``.
+
+    Parameters
+    ----------
+    x, y, z : array-like of float
+        Coordinates of the points, broadcast against each other.
+    octaves : int, optional
+        Number of octaves summed.
+    persistence : float, optional
+        Amplitude ratio between successive octaves.
+    lacunarity : float, optional
+        Frequency ratio between successive octaves.
+    repeat : int, optional
+        Period of the noise along every axis.
+    base : int, optional
+        Offset of the permutation table, changing the noise pattern.
+
+    Returns
+    -------
+    np.ndarray
+        Noise value of every point, in [-1, 1].
+    """
+    x, y, z = _float32_arrays(x, y, z)
+    if octaves == 1:
+        return _perlin3(x, y, z, (repeat,) * 3, base).astype(float)
+
+    freq = np.float32(1.0)
+    amp = np.float32(1.0)
+    amp_sum = np.float32(0.0)
+    total = np.zeros_like(x)
+    for _ in range(octaves):
+        period = int(np.float32(repeat) * freq)
+        total = total + _perlin3(x * freq, y * freq, z * freq, (period,) * 3, base) * amp
+        amp_sum += amp
+        freq *= np.float32(lacunarity)
+        amp *= np.float32(persistence)
+    return (total / amp_sum).astype(float)
+
+
+def snoise3(x, y, z, octaves=1, persistence=0.5, lacunarity=2.0):
+    """
+    Simplex noise of arrays of points, as ``noise.snoise3``.
+
+    Parameters
+    ----------
+    x, y, z : array-like of float
+        Coordinates of the points, broadcast against each other.
+    octaves : int, optional
+        Number of octaves summed.
+    persistence : float, optional
+        Amplitude ratio between successive octaves.
+    lacunarity : float, optional
+        Frequency ratio between successive octaves.
+
+    Returns
+    -------
+    np.ndarray
+        Noise value of every point, in [-1, 1].
+    """
+    x, y, z = _float32_arrays(x, y, z)
+    if octaves == 1:
+        return _simplex3(x, y, z).astype(float)
+
+    freq = np.float32(1.0)
+    amp = np.float32(1.0)
+    amp_sum = np.float32(0.0)
+    total = np.zeros_like(x)
+    for _ in range(octaves):
+        total = total + _simplex3(x * freq, y * freq, z * freq) * amp
+        amp_sum += amp
+        freq *= np.float32(lacunarity)
+        amp *= np.float32(persistence)
+    return (total / amp_sum).astype(float)
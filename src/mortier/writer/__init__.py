@@ -1,3 +1,16 @@
-from .bitmap_writer import BitmapWriter as BitmapWriter
-from .svg_writer import SVGWriter as SVGWriter
-from .tikz_writer import TikzWriter as TikzWriter
+from mortier.utils.lazy_import import lazy_attributes
+
+# Writers are only imported when used, since their backends (Pillow,
+# svgwrite) are slow to load
+_WRITERS = {
+    "BitmapWriter": "mortier.writer.bitmap_writer",
+    "FrameEncoder": "mortier.writer.frame_encoder",
+    "SVGStreamWriter": "mortier.writer.svg_stream_writer",
+    "SVGWriter": "mortier.writer.svg_writer",
+    "TikzWriter": "mortier.writer.tikz_writer",
+    "TileWriter": "mortier.writer.tile_writer",
+    "render_tiles": "mortier.writer.tile_writer",
+}
+
+__all__ = list(_WRITERS)
+__getattr__, __dir__ = lazy_attributes(__name__, _WRITERS)
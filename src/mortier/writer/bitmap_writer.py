@@ -1,14 +1,42 @@
+import numpy as np
 from PIL import Image, ImageDraw
 
 from mortier.writer.writer import Writer
 
 
+def disc_offsets(radius):
+    """
+    Offsets of the pixels of a disc, from its center pixel.
+
+    Parameters
+    ----------
+    radius : float
+        Radius of the disc, in pixels.
+
+    Returns
+    -------
+    dx, dy : np.ndarray
+        Offsets of the pixels within the radius, (0, 0) alone for a radius
+        below 1.
+    """
+    r = int(np.floor(radius))
+    dy, dx = np.mgrid[-r : r + 1, -r : r + 1]
+    inside = dx**2 + dy**2 <= radius**2
+    return dx[inside], dy[inside]
+
+
 class BitmapWriter(Writer):
     """
     Bitmap-based writer using PIL for raster rendering.
 
     This writer outputs drawings to a bitmap image (PNG, JPG, etc.)
     using the Pillow (PIL) library.
+
+    With a viewport, the image only holds that region of the canvas, and
+    the primitives are shifted by its origin. Pillow truncates the
+    coordinates toward zero, which would move the pixels of the primitives
+    crossing the left or top edge once shifted, so the coordinates are
+    truncated first, on the canvas, and the integer pixels are shifted.
     """
 
     def __init__(
@@ -16,6 +44,7 @@ class BitmapWriter(Writer):
         filename,
         size=(0, 0, 1920, 1080),
         n_tiles=100,
+        viewport=None,
     ):
         """
         Initialize a bitmap writer.
@@ -28,16 +57,85 @@ class BitmapWriter(Writer):
             Drawing bounds as (x, y, width, height).
         n_tiles : int, optional
             Number of tiles used for scaling or repetition.
+        viewport : tuple of int, optional
+            Region of the canvas drawn, as (x, y, width, height). The whole
+            canvas is drawn if None.
         """
         super().__init__(
             filename,
             size,
             n_tiles,
         )
+        self.set_viewport(viewport)
+
+    def set_viewport(self, viewport):
+        """
+        Create the image holding a region of the canvas.
+
+        Parameters
+        ----------
+        viewport : tuple of int or None
+            Region of the canvas drawn, as (x, y, width, height). The whole
+            canvas is drawn if None.
 
-        self.image = Image.new("RGB", (size[2], size[3]))
+        Returns
+        -------
+        None
+        """
+        self.viewport = viewport
+        if viewport is None:
+            self.origin = (0, 0)
+            self.image = Image.new("RGB", (self.size[2], self.size[3]))
+        else:
+            x, y, width, height = viewport
+            self.origin = (x, y)
+            self.image = Image.new("RGB", (width, height))
         self.output = ImageDraw.Draw(self.image)
 
+    def region(self):
+        """
+        Image of the region of the canvas drawn.
+
+        Returns
+        -------
+        PIL.Image.Image
+            The viewport, or the whole canvas if there is none.
+        """
+        return self.image
+
+    def pixel(self, x, y):
+        """
+        Pixel of the image at a point of the canvas.
+
+        Parameters
+        ----------
+        x, y : float
+            Coordinates of the point on the canvas.
+
+        Returns
+        -------
+        tuple of int
+            Coordinates truncated toward zero, as Pillow does, and shifted
+            by the origin of the viewport.
+        """
+        return int(x) - self.origin[0], int(y) - self.origin[1]
+
+    def pixels(self, coords):
+        """
+        Pixels of the image at an array of points of the canvas.
+
+        Parameters
+        ----------
+        coords : array-like
+            Array of shape (..., 2) holding the points.
+
+        Returns
+        -------
+        np.ndarray
+            Integer array of the same shape, see ``pixel``.
+        """
+        return np.trunc(np.asarray(coords, dtype=float)).astype(int) - self.origin
+
     def point(self, p, color=(255, 255, 255)):
         """
         Draw a point on the bitmap.
@@ -53,7 +151,7 @@ class BitmapWriter(Writer):
         -------
         None
         """
-        self.output.point((p.x, p.y), fill=color)
+        self.output.point(self.pixel(p.x, p.y), fill=color)
 
     def arc(self, bbox, start, end):
         """
@@ -72,6 +170,8 @@ class BitmapWriter(Writer):
         -------
         None
         """
+        x0, y0, x1, y1 = bbox
+        bbox = (*self.pixel(x0, y0), *self.pixel(x1, y1))
         self.output.arc(bbox, start=start, end=end)
 
     def circle(self, c, r, color=(255, 255, 255)):
@@ -91,8 +191,8 @@ class BitmapWriter(Writer):
         -------
         None
         """
-        p0 = (c.x - r, c.y - r)
-        p1 = (c.x + r, c.y + r)
+        p0 = self.pixel(c.x - r, c.y - r)
+        p1 = self.pixel(c.x + r, c.y + r)
         self.output.ellipse([p0, p1], outline=color)
 
     def set_color_bg(self, color):
@@ -118,14 +218,135 @@ class BitmapWriter(Writer):
         None
         """
         self.output.line(
-            [(p0.x, p0.y), (p1.x, p1.y)],
+            [self.pixel(p0.x, p0.y), self.pixel(p1.x, p1.y)],
             fill=color,
             width=1,
         )
 
     def polygon(self, points, outline, fill = None):
+        points = self.pixels(np.reshape(points, (-1, 2))).ravel().tolist()
         self.output.polygon(points, fill=fill, outline=outline)
 
+    def polygons(self, coords, fill, outline):
+        """
+        Draw several polygons sharing the same style.
+
+        Polygons drawn in a single color, without fill, without outline or
+        with both of the same color, cover the same pixels in any order:
+        they are all rasterised by ``ImageDraw.polygon`` in a mask spanning
+        the batch, and the color is pasted through it once. Otherwise the
+        outline of a polygon can be covered by the fill of a later one, so
+        every polygon is drawn on the image in turn. The image is identical
+        to drawing the polygons one by one through ``polygon``.
+
+        Parameters
+        ----------
+        coords : np.ndarray
+            Array of shape (N, V, 2) holding the points of every polygon.
+        fill : tuple of int or None
+            Fill color shared by the polygons.
+        outline : tuple of int or None
+            Outline color shared by the polygons.
+
+        Returns
+        -------
+        None
+        """
+        if not len(coords) or (fill is None and outline is None):
+            return
+
+        pixels = self.pixels(coords)
+        if fill is not None and outline is not None and fill != outline:
+            for xy in pixels.reshape(len(coords), -1).tolist():
+                self.output.polygon(xy, fill=fill, outline=outline)
+            return
+
+        # Mask covering the polygons within the image
+        corner = np.maximum(pixels.reshape(-1, 2).min(axis=0), 0)
+        far = np.minimum(pixels.reshape(-1, 2).max(axis=0) + 1, self.image.size)
+        if np.any(far <= corner):
+            return
+        mask = Image.new("L", tuple((far - corner).tolist()))
+        draw = ImageDraw.Draw(mask)
+        ink = {
+            "fill": None if fill is None else 255,
+            "outline": None if outline is None else 255,
+        }
+        for xy in (pixels - corner).reshape(len(coords), -1).tolist():
+            draw.polygon(xy, **ink)
+        color = outline if fill is None else fill
+        self.image.paste(color, tuple(corner.tolist()), mask)
+
+    def lines(self, segments, color=(255, 255, 255)):
+        """
+        Draw several line segments sharing the same color.
+
+        The end points of the whole batch are converted to flat lists in
+        one NumPy call, and every segment is then drawn by
+        ``ImageDraw.line``.
+
+        Parameters
+        ----------
+        segments : np.ndarray
+            Array of shape (S, 2, 2) holding the end points of every segment.
+        color : tuple of int, optional
+            RGB color of the segments.
+
+        Returns
+        -------
+        None
+        """
+        if color is None or not len(segments):
+            return
+
+        for xy in self.pixels(segments).reshape(len(segments), 4).tolist():
+            self.output.line(xy, fill=color, width=1)
+
+    def points(self, points, color=(255, 255, 255), radius=0):
+        """
+        Draw several points sharing the same color.
+
+        The pixels of the points are set in a mask through NumPy fancy
+        indexing, and the color is pasted through the mask in a single
+        call. The coordinates are truncated toward zero, as
+        ``ImageDraw.point`` does, so that single pixel points are identical
+        to drawing them one by one.
+
+        Parameters
+        ----------
+        points : np.ndarray
+            Array of shape (M, 2) holding the points.
+        color : tuple of int, optional
+            RGB color of the points.
+        radius : float, optional
+            Radius of the discs stamped at the points, in pixels, 0 for
+            single pixels.
+
+        Returns
+        -------
+        None
+        """
+        width, height = self.image.size
+        margin = radius + 1
+        points = np.asarray(points, dtype=float).reshape(-1, 2)
+        x, y = (points - self.origin).T
+        visible = (-margin < x) & (x < width + margin)
+        visible &= (-margin < y) & (y < height + margin)
+        x, y = self.pixels(points[visible]).T
+
+        dx, dy = disc_offsets(radius)
+        x = (x[:, None] + dx).ravel()
+        y = (y[:, None] + dy).ravel()
+        inside = (0 <= x) & (x < width) & (0 <= y) & (y < height)
+        x, y = x[inside], y[inside]
+        if not len(x):
+            return
+
+        left, top = x.min(), y.min()
+        mask = np.zeros((y.max() - top + 1, x.max() - left + 1), dtype=np.uint8)
+        mask[y - top, x - left] = 255
+        self.image.paste(color, (int(left), int(top)), Image.fromarray(mask))
+
     def write(self):
         """
         Save the bitmap image to disk.
@@ -134,7 +355,19 @@ class BitmapWriter(Writer):
         -------
         None
         """
-        self.image.save(self.filename)
+        self.region().save(self.filename)
+
+    def clear(self):
+        """
+        Erase the image, keeping the settings of the writer.
+
+        Returns
+        -------
+        None
+        """
+        super().clear()
+        self.set_viewport(self.viewport)
+        self.set_color_bg(self.color_bg)
 
     def new(self, filename, size=None, n_tiles=None):
         """
@@ -159,5 +392,4 @@ class BitmapWriter(Writer):
             n_tiles = self.n_tiles
 
         super().__init__(filename, size, n_tiles)
-        self.image = Image.new("RGB", (size[2], size[3]))
-        self.output = ImageDraw.Draw(self.image)
+        self.set_viewport(None)
@@ -0,0 +1,146 @@
+import queue
+import threading
+
+from PIL import Image
+
+
+class FrameEncoder:
+    """
+    Encoder of animation frames, running on a background thread.
+
+    The frames are handed over as they are drawn, and converted or saved by
+    a thread while the next frames are drawn. The output depends on the
+    filename:
+
+    - ``anim.gif``: animated GIF, the frames are quantized by the thread;
+    - ``anim.png``: animated PNG;
+    - a format string such as ``frames/{:04d}.png``: one numbered file per
+      frame, saved by the thread.
+
+    Only the numbered frames are streamed. Pillow writes an animated GIF
+    or PNG in a single ``save`` call, which itself keeps every frame until
+    the end, so these frames are kept in ``self.frames`` (with a palette
+    for GIF, one byte per pixel) and encoded by ``close``, on the calling
+    thread. Their memory grows linearly with the number of frames.
+    """
+
+    def __init__(self, filename, duration=40, loop=0, queue_size=8):
+        """
+        Initialize the encoder and start its thread.
+
+        Parameters
+        ----------
+        filename : str
+            Output filename, see the class documentation.
+        duration : int, optional
+            Display duration of every frame, in milliseconds.
+        loop : int, optional
+            Number of times the animation loops, 0 to loop forever.
+        queue_size : int, optional
+            Number of frames waiting to be encoded before ``add`` blocks.
+        """
+        self.filename = filename
+        self.duration = duration
+        self.loop = loop
+        self.numbered = "{" in filename
+        self.palette = filename.lower().endswith(".gif")
+
+        self.frames = []
+        self.n_frames = 0
+        self.error = None
+        self.queue = queue.Queue(maxsize=queue_size)
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        self.close(save=exc_type is None)
+
+    def add(self, image):
+        """
+        Queue a frame for encoding.
+
+        Parameters
+        ----------
+        image : PIL.Image.Image
+            Frame, copied so that the caller can keep drawing on it.
+
+        Returns
+        -------
+        None
+        """
+        if self.error:
+            raise self.error
+        self.queue.put(image.copy())
+        self.n_frames += 1
+
+    def encode(self, index, image):
+        """
+        Encode a single frame, on the thread.
+
+        Parameters
+        ----------
+        index : int
+            Index of the frame.
+        image : PIL.Image.Image
+            Frame.
+
+        Returns
+        -------
+        None
+        """
+        if self.numbered:
+            image.save(self.filename.format(index))
+        elif self.palette:
+            self.frames.append(image.convert("P", palette=Image.Palette.ADAPTIVE))
+        else:
+            self.frames.append(image)
+
+    def run(self):
+        """
+        Encode the queued frames until ``close`` is called.
+
+        Returns
+        -------
+        None
+        """
+        index = 0
+        while (image := self.queue.get()) is not None:
+            if self.error is None:
+                try:
+                    self.encode(index, image)
+                except Exception as e:  # pylint: disable=broad-exception-caught
+                    self.error = e
+            index += 1
+
+    def close(self, save=True):
+        """
+        Wait for the queued frames and write the animation.
+
+        The animated GIF or PNG is encoded here, from all the frames kept,
+        see the class documentation.
+
+        Parameters
+        ----------
+        save : bool, optional
+            If False, the thread is stopped without writing the animation.
+
+        Returns
+        -------
+        None
+        """
+        self.queue.put(None)
+        self.thread.join()
+        if self.error:
+            raise self.error
+        if save and self.frames:
+            self.frames[0].save(
+                self.filename,
+                save_all=True,
+                append_images=self.frames[1:],
+                duration=self.duration,
+                loop=self.loop,
+            )
+        self.frames = []
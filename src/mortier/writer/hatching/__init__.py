@@ -1 +1,4 @@
 from .hatching import Hatching as Hatching
+from .hatch_engine import hatch_dots as hatch_dots
+from .hatch_engine import hatch_lines as hatch_lines
+from .hatch_engine import hatch_spans as hatch_spans
@@ -0,0 +1,213 @@
+import numpy as np
+
+from mortier.utils.geometry import flatten_polygons
+
+
+def _rotate(x, y, angle):
+    """
+    Rotate arrays of coordinates around the origin, as ``EuclideanCoords``.
+    """
+    cos, sin = np.cos(angle), np.sin(angle)
+    return x * cos - y * sin, x * sin + y * cos
+
+
+def _ranges(counts):
+    """
+    Index of every element in its group, for consecutive groups of elements.
+
+    Parameters
+    ----------
+    counts : np.ndarray
+        Size of every group.
+
+    Returns
+    -------
+    group : np.ndarray
+        Group of every element.
+    rank : np.ndarray
+        Position of every element in its group.
+    """
+    group = np.repeat(np.arange(len(counts)), counts)
+    starts = np.cumsum(counts) - counts
+    rank = np.arange(len(group)) - starts[group]
+    return group, rank
+
+
+def rotated_bounds(bounds, angle):
+    """
+    Bounding box of a rectangle once rotated.
+
+    Parameters
+    ----------
+    bounds : tuple of float
+        Rectangle as (x, y, width, height).
+    angle : float
+        Rotation angle in radians.
+
+    Returns
+    -------
+    tuple of float
+        Bounding box of the rotated rectangle, as (x_min, y_min, x_max, y_max).
+    """
+    x = np.array([bounds[0], bounds[0] + bounds[2]])[[0, 1, 1, 0]]
+    y = np.array([bounds[1], bounds[1] + bounds[3]])[[0, 0, 1, 1]]
+    x, y = _rotate(x, y, angle)
+    return x.min(), y.min(), x.max(), y.max()
+
+
+def hatch_spans(polygons, angle, spacing, bounds=None):
+    """
+    Intersect polygons with parallel hatch lines.
+
+    The polygons are rotated by ``-angle``, so that the hatch lines are
+    horizontal, and cut by lines spaced by ``spacing`` starting from the
+    bottom of every polygon. The crossings of every edge of every polygon
+    with every line of the same polygon are computed at once, then sorted
+    along each line and paired, following the even-odd rule.
+
+    Parameters
+    ----------
+    polygons : np.ndarray or list of array-like
+        Array of shape (N, V, 2), or list of (V_i, 2) arrays, holding the
+        vertices of every polygon.
+    angle : float
+        Angle of the hatch lines, in radians.
+    spacing : float
+        Distance between the hatch lines.
+    bounds : tuple of float, optional
+        Visible rectangle as (x, y, width, height). The lines which cannot
+        cross it are skipped.
+
+    Returns
+    -------
+    x0, x1, y : np.ndarray
+        Spans of the hatch lines inside the polygons, in the rotated frame.
+    polygon : np.ndarray
+        Index of the polygon of every span.
+    """
+    points, sizes = flatten_polygons(polygons)
+    empty = np.empty(0)
+    if not len(points):
+        return empty, empty, empty, np.empty(0, dtype=int)
+
+    x, y = _rotate(points[:, 0], points[:, 1], -angle)
+
+    # Polygons with invalid vertices cannot be hatched
+    starts = np.cumsum(sizes) - sizes
+    valid = sizes > 0
+    finite = np.isfinite(x) & np.isfinite(y)
+    valid[valid] = np.logical_and.reduceat(finite, starts[valid])
+
+    y_min = np.full(len(sizes), np.inf)
+    y_max = np.full(len(sizes), -np.inf)
+    y_min[valid] = np.minimum.reduceat(y, starts[valid])
+    y_max[valid] = np.maximum.reduceat(y, starts[valid])
+
+    # Lines y_min + k * spacing, for k >= 1, strictly below y_max
+    first = np.ones(len(sizes))
+    last = np.where(valid, np.floor((y_max - y_min) / spacing), 0)
+    if bounds is not None:
+        _, lo, _, hi = rotated_bounds(bounds, -angle)
+        with np.errstate(invalid="ignore"):
+            first = np.maximum(first, np.ceil((lo - y_min) / spacing))
+            last = np.minimum(last, np.floor((hi - y_min) / spacing))
+    counts = np.maximum(last - first + 1, 0).astype(int)
+
+    line_polygon, rank = _ranges(counts)
+    line_y = y_min[line_polygon] + (first[line_polygon] + rank) * spacing
+    line_start = np.cumsum(counts) - counts
+
+    # Every edge of a polygon against every line of the same polygon
+    polygon, vertex = _ranges(sizes)
+    following = starts[polygon] + (vertex + 1) % sizes[polygon]
+    edge, edge_rank = _ranges(counts[polygon])
+    line = line_start[polygon[edge]] + edge_rank
+
+    x0, y0 = x[edge], y[edge]
+    x1, y1 = x[following[edge]], y[following[edge]]
+    ly = line_y[line]
+    crossing = ((y0 <= ly) & (ly < y1)) | ((y1 <= ly) & (ly < y0))
+
+    x0, y0, x1, y1 = x0[crossing], y0[crossing], x1[crossing], y1[crossing]
+    line = line[crossing]
+    t = (line_y[line] - y0) / (y1 - y0)
+    xs = x0 + t * (x1 - x0)
+
+    # Crossings sorted along each line, and paired two by two
+    order = np.lexsort((xs, line))
+    xs, line = xs[order], line[order]
+    _, rank = _ranges(np.bincount(line, minlength=len(line_y)))
+    paired = (rank % 2 == 0) & (np.roll(line, -1) == line)
+    paired[-1:] = False
+    begin = np.flatnonzero(paired)
+
+    line = line[begin]
+    return xs[begin], xs[begin + 1], line_y[line], line_polygon[line]
+
+
+def hatch_lines(polygons, angle, spacing, bounds=None):
+    """
+    Hatch lines of polygons, see ``hatch_spans``.
+
+    Parameters
+    ----------
+    polygons : np.ndarray or list of array-like
+        Vertices of every polygon.
+    angle : float
+        Angle of the hatch lines, in radians.
+    spacing : float
+        Distance between the hatch lines.
+    bounds : tuple of float, optional
+        Visible rectangle as (x, y, width, height).
+
+    Returns
+    -------
+    np.ndarray
+        Array of shape (S, 2, 2) holding the end points of every segment.
+    """
+    x0, x1, y, _ = hatch_spans(polygons, angle, spacing, bounds)
+    start = _rotate(x0, y, angle)
+    end = _rotate(x1, y, angle)
+    return np.stack([np.stack(start, axis=-1), np.stack(end, axis=-1)], axis=1)
+
+
+def hatch_dots(polygons, angle, spacing, bounds=None):
+    """
+    Hatch dots of polygons.
+
+    The dots are spaced by ``spacing`` along the hatch lines, starting half
+    a spacing after the side of the polygon.
+
+    Parameters
+    ----------
+    polygons : np.ndarray or list of array-like
+        Vertices of every polygon.
+    angle : float
+        Angle of the hatch lines, in radians.
+    spacing : float
+        Distance between the hatch lines, and between the dots of a line.
+    bounds : tuple of float, optional
+        Visible rectangle as (x, y, width, height).
+
+    Returns
+    -------
+    np.ndarray
+        Array of shape (M, 2) holding the dots.
+    """
+    x0, x1, y, _ = hatch_spans(polygons, angle, spacing, bounds)
+
+    # Dots x0 + spacing / 2 + k * spacing, for k >= 0, strictly before x1
+    start = x0 + spacing / 2
+    first = np.zeros(len(x0))
+    last = np.floor((x1 - start) / spacing)
+    if bounds is not None:
+        lo, _, hi, _ = rotated_bounds(bounds, -angle)
+        first = np.maximum(first, np.ceil((lo - start) / spacing))
+        last = np.minimum(last, np.floor((hi - start) / spacing))
+    counts = np.maximum(last - first + 1, 0).astype(int)
+
+    span, rank = _ranges(counts)
+    x = start[span] + (first[span] + rank) * spacing
+    keep = x < x1[span]
+    x, y = _rotate(x[keep], y[span][keep], angle)
+    return np.stack([x, y], axis=-1)
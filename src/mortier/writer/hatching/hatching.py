@@ -15,3 +15,4 @@ class Hatching:
     crosshatch: bool = False
     type: HatchType = HatchType.LINE
     color: Tuple[int, int, int] = (255, 255, 255)
+    radius: float = 0
@@ -0,0 +1,413 @@
+import numpy as np
+
+from mortier.writer.writer import Writer
+
+SVG_HEADER = (
+    '<?xml version="1.0" encoding="utf-8" ?>\n'
+    '<svg baseProfile="full" height="{height}mm" version="1.1" '
+    'viewBox="0,0,{width},{height}" width="{width}mm" '
+    'xmlns="http://www.w3.org/2000/svg" '
+    'xmlns:ev="http://www.w3.org/2001/xml-events" '
+    'xmlns:xlink="http://www.w3.org/1999/xlink">\n'
+    '<defs><clipPath id="clip_area">'
+    '<rect height="{height}" width="{width}" x="0" y="0" />'
+    "</clipPath></defs>\n"
+)
+
+
+def svg_color(color):
+    """
+    Format a color as an SVG attribute value.
+
+    Parameters
+    ----------
+    color : tuple of int or None
+        RGB color.
+
+    Returns
+    -------
+    str
+        ``rgb(r,g,b)``, or ``none`` if there is no color.
+    """
+    if color is None:
+        return "none"
+    return f"rgb({color[0]},{color[1]},{color[2]})"
+
+
+class SVGStreamWriter(Writer):
+    """
+    SVG writer streaming its output to disk.
+
+    Contrary to ``SVGWriter``, no element tree is kept in memory: the
+    header, clip path and background are written as soon as they are
+    known, and the primitives are appended to the file as compact
+    ``<path>`` elements, one group per drawing style. Consecutive
+    primitives sharing a style are merged into the same path, up to
+    ``chunk_size`` of them. Used as a context manager, the writer closes
+    the file even if the drawing fails.
+    """
+
+    def __init__(
+        self,
+        filename,
+        size=(0, 0, 210, 297),
+        n_tiles=1,
+        precision=3,
+        chunk_size=1000,
+    ):
+        """
+        Initialize a streaming SVG writer.
+
+        Parameters
+        ----------
+        filename : str
+            Output filename (without extension).
+        size : tuple of float, optional
+            Drawing bounds as (x, y, width, height), in millimeters.
+        n_tiles : int, optional
+            Number of tiles used for scaling or repetition.
+        precision : int, optional
+            Number of decimals of the written coordinates.
+        chunk_size : int, optional
+            Maximum number of primitives merged into a single path.
+        """
+        super().__init__(
+            filename,
+            size,
+            n_tiles,
+        )
+        self.precision = precision
+        self.chunk_size = chunk_size
+        self.file = None
+        self.open(filename, size)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        self.close()
+
+    def open(self, filename, size):
+        """
+        Start a new SVG file and write its header.
+
+        Parameters
+        ----------
+        filename : str
+            Output filename (without extension).
+        size : tuple of float
+            Drawing bounds as (x, y, width, height), in millimeters.
+        """
+        self.file = open(f"{filename}.svg", "w", buffering=1 << 20)
+        self.file.write(SVG_HEADER.format(width=size[2], height=size[3]))
+
+        self.in_main_group = False
+        self.style = None
+        self.pending = []
+
+    def point_format(self, n_points):
+        """
+        Format string of a path going through a number of points.
+
+        Parameters
+        ----------
+        n_points : int
+            Number of points of the path.
+
+        Returns
+        -------
+        str
+            Format string taking the flattened [x0, y0, x1, y1, ...] values.
+        """
+        point = f"%.{self.precision}f,%.{self.precision}f"
+        return "M" + " ".join([point] * n_points)
+
+    def set_style(self, fill, stroke, stroke_width=0.1):
+        """
+        Open a group for a drawing style, if it is not the current one.
+
+        Parameters
+        ----------
+        fill : tuple of int or None
+            Fill color.
+        stroke : tuple of int
+            Stroke color.
+        stroke_width : float or None, optional
+            Stroke width, left to the SVG default if None.
+        """
+        style = f'fill="{svg_color(fill)}" stroke="{svg_color(stroke)}"'
+        if stroke_width is not None:
+            style += f' stroke-width="{stroke_width}"'
+        if style == self.style:
+            return
+
+        self.flush()
+        if not self.in_main_group:
+            self.file.write('<g clip-path="url(#clip_area)">\n')
+            self.in_main_group = True
+        if self.style is not None:
+            self.file.write("</g>\n")
+        self.file.write(f"<g {style}>\n")
+        self.style = style
+
+    def add_path(self, d):
+        """
+        Queue path data in the current style group.
+
+        Parameters
+        ----------
+        d : str
+            Path data of a single primitive.
+        """
+        self.pending.append(d)
+        if len(self.pending) >= self.chunk_size:
+            self.flush()
+
+    def flush(self):
+        """
+        Write the queued primitives as a single path element.
+        """
+        if self.pending:
+            self.file.write(f'<path d="{" ".join(self.pending)}" />\n')
+            self.pending = []
+
+    def circle(self, c, r, color=(0, 0, 0)):
+        """
+        Draw a circle.
+
+        Parameters
+        ----------
+        c : EuclideanCoords
+            Center of the circle.
+        r : float
+            Radius of the circle.
+        color : tuple of int, optional
+            Stroke color.
+
+        Returns
+        -------
+        None
+        """
+        if not self.in_bounds(c):
+            return
+
+        self.set_style(None, color, stroke_width=None)
+        self.flush()
+        self.file.write(f'<circle cx="{c.x}" cy="{c.y}" r="{r}" />\n')
+
+    def point(self, p, color=(0, 0, 0)):
+        """
+        Draw a point, which is simply a very small circle.
+
+        Parameters
+        ----------
+        p : EuclideanCoords
+            Center of the point.
+        color : tuple of int, optional
+            Stroke color.
+
+        Returns
+        -------
+        None
+        """
+        self.circle(p, 0.001, color)
+
+    def line(self, p0, p1, color=(0, 0, 0)):
+        """
+        Draw a line segment.
+
+        Parameters
+        ----------
+        p0 : EuclideanCoords
+            Starting point.
+        p1 : EuclideanCoords
+            Ending point.
+        color : tuple of int, optional
+            Stroke color.
+
+        Returns
+        -------
+        None
+        """
+        if not self.in_bounds(p0) and not self.in_bounds(p1):
+            return
+
+        self.set_style(None, color)
+        self.add_path(self.point_format(2) % (p0.x, p0.y, p1.x, p1.y))
+
+    def lines(self, segments, color=(0, 0, 0)):
+        """
+        Draw several line segments sharing the same color.
+
+        Parameters
+        ----------
+        segments : np.ndarray
+            Array of shape (S, 2, 2) holding the end points of every segment.
+        color : tuple of int, optional
+            Stroke color.
+
+        Returns
+        -------
+        None
+        """
+        segments = segments[self.in_bounds_array(segments).any(axis=1)]
+        if not len(segments):
+            return
+
+        self.set_style(None, color)
+        fmt = self.point_format(2)
+        for xy in np.reshape(segments, (len(segments), 4)).tolist():
+            self.add_path(fmt % tuple(xy))
+
+    def polylines(self, paths, color=(0, 0, 0)):
+        """
+        Draw several polylines sharing the same color, one path each.
+
+        Parameters
+        ----------
+        paths : List[np.ndarray]
+            Array of shape (K_i, 2) holding the points of every polyline.
+        color : tuple of int, optional
+            Stroke color.
+
+        Returns
+        -------
+        None
+        """
+        x_min, y_min = self.size[0], self.size[1]
+        x_max, y_max = x_min + self.size[2], y_min + self.size[3]
+        visible = [
+            p
+            for p in paths
+            if p[:, 0].max() >= x_min
+            and p[:, 0].min() <= x_max
+            and p[:, 1].max() >= y_min
+            and p[:, 1].min() <= y_max
+        ]
+        if not visible:
+            return
+
+        self.set_style(None, color)
+        for p in visible:
+            self.add_path(self.point_format(len(p)) % tuple(p.reshape(-1).tolist()))
+
+    def polygon(self, points, fill, outline):
+        """
+        Draw a closed polygon.
+
+        Parameters
+        ----------
+        points : list of tuple
+            Points of the polygon.
+        fill : tuple of int or None
+            Fill color, the polygon is not filled if None.
+        outline : tuple of int or None
+            Stroke color.
+
+        Returns
+        -------
+        None
+        """
+        self.polygons(np.asarray(points, dtype=float)[None], fill, outline)
+
+    def polygons(self, coords, fill, outline):
+        """
+        Draw several polygons sharing the same style.
+
+        Parameters
+        ----------
+        coords : np.ndarray
+            Array of shape (N, V, 2) holding the points of every polygon.
+        fill : tuple of int or None
+            Fill color shared by the polygons.
+        outline : tuple of int
+            Outline color shared by the polygons.
+
+        Returns
+        -------
+        None
+        """
+        # A single invalid value would break the whole merged path
+        coords = coords[np.isfinite(coords).all(axis=(1, 2))]
+        if not len(coords):
+            return
+
+        self.set_style(fill, outline)
+        fmt = self.point_format(coords.shape[1]) + "Z"
+        for xy in np.reshape(coords, (len(coords), -1)).tolist():
+            self.add_path(fmt % tuple(xy))
+
+    def set_color_bg(self, color):
+        """
+        Paint the background.
+
+        The background is written right away, so this has to be called
+        before drawing anything else.
+
+        Parameters
+        ----------
+        color : tuple of int or None
+            Background color, nothing is done if None.
+
+        Returns
+        -------
+        None
+        """
+        if color:
+            self.color_bg = color
+            self.file.write(
+                f'<rect fill="{svg_color(color)}" height="100%" width="100%" '
+                'x="0" y="0" />\n'
+            )
+
+    def close(self):
+        """
+        Close the open groups and the SVG file.
+        """
+        if self.file is None:
+            return
+
+        self.flush()
+        if self.style is not None:
+            self.file.write("</g>\n")
+        if self.in_main_group:
+            self.file.write("</g>\n")
+        self.file.write("</svg>\n")
+        self.file.close()
+        self.file = None
+
+    def write(self):
+        """
+        Finish the SVG file.
+
+        Returns
+        -------
+        None
+        """
+        self.close()
+
+    def new(self, filename, size=None, n_tiles=None):
+        """
+        Finish the current file and start a new SVG output.
+
+        Parameters
+        ----------
+        filename : str
+            New output filename (without extension).
+        size : tuple of float, optional
+            New drawing bounds.
+        n_tiles : int, optional
+            Updated tile count.
+
+        Returns
+        -------
+        None
+        """
+        if size is None:
+            size = self.size
+        if n_tiles is None:
+            n_tiles = self.n_tiles
+
+        self.close()
+        super().__init__(filename, size, n_tiles)
+        self.open(filename, size)
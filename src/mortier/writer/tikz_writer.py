@@ -1,14 +1,42 @@
+from collections import OrderedDict
+
 import numpy as np
 
+from mortier.utils.geometry import fill_intersect_points
 from mortier.writer.writer import Writer
 
 
+def quantized(*values):
+    """
+    Integer keys of coordinates, on a grid of 0.01.
+
+    Parameters
+    ----------
+    *values : float or array-like of float
+        Coordinates, rounded as the TikZ commands print them.
+
+    Returns
+    -------
+    tuple of int
+        Coordinates times 100, rounded, flattened.
+    """
+    values = np.concatenate([np.ravel(v) for v in values]).astype(float)
+    return tuple(np.rint(values * 100).astype(np.int64).tolist())
+
+
 class TikzWriter(Writer):
     """
     TikZ-based writer for vector graphics output.
 
     This writer generates LaTeX/TikZ code for rendering tessellations
     as vector graphics.
+
+    Commands are queued in ``self.output`` and appended to the file, in
+    drawing order, every ``buffer_size`` commands. The header is written
+    with the first batch of commands, so it must be set up before drawing.
+    The last ``dedup_size`` primitives drawn are remembered by their type,
+    style and quantized coordinates, in least recently drawn order, and
+    drawing one of them again is skipped.
     """
 
     def __init__(
@@ -17,6 +45,8 @@ class TikzWriter(Writer):
         size=(0, 0, 14, 20),
         n_tiles=1,
         draw_borders=False,
+        buffer_size=10000,
+        dedup_size=100000,
     ):
         """
         Initialize a TikZ writer.
@@ -31,6 +61,10 @@ class TikzWriter(Writer):
             Number of tiles used for scaling or repetition.
         draw_borders : bool, optional
             Whether to draw bounding borders.
+        buffer_size : int, optional
+            Number of commands queued before they are written to the file.
+        dedup_size : int, optional
+            Number of primitives remembered to skip the duplicates.
         """
         super().__init__(
             filename,
@@ -44,7 +78,61 @@ class TikzWriter(Writer):
         self.set_bounds(size)
         self.color = "black"
         self.bands_width = 1
-        self.seen_line = {}
+        self.buffer_size = buffer_size
+        self.dedup_size = dedup_size
+        self.seen = OrderedDict()
+        self.started = False
+
+    def emit(self, command, key):
+        """
+        Queue a TikZ command, unless the same primitive was already drawn.
+
+        Parameters
+        ----------
+        command : str
+            TikZ command.
+        key : tuple
+            Type, style and quantized coordinates of the primitive, see
+            ``quantized``.
+
+        Returns
+        -------
+        None
+        """
+        if key in self.seen:
+            self.seen.move_to_end(key)
+            return
+        self.seen[key] = None
+        if len(self.seen) > self.dedup_size:
+            self.seen.popitem(last=False)
+
+        self.output.append(command)
+        if len(self.output) >= self.buffer_size:
+            self.flush()
+
+    def flush(self):
+        """
+        Append the queued commands to the file.
+
+        The file is created, and the header written, on the first call.
+
+        Returns
+        -------
+        None
+        """
+        if self.started and not self.output:
+            return
+
+        mode = "a" if self.started else "w+"
+        with open(self.filename, mode, encoding="utf-8") as f:
+            if not self.started:
+                f.write(self.header)
+            elif self.output:
+                f.write("\n")
+            f.write("\n".join(self.output))
+
+        self.started = True
+        self.output = []
 
     def circle(self, c, r, color="black"):
         """
@@ -63,7 +151,10 @@ class TikzWriter(Writer):
         -------
         None
         """
-        self.output.append(f"\\filldraw[{self.color}] ({c.x}, {c.y}) circle ({r});")
+        self.emit(
+            f"\\filldraw[{self.color}] ({c.x}, {c.y}) circle ({r});",
+            ("circle", self.color, *quantized(c.x, c.y, r)),
+        )
 
     def point(self, p):
         """
@@ -78,7 +169,10 @@ class TikzWriter(Writer):
         -------
         None
         """
-        self.output.append(f"\\filldraw[{self.color}] ({p.x}, {p.y}) circle (2pt);")
+        self.emit(
+            f"\\filldraw[{self.color}] ({p.x}, {p.y}) circle (2pt);",
+            ("point", self.color, *quantized(p.x, p.y)),
+        )
 
     def line(self, p0, p1, dotted=False, color="black"):
         """
@@ -102,11 +196,11 @@ class TikzWriter(Writer):
         pattern = ", dotted" if dotted else ""
 
         if self.in_bounds(p0) and self.in_bounds(p1):
-            self.output.append(
-                "\\draw [draw="
-                f"{color}{pattern}] "
-                f"({np.round(p0.x, 2)}, {np.round(p0.y, 2)}) -- "
-                f"({np.round(p1.x, 2)}, {np.round(p1.y, 2)});"
+            a = (np.round(p0.x, 2), np.round(p0.y, 2))
+            b = (np.round(p1.x, 2), np.round(p1.y, 2))
+            self.emit(
+                f"\\draw [draw={color}{pattern}] ({a[0]}, {a[1]}) -- ({b[0]}, {b[1]});",
+                ("line", color, pattern, *quantized(min(a, b), max(a, b))),
             )
 
     def face(self, face, dotted=False):
@@ -124,34 +218,127 @@ class TikzWriter(Writer):
         -------
         None
         """
-        path = []
         pattern = ",dotted" if dotted else ""
 
-        for p in face.mid_points:
-            if str(p) not in self.intersect_points:
-                self.intersect_points[str(p)] = np.random.randint(2, size=2)
-            elif self.intersect_points[str(p)].sum() % 2 == 0:
-                self.intersect_points[str(p)] = np.array(
-                    [(x + 1) % 2 for x in self.intersect_points[str(p)]]
-                )
+        fill_intersect_points(face, self.intersect_points)
 
         if self.ornements:
             self.draw_outline_lines(face.vertices, face.mid_points)
+        # TikZ faces are not filled, their edges are drawn by ``draw_edges``
+        elif self.welds_edges():
+            return
         # TODO: Bezier MODE !!
         else:
+            points = []
             for v in face.vertices:
                 if not self.in_bounds(v):
-                    if path:
-                        self.output.append(
-                            f"\\draw[{self.color} {pattern}] {'--'.join(path)};"
-                        )
-                        path = []
+                    self.path(points, pattern)
+                    points = []
                     continue
 
-                path.append(f"({np.round(v.x, 2)}, {np.round(v.y, 2)})")
+                points.append((np.round(v.x, 2), np.round(v.y, 2)))
+
+            self.path(points, pattern)
+
+    def face_batch(self, batch, dotted=False):
+        """
+        Draw every face of a FaceBatch.
+
+        Parameters
+        ----------
+        batch : FaceBatch
+            Faces to draw.
+        dotted : bool, optional
+            Draw the faces edges as dotted.
+
+        Returns
+        -------
+        None
+        """
+        # The ornements have their own crossings here, see ``face``
+        if self.ornements:
+            for face in batch.faces():
+                self.face(face, dotted=dotted)
+            return
+        if self.welds_edges():
+            return
+
+        pattern = ",dotted" if dotted else ""
+        inside = self.in_bounds_array(batch.vertices)
+        coords = np.round(batch.vertices, 2).tolist()
+
+        for row, mask in zip(coords, inside.tolist()):
+            self.visible_path(row, mask, pattern)
+
+    def polylines(self, paths, color=None):
+        """
+        Draw several polylines, in the color of the writer.
+
+        Parameters
+        ----------
+        paths : List[np.ndarray]
+            Array of shape (K_i, 2) holding the points of every polyline.
+        color : tuple of int, optional
+            Ignored, TikZ colors are named, see ``self.color``.
+
+        Returns
+        -------
+        None
+        """
+        for p in paths:
+            self.visible_path(np.round(p, 2).tolist(), self.in_bounds_array(p).tolist())
+
+    def visible_path(self, points, visible, pattern=""):
+        """
+        Draw the parts of a polyline whose points are in bounds.
+
+        Parameters
+        ----------
+        points : list of tuple
+            Points of the polyline, already rounded.
+        visible : list of bool
+            Whether every point is in bounds.
+        pattern : str, optional
+            TikZ line pattern options.
+
+        Returns
+        -------
+        None
+        """
+        path = []
+        for (x, y), inside in zip(points, visible):
+            if not inside:
+                self.path(path, pattern)
+                path = []
+                continue
+
+            path.append((x, y))
+
+        self.path(path, pattern)
+
+    def path(self, points, pattern=""):
+        """
+        Draw a polyline through rounded points.
+
+        Parameters
+        ----------
+        points : list of tuple
+            Points of the polyline, already rounded.
+        pattern : str, optional
+            TikZ line pattern options.
+
+        Returns
+        -------
+        None
+        """
+        if not points:
+            return
 
-            if path:
-                self.output.append(f"\\draw[{self.color} {pattern}] {'--'.join(path)};")
+        path = "--".join(f"({x}, {y})" for x, y in points)
+        self.emit(
+            f"\\draw[{self.color} {pattern}] {path};",
+            ("path", self.color, pattern, *quantized(points)),
+        )
 
     def set_scale(self, scale):
         """
@@ -233,17 +420,14 @@ class TikzWriter(Writer):
 
     def write(self):
         """
-        Write the TikZ output to file.
+        Write the remaining commands and the footer to file.
 
         Returns
         -------
         None
         """
-        self.output = "\n".join(set(self.output))
-
-        with open(self.filename, "w+", encoding="utf-8") as f:
-            f.write(self.header)
-            f.write(self.output)
+        self.flush()
+        with open(self.filename, "a", encoding="utf-8") as f:
             f.write(self.footer)
 
     def new(self, filename, size=None, n_tiles=None):
@@ -273,5 +457,6 @@ class TikzWriter(Writer):
 
         super().__init__(filename, size, n_tiles)
         self.set_bounds(size)
-        self.seen_line = {}
+        self.seen = OrderedDict()
+        self.started = False
         self.output = []
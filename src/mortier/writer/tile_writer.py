@@ -0,0 +1,147 @@
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+from PIL import Image
+
+from mortier.writer.bitmap_writer import BitmapWriter
+
+
+class TileWriter(BitmapWriter):
+    """
+    Bitmap writer drawing one tile of an image held in shared memory.
+
+    The tile is rasterised like with a ``BitmapWriter`` restricted to a
+    viewport, and ``write`` copies it into its place in the shared image
+    instead of saving it to disk.
+    """
+
+    def __init__(self, shm_name, size, n_tiles, viewport):
+        """
+        Initialize a tile writer.
+
+        Parameters
+        ----------
+        shm_name : str
+            Name of the shared memory block holding the whole RGB image.
+        size : tuple of int
+            Bounds of the whole image, as (x, y, width, height).
+        n_tiles : int
+            Number of tiles used for scaling or repetition.
+        viewport : tuple of int
+            Region of the image drawn by this writer, as (x, y, width, height).
+        """
+        super().__init__(shm_name, size, n_tiles, viewport=viewport)
+
+    def write(self):
+        """
+        Copy the tile into the shared image.
+
+        Returns
+        -------
+        None
+        """
+        shm = shared_memory.SharedMemory(name=self.filename)
+        try:
+            image = np.ndarray((self.size[3], self.size[2], 3), np.uint8, shm.buf)
+            x, y, w, h = self.viewport
+            x, y = x - self.size[0], y - self.size[1]
+            image[y : y + h, x : x + w] = np.asarray(self.region())
+            del image
+        finally:
+            shm.close()
+
+
+def tile_viewports(size, tile_size):
+    """
+    Split an image into square tiles.
+
+    Parameters
+    ----------
+    size : tuple of int
+        Bounds of the image, as (x, y, width, height).
+    tile_size : int
+        Side of the tiles, the last row and column may be smaller.
+
+    Returns
+    -------
+    List[tuple]
+        Viewport of every tile, as (x, y, width, height).
+    """
+    x0, y0, width, height = size
+    return [
+        (x0 + x, y0 + y, min(tile_size, width - x), min(tile_size, height - y))
+        for y in range(0, height, tile_size)
+        for x in range(0, width, tile_size)
+    ]
+
+
+def render_tile(draw, shm_name, size, viewport):
+    """
+    Draw a single tile, in a worker process.
+
+    Parameters
+    ----------
+    draw : callable
+        Function setting up a writer and drawing the tesselation on it.
+    shm_name : str
+        Name of the shared memory block holding the whole image.
+    size : tuple of int
+        Bounds of the whole image.
+    viewport : tuple of int
+        Region of the image drawn.
+
+    Returns
+    -------
+    object
+        Value returned by ``draw``.
+    """
+    return draw(TileWriter(shm_name, size, 1, viewport))
+
+
+def render_tiles(draw, filename, size, tile_size=512, processes=None):
+    """
+    Render a bitmap image by tiles, in parallel.
+
+    The image is split in square tiles, each of them drawn by a worker
+    process which builds its own tesselation, restricted to the tile, and
+    copies its pixels into a shared memory image. The image is saved once
+    every tile is done.
+
+    Parameters
+    ----------
+    draw : callable
+        Picklable function taking a writer, setting it up and drawing the
+        tesselation on it. It is called once per tile.
+    filename : str
+        Output image filename.
+    size : tuple of int
+        Bounds of the image, as (x, y, width, height).
+    tile_size : int, optional
+        Side of the tiles, in pixels.
+    processes : int, optional
+        Number of worker processes, defaults to the number of CPUs.
+
+    Returns
+    -------
+    list
+        Value returned by ``draw`` for every tile, see ``tile_viewports``
+        for their order.
+    """
+    shape = (size[3], size[2], 3)
+    shm = shared_memory.SharedMemory(create=True, size=int(np.prod(shape)))
+    try:
+        with ProcessPoolExecutor(max_workers=processes) as pool:
+            jobs = [
+                pool.submit(render_tile, draw, shm.name, size, viewport)
+                for viewport in tile_viewports(size, tile_size)
+            ]
+            results = [job.result() for job in jobs]
+
+        image = np.ndarray(shape, np.uint8, shm.buf)
+        Image.fromarray(image.copy()).save(filename)
+        del image
+    finally:
+        shm.close()
+        shm.unlink()
+    return results
@@ -4,8 +4,10 @@ import numpy as np
 
 from mortier.coords import EuclideanCoords
 from mortier.enums import HatchType
+from mortier.utils.crossings import CrossingTable
 from mortier.utils.geometry import (fill_intersect_points, outline_lines,
-                                    quadratic_bezier)
+                                    outline_rings, quadratic_bezier)
+from mortier.writer.hatching import hatch_dots, hatch_lines
 
 
 class Writer:
@@ -18,10 +20,14 @@ class Writer:
         self.filename = filename
         self.n_tiles = int(n_tiles)
         self.size = size
-        self.intersect_points = {}
+        # Region of the canvas actually drawn, None for the whole canvas
+        self.viewport = None
+        self.intersect_points = CrossingTable()
         self.ornements = None
         self.hatching = None
         self.bezier = False
+        # Draw the edges shared by two faces once, see ``welds_edges``
+        self.edges_once = False
         self.color_line = (0, 0, 0)
         self.color_bg = (0, 0, 0)
         self._colormap = None
@@ -41,51 +47,93 @@ class Writer:
         assert not (bezier and self.hatching)
         self.bezier = bezier
 
+    def welds_edges(self):
+        """
+        Whether the edges of the faces are drawn once, by ``draw_edges``.
+
+        In this mode the faces are only filled, and the tesselation draws
+        the edges of the mesh of the faces once they are all filled, so that
+        an edge shared by two faces is not drawn twice. The ornements and
+        bezier sides are offset from the edges, and still drawn per face.
+
+        Returns
+        -------
+        bool
+            True if the faces are drawn without their outline.
+        """
+        return self.edges_once and not self.ornements and not self.bezier
+
+    def draw_edges(self, mesh):
+        """
+        Draw every edge of a mesh once, chained into polylines.
+
+        Parameters
+        ----------
+        mesh : HalfEdgeMesh
+            Faces welded into a mesh.
+
+        Returns
+        -------
+        None
+        """
+        self.polylines(mesh.edge_paths(), self.color_line)
+
+    def hatch_angles(self):
+        """
+        Angles of the hatching passes.
+
+        Returns
+        -------
+        List[float]
+            Angle of the hatch lines, and the perpendicular angle when
+            cross hatching.
+        """
+        angles = [self.hatching.angle]
+        if self.hatching.crosshatch:
+            angles.append(self.hatching.angle + np.pi / 2)
+        return angles
+
+    def hatch_polygons(self, polygons, angle):
+        """
+        Hatch several polygons at once, see ``hatch_lines``.
+
+        Only the hatch lines which can cross the drawn region are computed,
+        and they are handed to ``lines`` or ``points`` in one call.
+
+        Parameters
+        ----------
+        polygons : np.ndarray or list of array-like
+            Array of shape (N, V, 2), or list of (V_i, 2) arrays, holding the
+            vertices of every polygon.
+        angle : float
+            Angle of the hatch lines, in radians.
+
+        Returns
+        -------
+        None
+        """
+        # Primitives just outside the region can still touch its pixels
+        margin = 1
+        if self.hatching.type == HatchType.DOT:
+            margin += self.hatching.radius
+        x, y, width, height = self.viewport or self.size
+        bounds = (x - margin, y - margin, width + 2 * margin, height + 2 * margin)
+
+        spacing = self.hatching.spacing
+        if self.hatching.type == HatchType.DOT:
+            dots = hatch_dots(polygons, angle, spacing, bounds)
+            self.points(dots, self.hatching.color, radius=self.hatching.radius)
+        else:
+            segments = hatch_lines(polygons, angle, spacing, bounds)
+            self.lines(segments, self.hatching.color)
+
     def hatch_fill(self, vertices, cross_hatch=None):
         angle = self.hatching.angle
         if cross_hatch:
             angle += np.pi / 2
 
-        vertices_rotated = [v.rotate(-angle) for v in vertices]
-        ys = [v.y for v in vertices_rotated]
-        y_min, y_max = min(ys), max(ys)
-
-        y = y_min + self.hatching.spacing
-        while y < y_max:
-            xs = []
-
-            for j in range(len(vertices_rotated)):
-                p0 = vertices_rotated[j]
-                p1 = vertices_rotated[(j + 1) % len(vertices_rotated)]
-
-                if p0.y == p1.y:
-                    continue
-
-                if (p0.y <= y < p1.y) or (p1.y <= y < p0.y):
-                    t = (y - p0.y) / (p1.y - p0.y)
-                    x = p0.x + t * (p1.x - p0.x)
-                    xs.append(x)
-
-            xs.sort()
-
-            for k in range(0, len(xs), 2):
-                if k + 1 >= len(xs):
-                    continue
-
-                x0, x1 = xs[k], xs[k + 1]
-
-                if not self.hatching.type == HatchType.DOT:
-                    a = EuclideanCoords([x0, y]).rotate(angle)
-                    b = EuclideanCoords([x1, y]).rotate(angle)
-                    self.line(a, b, self.hatching.color)
-                else:
-                    x = x0 + self.hatching.spacing / 2
-                    while x < x1:
-                        c = EuclideanCoords([x, y]).rotate(angle)
-                        self.point(c, self.hatching.color)
-                        x += self.hatching.spacing
-
-            y += self.hatching.spacing
+        polygon = np.array([[v.x, v.y] for v in vertices], dtype=float)
+        self.hatch_polygons([polygon], angle)
 
     def draw_outline_lines(self, points):
         pos_ring, neg_ring = outline_lines(
@@ -134,6 +182,44 @@ class Writer:
 
         return pos_ring
 
+    def draw_outline_batch(self, batch):
+        """
+        Vectorized version of ``draw_outline_lines``, for a FaceBatch.
+
+        The crossings of every face are registered and looked up at once,
+        as if the faces were drawn one by one, then the outlines of every
+        face are computed at once by ``outline_rings`` and drawn in bulk.
+
+        Parameters
+        ----------
+        batch : FaceBatch
+            Faces to draw.
+
+        Returns
+        -------
+        np.ndarray
+            Array of shape (N, V, 2) holding the inner ring of every face.
+        """
+        n_vert = batch.vertices.shape[1]
+        crossing, angles, states = self.intersect_points.register_faces(
+            batch.mid_points, batch.mid_angles, batch.vertices
+        )
+
+        pos, neg, has_neg = outline_rings(
+            batch.vertices, crossing, angles, states, self.ornements
+        )
+
+        # Same polygons as draw_outline_lines, going through the inner ring
+        # two sides at a time
+        index = [j % n_vert for i in range(0, n_vert - 1, 2) for j in (i, i + 1, i + 2)]
+        fill = self.fill_color(n_vert)
+        self.polygons(pos[:, index], fill=fill, outline=self.color_line)
+
+        neg = neg[has_neg]
+        segments = np.stack([neg[:, :2], neg[:, 1:]], axis=1).reshape(-1, 2, 2)
+        self.lines(segments, self.color_line)
+        return pos
+
     def circle(self, c, r, color=(255, 255, 255)):
         raise NotImplementedError
 
@@ -146,6 +232,89 @@ class Writer:
     def polygon(self, points, fill, outline):
         raise NotImplementedError
 
+    def points(self, points, color=(255, 255, 255), radius=0):
+        """
+        Draw several points sharing the same color.
+
+        Backends can override this to draw the points at once, the default
+        implementation forwards each point to ``point``, or to ``circle``
+        when they have a radius.
+
+        Parameters
+        ----------
+        points : np.ndarray
+            Array of shape (M, 2) holding the points.
+        color : tuple of int, optional
+            Color of the points.
+        radius : float, optional
+            Radius of the points, 0 for the smallest point of the backend.
+        """
+        for p in points.tolist():
+            if radius:
+                self.circle(EuclideanCoords(p), radius, color)
+            else:
+                self.point(EuclideanCoords(p), color)
+
+    def lines(self, segments, color=(0, 0, 0)):
+        """
+        Draw several line segments sharing the same color.
+
+        Backends can override this to draw the segments at once, the
+        default implementation forwards each segment to ``line``.
+
+        Parameters
+        ----------
+        segments : np.ndarray
+            Array of shape (S, 2, 2) holding the end points of every segment.
+        color : tuple of int, optional
+            Color of the segments.
+        """
+        for p0, p1 in segments.tolist():
+            self.line(EuclideanCoords(p0), EuclideanCoords(p1), color)
+
+    def polylines(self, paths, color=(0, 0, 0)):
+        """
+        Draw several polylines sharing the same color.
+
+        Backends can override this to draw every polyline as a single path,
+        the default implementation hands their segments to ``lines``, from
+        their lowest end point, so that the pixels of a segment do not
+        depend on the direction of the path going through it.
+
+        Parameters
+        ----------
+        paths : List[np.ndarray]
+            Array of shape (K_i, 2) holding the points of every polyline.
+        color : tuple of int, optional
+            Color of the polylines.
+        """
+        if not paths:
+            return
+        segments = np.concatenate([np.stack([p[:-1], p[1:]], axis=1) for p in paths])
+        x0, y0, x1, y1 = segments.reshape(-1, 4).T
+        swap = (x1 < x0) | ((x1 == x0) & (y1 < y0))
+        segments[swap] = segments[swap, ::-1]
+        self.lines(segments, color)
+
+    def polygons(self, coords, fill, outline):
+        """
+        Draw several polygons sharing the same style.
+
+        Backends can override this to draw a whole batch at once, the
+        default implementation forwards each polygon to ``polygon``.
+
+        Parameters
+        ----------
+        coords : np.ndarray
+            Array of shape (N, V, 2) holding the points of every polygon.
+        fill : tuple of int or None
+            Fill color shared by the polygons.
+        outline : tuple of int
+            Outline color shared by the polygons.
+        """
+        for xy in coords.tolist():
+            self.polygon([tuple(p) for p in xy], fill=fill, outline=outline)
+
     def draw_beziers(self, face):
         for i in range(0, len(face.vertices) - 2, 2):
             p0 = face.vertices[i]
@@ -155,8 +324,20 @@ class Writer:
             for j in range(len(lines) - 1):
                 self.line(lines[j], lines[j + 1], self.color_line)
 
-    def face(self, face, dotted=False):
-        n_vert = len(face.vertices)
+    def fill_color(self, n_vert):
+        """
+        Fill color of the faces with a given number of vertices.
+
+        Parameters
+        ----------
+        n_vert : int
+            Number of vertices of the face.
+
+        Returns
+        -------
+        tuple of int or None
+            RGB color picked from the colormap, None if no colormap is set.
+        """
         if n_vert not in self.polygon_fill:
             if self._colormap:
                 self.polygon_fill[n_vert] = tuple(
@@ -164,6 +345,11 @@ class Writer:
                 )
             else:
                 self.polygon_fill[n_vert] = None
+        return self.polygon_fill[n_vert]
+
+    def face(self, face, dotted=False):
+        n_vert = len(face.vertices)
+        self.fill_color(n_vert)
 
         fill_intersect_points(face, self.intersect_points)
         inside_vertices = face.vertices
@@ -177,14 +363,71 @@ class Writer:
                 xy = []
                 for i in range(n_vert + 1):
                     xy.append(tuple(face.vertices[i % n_vert].numpy()))
-                self.polygon(
-                    xy, fill=self.polygon_fill[n_vert], outline=self.color_line
-                )
+                outline = None if self.welds_edges() else self.color_line
+                if self.polygon_fill[n_vert] or outline:
+                    self.polygon(xy, fill=self.polygon_fill[n_vert], outline=outline)
         if self.hatching:
             self.hatch_fill(inside_vertices)
             if self.hatching.crosshatch:
                 self.hatch_fill(inside_vertices, self.hatching.crosshatch)
 
+    def face_batch(self, batch, dotted=False):
+        """
+        Draw every face of a FaceBatch.
+
+        Plain polygons are handed to ``polygons`` in one call, without
+        their outline when the edges are drawn once (see ``welds_edges``),
+        ornements are drawn by ``draw_outline_batch``, and the hatching is
+        handed to ``hatch_polygons`` once the faces are drawn. Bezier sides
+        fall back to ``face`` for each face of the batch.
+
+        Parameters
+        ----------
+        batch : FaceBatch
+            Faces to draw.
+        dotted : bool, optional
+            Draw the faces edges as dotted.
+        """
+        if self.bezier:
+            for face in batch.faces():
+                self.face(face, dotted=dotted)
+            return
+
+        if self.ornements:
+            coords = self.draw_outline_batch(batch)
+        else:
+            fill = self.fill_color(batch.n_vertices)
+            outline = None if self.welds_edges() else self.color_line
+            coords = batch.closed_vertices()
+            if fill or outline:
+                self.polygons(coords, fill=fill, outline=outline)
+        if self.hatching:
+            for angle in self.hatch_angles():
+                self.hatch_polygons(coords, angle)
+
+    def in_bounds_array(self, points):
+        """
+        Vectorized version of ``in_bounds``.
+
+        Parameters
+        ----------
+        points : np.ndarray
+            Array of shape (..., 2) holding [x, y] coordinates.
+
+        Returns
+        -------
+        np.ndarray
+            Boolean array of shape (...), True where the point is in bounds.
+        """
+        x = points[..., 0]
+        y = points[..., 1]
+        return (
+            (self.size[0] < x)
+            & (x < self.size[0] + self.size[2])
+            & (self.size[1] < y)
+            & (y < self.size[1] + self.size[3])
+        )
+
     def in_bounds(self, v):
         if math.isnan(v.x) or math.isnan(v.y) or math.isinf(v.x) or math.isinf(v.y):
             return False
@@ -209,3 +452,15 @@ class Writer:
 
     def new(self, filename, size=None, n_tiles=None):
         pass
+
+    def clear(self):
+        """
+        Forget what was drawn, keeping the settings of the writer.
+
+        The lace crossings are reset, backends also erase their drawing.
+
+        Returns
+        -------
+        None
+        """
+        self.intersect_points = CrossingTable()
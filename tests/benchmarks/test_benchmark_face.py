@@ -3,7 +3,9 @@ import pytest
 import numpy as np
 
 from mortier.coords import LatticeCoords, EuclideanCoords, Line
-from mortier.face import Face, P2Penrose, P3Penrose
+from mortier.face import Face, FaceBatch, P2Penrose, P3Penrose
+from mortier.writer import BitmapWriter
+from mortier.writer.hatching import hatch_dots, hatch_lines
 
 @pytest.mark.benchmark
 def test_benchmark_ray_transform():
@@ -14,3 +16,35 @@ def test_benchmark_ray_transform():
     ])
 
     result = face.ray_transform(angle=0.3)
+
+
+@pytest.mark.benchmark
+def test_benchmark_batch_ray_transform():
+    grid = np.arange(100, dtype=float)
+    offsets = np.stack(np.meshgrid(grid, grid), axis=-1).reshape(-1, 1, 2)
+    triangle = np.array([[0, 0], [1, 0], [1, 1]], dtype=float)
+    batch = FaceBatch(triangle[None] + offsets)
+
+    result = batch.ray_transform(angle=0.3)
+
+
+@pytest.mark.benchmark
+def test_benchmark_hatch_lines():
+    grid = np.arange(100, dtype=float) * 20
+    offsets = np.stack(np.meshgrid(grid, grid), axis=-1).reshape(-1, 1, 2)
+    hexagon = 10 * np.stack(
+        [np.cos(np.arange(6) * np.pi / 3), np.sin(np.arange(6) * np.pi / 3)], axis=-1
+    )
+
+    result = hatch_lines(hexagon[None] + offsets, angle=0.3, spacing=2)
+
+
+@pytest.mark.benchmark
+def test_benchmark_bitmap_hatch_dots():
+    grid = np.arange(50, dtype=float) * 40
+    offsets = np.stack(np.meshgrid(grid, grid), axis=-1).reshape(-1, 1, 2)
+    square = np.array([[0, 0], [40, 0], [40, 40], [0, 40]], dtype=float)
+    writer = BitmapWriter("bench.png", size=(0, 0, 2000, 2000))
+
+    dots = hatch_dots(square[None] + offsets, angle=0.3, spacing=2)
+    writer.points(dots, color=(255, 0, 0))
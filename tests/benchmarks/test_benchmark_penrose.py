@@ -0,0 +1,11 @@
+import pytest
+
+from mortier.face import P2Penrose, P3Penrose
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("tile_class", [P2Penrose, P3Penrose])
+def test_inflate_arrays_bench(tile_class):
+    points, codes = tile_class.to_arrays(tile_class.initialise())
+    for _ in range(10):
+        points, codes = tile_class.inflate_arrays(points, codes)
@@ -1,14 +1,14 @@
 import pytest
-import json
-import random
 
 from mortier.coords import LatticeCoords
+from mortier.database import TilingDatabase
 from mortier.face.face import Face
 from mortier.tesselation.regular_tesselation import RegularTesselation
-from mortier.writer import BitmapWriter, SVGWriter, TikzWriter
+from mortier.enums import ParamType
+from mortier.writer import BitmapWriter, FrameEncoder, SVGWriter, TikzWriter
+from mortier.writer.ornements import Ornements
 
-with open("data/database.json", "r") as file:
-    js = json.load(file)
+database = TilingDatabase()
 
 class MockWriter:
     def __init__(self):
@@ -16,10 +16,17 @@ class MockWriter:
         self.size = (0, 0, 100, 100)
         self.n_tiles = 50
         self.ornements = None
+        self.viewport = None
 
     def face(self, face, dotted=False):
         self.calls.append(("face", face, dotted))
 
+    def welds_edges(self):
+        return False
+
+    def face_batch(self, batch, dotted=False):
+        self.calls.append(("face_batch", batch, dotted))
+
     def circle(self, center, radius):
         self.calls.append(("circle", center, radius))
 
@@ -56,7 +63,7 @@ def test_draw_tesselation_bench():
     output_size = (1080, 1080)  
     writer = MockWriter()
     writer.size = (0, 0, 1080, 1080)
-    tess_dict = js['PU_4']
+    tess_dict = database['PU_4']
 
     tess = RegularTesselation(writer, tess_dict, "TestTess")
     tess.draw_tesselation()
@@ -66,10 +73,48 @@ def test_draw_tesselation_angled_bench():
     output_size = (1080, 1080)  
     writer = MockWriter()
     writer.size = (0, 0, 1080, 1080)
-    tess_dict = js['PU_4']
+    tess_dict = database['PU_4']
+
+    tess = RegularTesselation(writer, tess_dict, "TestTess")
+    tess.set_angle(0.3)
+    tess.draw_tesselation()
+
+
+@pytest.mark.benchmark
+def test_draw_tesselation_perlin_bench():
+    writer = MockWriter()
+    writer.size = (0, 0, 1080, 1080)
+    tess_dict = database['PU_4']
 
     tess = RegularTesselation(writer, tess_dict, "TestTess")
     tess.set_angle(0.3)
+    tess.set_param_mode(ParamType.PERLIN)
     tess.draw_tesselation()
 
 
+@pytest.mark.benchmark
+def test_database_lookup_bench():
+    TilingDatabase()["PU_4"]
+
+
+@pytest.mark.benchmark
+def test_animate_bench(tmp_path):
+    writer = BitmapWriter(str(tmp_path / "anim.gif"), size=(0, 0, 480, 270))
+    writer.n_tiles = 30
+
+    tess = RegularTesselation(writer, database["PU_4"], "PU_4")
+    tess.set_angle(0.3)
+    tess.set_param_mode(ParamType.CONSTANT)
+    with FrameEncoder(str(tmp_path / "anim.gif")) as encoder:
+        tess.animate(8, encoder)
+
+
+@pytest.mark.benchmark
+def test_draw_tesselation_lace_bench(tmp_path):
+    writer = BitmapWriter(str(tmp_path / "lace.png"), size=(0, 0, 1080, 1080))
+    writer.n_tiles = 20
+    writer.set_ornements(Ornements(type="laces", width=2))
+
+    tess = RegularTesselation(writer, database["PU_4"], "PU_4")
+    tess.set_angle(0.3)
+    tess.draw_tesselation()
@@ -0,0 +1,51 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+# Modules which are slow to import and only needed by some of the outputs
+HEAVY_MODULES = [
+    "PIL",
+    "svgwrite",
+    "matplotlib",
+    "hypertiling",
+    "mortier.enums.regular_tesselation_type",
+]
+
+
+def run_python(code):
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return result.stdout
+
+
+@pytest.mark.benchmark
+def test_import_main_bench():
+    run_python("import mortier.main")
+
+
+def test_import_main_skips_heavy_modules():
+    loaded = run_python(
+        "import sys\n"
+        "import mortier.main\n"
+        f"print([m for m in {HEAVY_MODULES!r} if m in sys.modules])"
+    )
+
+    assert loaded.strip() == "[]"
+
+
+def test_writers_are_imported_on_use():
+    loaded = run_python(
+        "import sys\n"
+        "from mortier.writer import BitmapWriter\n"
+        "print('PIL' in sys.modules, 'svgwrite' in sys.modules)"
+    )
+
+    assert loaded.split() == ["True", "False"]
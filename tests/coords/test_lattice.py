@@ -1,7 +1,10 @@
 import numpy as np
+import pytest
 
 from mortier.coords.euclidean_coords import EuclideanCoords
-from mortier.coords.lattice_coords import LatticeCoords
+from mortier.coords.lattice_coords import (LatticeArray, LatticeCoords,
+                                           lattice_to_plane, pack_lattice,
+                                           reduce_lattice_basis)
 
 def test_init():
     p = LatticeCoords([0, 0, 0, 1])
@@ -24,3 +27,69 @@ def toEuclidean(self):
     p1 = p.toEuclidean()
     assert p1.x == 1
     assert p1.y == 1
+
+
+def test_integer_components():
+    p = LatticeCoords([1, -2, 0, 3])
+    assert p.w.dtype == np.int64
+
+
+def test_hash_and_equality():
+    p = LatticeCoords([1, 2, 0, 1])
+    q = LatticeCoords([0, 2, 0, 1]).translate(LatticeCoords([1, 0, 0, 0]))
+
+    assert p == q
+    assert hash(p) == hash(q)
+    assert len({p, q}) == 1
+    assert p != LatticeCoords([1, 2, 0, 0])
+
+
+def test_lattice_to_plane_matches_coords():
+    w = np.array([[1, 2, 0, 1], [-3, 1, 4, -2], [0, 0, 0, 0]])
+    plane = lattice_to_plane(w)
+
+    for row, xy in zip(w, plane):
+        p = LatticeCoords(row)
+        assert xy[0] == p.x
+        assert xy[1] == p.y
+
+
+def test_pack_lattice_is_injective():
+    w = np.array([[1, 2, 0, 1], [1, 2, 1, 0], [-1, 2, 0, 1], [1, 2, 0, 1]])
+    keys = pack_lattice(w)
+
+    assert keys[0] == keys[3]
+    assert len(np.unique(keys)) == 3
+
+
+def test_pack_lattice_out_of_range():
+    with pytest.raises(ValueError):
+        pack_lattice([[1 << 20, 0, 0, 0]])
+
+
+def test_lattice_array_translate_scale():
+    a = LatticeArray([[0, 0, 0, 1], [1, 0, 0, 0]])
+    b = a.translate(LatticeCoords([0, 1, 0, 1])).scale(2)
+
+    np.testing.assert_array_equal(b.w, [[0, 2, 0, 4], [2, 2, 0, 2]])
+    np.testing.assert_array_equal(b.to_plane(), lattice_to_plane(b.w))
+
+
+
+def test_reduce_lattice_basis():
+    t1 = np.array([1, 0, 0, 0])
+    t2 = 7 * t1 + np.array([0, 0, 0, 1])
+    b1, b2 = reduce_lattice_basis(t1, t2)
+
+    p1, p2 = lattice_to_plane([b1, b2])
+    q1, q2 = lattice_to_plane([t1, t2])
+    # Same covolume, and near orthogonal short vectors
+    assert np.isclose(abs(np.linalg.det([p1, p2])), abs(np.linalg.det([q1, q2])))
+    assert p1 @ p1 <= p2 @ p2
+    assert abs(p1 @ p2) <= 0.5 * (p1 @ p1) + 1e-9
+    assert np.isclose(p2 @ p2, 1)
+
+
+def test_reduce_lattice_basis_degenerate():
+    b1, b2 = reduce_lattice_basis([0, 0, 0, 0], [0, 0, 0, 0])
+    assert not b1.any() and not b2.any()
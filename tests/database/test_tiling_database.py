@@ -0,0 +1,80 @@
+import json
+
+import numpy as np
+import pytest
+
+from mortier.database import TilingDatabase, compile_database
+from mortier.enums import RegularTesselationType
+from mortier.tesselation import RegularTesselation
+
+
+@pytest.fixture
+def database(tmp_path):
+    js = {
+        "b": {"T1": [1, 0, 0, 0], "T2": [0, 0, 0, 1], "Seed": [[0, 0, 0, 0]]},
+        "a": {
+            "T1": [2, 0, -1, 0],
+            "T2": [-1, 0, 2, 0],
+            "Seed": [[0, 0, 0, 0], [0, 0, 1, 0], [-1, 0, 1, 0]],
+        },
+    }
+    source = tmp_path / "database.json"
+    source.write_text(json.dumps(js))
+    compile_database(str(source), str(tmp_path / "database"))
+    return js, TilingDatabase(str(tmp_path / "database"))
+
+
+def test_entries_match_json(database):
+    js, db = database
+
+    assert len(db) == 2
+    assert db.keys() == ["a", "b"]
+    for name, tess in js.items():
+        entry = db[name]
+        assert {k: entry[k] for k in tess} == tess
+
+
+def test_entries_hold_prototype_faces(database):
+    js, db = database
+
+    for name, tess in js.items():
+        faces = RegularTesselation(None, tess, name).prototype_faces()
+        assert len(db[name]["Faces"]) == len(faces)
+        for compiled, face in zip(db[name]["Faces"], faces):
+            np.testing.assert_array_equal(compiled, face)
+
+
+def test_missing_entry(database):
+    _, db = database
+
+    assert "c" not in db
+    assert db.get("c") is None
+    with pytest.raises(KeyError):
+        db["c"]
+
+
+def test_random_id(database):
+    _, db = database
+
+    assert db.random_id() in ("a", "b")
+
+
+def test_tiling_type(database):
+    _, db = database
+
+    tiling_type = db.tiling_type()
+    assert [t.value for t in tiling_type] == ["a", "b"]
+    assert db[tiling_type.a] == db["a"]
+    assert db.tiling_type() is tiling_type
+
+
+def test_compiled_database_is_up_to_date():
+    with open("data/database.json", "r") as file:
+        js = json.load(file)
+    db = TilingDatabase()
+
+    assert db.keys() == sorted(js)
+    for name, tess in js.items():
+        entry = db[name]
+        assert {k: entry[k] for k in tess} == tess
+    assert all(t.value in db for t in RegularTesselationType)
@@ -0,0 +1,97 @@
+import numpy as np
+import pytest
+
+from mortier.coords import EuclideanCoords
+from mortier.face import Face, FaceBatch
+
+
+def square(x, y):
+    return [
+        EuclideanCoords([x, y]),
+        EuclideanCoords([x + 1, y]),
+        EuclideanCoords([x + 1, y + 1]),
+        EuclideanCoords([x, y + 1]),
+    ]
+
+
+def test_from_faces_groups_by_vertex_count():
+    faces = [
+        Face(square(0, 0)),
+        Face([EuclideanCoords([0, 0]), EuclideanCoords([1, 0]), EuclideanCoords([1, 1])]),
+        Face(square(2, 0)),
+    ]
+
+    batches = FaceBatch.from_faces(faces)
+
+    assert [len(b) for b in batches] == [2, 1]
+    assert [b.n_vertices for b in batches] == [4, 3]
+    assert batches[0].vertices.shape == (2, 4, 2)
+
+
+def test_face_round_trip():
+    face = Face(square(2, 3))
+    batch = FaceBatch.from_faces([face])[0]
+
+    out = batch.face(0)
+
+    assert isinstance(out, Face)
+    for v, w in zip(face.vertices, out.vertices):
+        assert v.x == w.x and v.y == w.y
+
+
+def test_closed_vertices():
+    batch = FaceBatch.from_faces([Face(square(0, 0))])[0]
+    closed = batch.closed_vertices()
+
+    assert closed.shape == (1, 5, 2)
+    np.testing.assert_array_equal(closed[:, 0], closed[:, -1])
+
+
+@pytest.mark.parametrize("separated_site", [False, 3])
+@pytest.mark.parametrize("assym", [False, 0.2])
+@pytest.mark.parametrize("param_mode", [False, "sin"])
+def test_ray_transform_matches_face(separated_site, assym, param_mode):
+    faces = [
+        Face(
+            square(x, y),
+            param_mode=param_mode,
+            assym_mode=assym,
+            separated_site_mode=separated_site,
+        )
+        for x, y in [(0.0, 0.0), (3.0, 1.0), (1.5, 7.25)]
+    ]
+    batch = FaceBatch.from_faces(faces)[0]
+
+    out = batch.ray_transform(0.3, [0, 0, 10, 10], [0, 1])
+
+    for i, face in enumerate(faces):
+        expected = face.ray_transform(0.3, [0, 0, 10, 10], [0, 1])
+        got = out.face(i)
+        assert len(got.vertices) == len(expected.vertices)
+        for v, w in zip(expected.vertices, got.vertices):
+            assert v.x == w.x and v.y == w.y
+        for (p, a), (q, b) in zip(expected.mid_points, got.mid_points):
+            assert p.x == q.x and p.y == q.y and a == b
+
+
+def test_ray_transform_clips_convex_batches():
+    batch = FaceBatch.from_faces([Face(square(0, 0))])[0]
+    batch.convex = True
+
+    out = batch.ray_transform(1.2)
+
+    assert out.convex
+    np.testing.assert_array_equal(out.mid_angles, 0.5)
+
+
+def test_cull_keeps_faces_touching_bounds():
+    faces = [Face(square(x, 0)) for x in [-3, -0.5, 2, 5, 13]]
+    batch = FaceBatch.from_faces(faces)[0]
+
+    mask = batch.visible([0, 0, 10, 10])
+    assert mask.tolist() == [False, True, True, True, False]
+
+    culled = batch.cull([0, 0, 10, 10], margin=2)
+    assert len(culled) == 4
+    assert culled.vertices[0, 0, 0] == -3
+    assert culled.mid_points.shape[0] == 4
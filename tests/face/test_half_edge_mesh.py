@@ -0,0 +1,151 @@
+import numpy as np
+
+from mortier.coords import EuclideanCoords
+from mortier.face import Face, FaceBatch, HalfEdgeMesh
+from mortier.face.half_edge_mesh import unique_segments, weld
+
+
+def square(x, y):
+    return [[x, y], [x + 1, y], [x + 1, y + 1], [x, y + 1]]
+
+
+def grid(n):
+    return [square(x, y) for x in range(n) for y in range(n)]
+
+
+def test_weld_merges_rounded_points():
+    points = np.array([[0, 0], [1, 1], [0.001, -0.001], [np.nan, 0], [1, 1.004]])
+
+    ids, welded = weld(points)
+
+    assert ids.tolist() == [0, 1, 0, -1, 1]
+    assert welded.tolist() == [[0, 0], [1, 1]]
+
+
+def test_grid_is_welded():
+    mesh = HalfEdgeMesh.from_polygons(grid(3))
+
+    assert mesh.n_faces == 9
+    assert len(mesh.points) == 16
+    assert len(mesh.origin) == 36
+    assert len(mesh.edges()) == 24
+    # 12 sides shared by two squares, the 12 others on the border
+    assert np.count_nonzero(mesh.twin >= 0) == 24
+
+
+def test_twins_go_backward():
+    mesh = HalfEdgeMesh.from_polygons(grid(3))
+
+    h = np.flatnonzero(mesh.twin >= 0)
+    twin = mesh.twin[h]
+    assert np.array_equal(mesh.twin[twin], h)
+    assert np.array_equal(mesh.origin[twin], mesh.destination[h])
+    assert np.array_equal(mesh.destination[twin], mesh.origin[h])
+    assert np.all(mesh.face[twin] != mesh.face[h])
+
+
+def test_face_loops_follow_the_polygons():
+    polygons = grid(2)
+    mesh = HalfEdgeMesh.from_polygons(polygons)
+
+    for f, polygon in enumerate(polygons):
+        assert mesh.points[mesh.face_loop(f)].tolist() == polygon
+        h = np.arange(mesh.face_start[f], mesh.face_start[f + 1])
+        assert np.array_equal(mesh.next[h], np.roll(h, -1))
+
+
+def test_closing_vertex_and_invalid_faces_are_dropped():
+    closed = np.array([square(0, 0) + [[0, 0]], square(1, 0) + [[1, 0]]], float)
+    closed[1, 2] = np.nan
+
+    mesh = HalfEdgeMesh.from_polygons(closed)
+
+    assert mesh.face_start.tolist() == [0, 4, 4]
+    assert np.all(mesh.twin == -1)
+
+
+def test_from_batches_and_faces():
+    faces = [Face([EuclideanCoords(p) for p in s]) for s in grid(2)]
+    batches = FaceBatch.from_faces(faces[:3])
+
+    mesh = HalfEdgeMesh.from_batches(batches, faces[3:])
+
+    assert mesh.n_faces == 4
+    assert len(mesh.edges()) == 12
+
+
+def test_edge_paths_cover_every_edge_once():
+    polygons = grid(4) + [[[4, 0], [5, 0], [4.5, 1]]]
+    mesh = HalfEdgeMesh.from_polygons(polygons)
+
+    paths = mesh.edge_paths()
+
+    segments = np.concatenate([np.stack([p[:-1], p[1:]], axis=1) for p in paths])
+    assert len(segments) == len(mesh.edges())
+    assert len(unique_segments(segments)) == len(segments)
+    assert len(paths) < len(segments) / 4
+
+
+def test_edge_paths_go_straight_across_vertices():
+    paths = HalfEdgeMesh.from_polygons(grid(3)).edge_paths()
+
+    # The inner lines of the grid are not broken at the crossings
+    lengths = [np.abs(np.diff(p, axis=0)).sum() for p in paths]
+    assert max(lengths) >= 3
+
+
+def test_unique_segments_ignores_direction():
+    segments = np.array(
+        [
+            [[0, 0], [1, 0]],
+            [[1, 0], [0, 0]],
+            [[0, 0], [0, 1]],
+            [[2, 2], [2, 2.001]],
+            [[0, 1], [0.001, 0]],
+        ]
+    )
+
+    assert unique_segments(segments).tolist() == [[[0, 0], [1, 0]], [[0, 0], [0, 1]]]
+
+
+def test_empty_mesh():
+    mesh = HalfEdgeMesh.from_polygons([])
+
+    assert mesh.n_faces == 0
+    assert mesh.edge_segments().shape == (0, 2, 2)
+    assert mesh.edge_paths() == []
+    start, neighbors = mesh.face_neighbors()
+    assert start.tolist() == [0]
+    assert neighbors.tolist() == []
+
+
+def test_face_neighbors_share_a_vertex():
+    mesh = HalfEdgeMesh.from_polygons(grid(3))
+
+    start, neighbors = mesh.face_neighbors()
+
+    assert np.diff(start).tolist() == [3, 5, 3, 5, 8, 5, 3, 5, 3]
+    # Squares are listed column after column, the middle one is 4
+    assert neighbors[start[0] : start[1]].tolist() == [1, 3, 4]
+    assert 4 not in neighbors[start[4] : start[5]]
+
+
+def test_face_neighbors_by_edge():
+    mesh = HalfEdgeMesh.from_polygons(grid(3))
+
+    start, neighbors = mesh.face_neighbors(by_edge=True)
+
+    assert np.diff(start).tolist() == [2, 3, 2, 3, 4, 3, 2, 3, 2]
+    assert neighbors[start[4] : start[5]].tolist() == [1, 3, 5, 7]
+
+
+def test_face_neighbors_scale_with_the_faces():
+    mesh = HalfEdgeMesh.from_polygons(grid(200))
+
+    start, neighbors = mesh.face_neighbors()
+
+    assert len(start) == 200 * 200 + 1
+    # Every pair is listed in both directions
+    first = np.repeat(np.arange(mesh.n_faces), np.diff(start))
+    pairs = set(zip(first.tolist(), neighbors.tolist()))
+    assert all((b, a) in pairs for a, b in pairs)
@@ -1,6 +1,7 @@
+import numpy as np
 import pytest
 from mortier.coords import EuclideanCoords
-from mortier.face import Face
+from mortier.face import Face, FaceBatch
 from mortier.tesselation import HyperbolicTesselation
 
 
@@ -66,27 +67,40 @@ def test_set_draw_unit_circle(hyperbolic_tess):
     assert tess.draw_unit_circle is False
 
 
-def test_tesselate_face_creates_faces(hyperbolic_tess):
+def test_tesselate_face_creates_batches(hyperbolic_tess):
     tess, _ = hyperbolic_tess
     tess.tesselate_face()
-    assert len(tess.faces) > 0
-    # All faces are Face instances
-    assert all(isinstance(f, Face) for f in tess.faces)
-    # Vertices are EuclideanCoords
-    for f in tess.faces:
-        for v in f.vertices:
-            assert isinstance(v, EuclideanCoords)
+    assert tess.faces == []
+    assert len(tess.batches) == 1
+    batch = tess.batches[0]
+    assert isinstance(batch, FaceBatch)
+    assert len(batch) == len(tess.tess)
+    assert batch.n_vertices == 7
 
 
-def test_convert_to_half_plane(hyperbolic_tess):
+def test_tesselate_face_matches_faces(hyperbolic_tess):
     tess, _ = hyperbolic_tess
     tess.tesselate_face()
-    original_vertices = [v.vertices.copy() for v in tess.faces]
+    center = EuclideanCoords([50, 50])
+
+    for polygon, vertices in zip(tess.tess, tess.batches[0].vertices):
+        face = Face([EuclideanCoords([p.real, p.imag]) for p in polygon[1:]])
+        face = face.scale(tess.scale).translate(center)
+        expected = [(v.x, v.y) for v in face.vertices]
+        np.testing.assert_allclose(vertices, expected, atol=1e-9)
+
+
+def test_tesselate_face_half_plane(hyperbolic_tess):
+    tess, _ = hyperbolic_tess
     tess.half_plane = True
-    tess.convert_to_half_plane()
-    # Vertices changed after half-plane conversion
-    for f, orig in zip(tess.faces, original_vertices):
-        assert f.vertices != orig
+    tess.tesselate_face()
+    center = EuclideanCoords([50, 0])
+
+    for polygon, vertices in zip(tess.tess, tess.batches[0].vertices):
+        face = Face([EuclideanCoords([p.real, p.imag]) for p in polygon[1:]])
+        face = face.half_plane().scale(tess.scale).translate(center)
+        expected = [(v.x, v.y) for v in face.vertices]
+        np.testing.assert_allclose(vertices, expected, atol=1e-9)
 
 
 def test_refine_tiling_calls_tesselate(hyperbolic_tess, monkeypatch):
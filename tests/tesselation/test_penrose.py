@@ -1,7 +1,8 @@
 import pytest
 import numpy as np
 from mortier.coords import EuclideanCoords
-from mortier.face import Face, P2Penrose, P3Penrose
+from mortier.face import Face, FaceBatch, P2Penrose, P3Penrose
+from mortier.face.half_edge_mesh import unique_segments
 from mortier.tesselation.penrose import PenroseTesselation
 from mortier.enums import TileType
 
@@ -10,6 +11,8 @@ class MockWriter:
     def __init__(self):
         self.calls = []
         self.size = (0, 0, 100, 100)
+        self.viewport = None
+        self.ornements = None
         self.n_tiles = 1
         self.lacing_mode = False
         self.bands_mode = False
@@ -17,6 +20,9 @@ class MockWriter:
     def face(self, face, dotted=False):
         self.calls.append(("face", face, dotted))
 
+    def welds_edges(self):
+        return False
+
     def point(self, p):
         self.calls.append(("point", p))
 
@@ -69,21 +75,26 @@ def test_tesselate_face_creates_faces(penrose_tess_p2):
 
     tess.tesselate_face()
     # After inflation and merging, faces should be added
-    assert len(tess.faces) > 0
-    # All faces should be instances of Face
-    assert all(isinstance(f, Face) for f in tess.faces)
+    assert sum(len(b) for b in tess.batches) > 0
+    # All faces should be stored in convex batches
+    assert all(isinstance(b, FaceBatch) and b.convex for b in tess.batches)
     # All faces should have 3 or 4 vertices (triangles may be merged)
-    for f in tess.faces:
-        assert len(f.vertices) in (3, 4)
+    for b in tess.batches:
+        assert b.n_vertices in (3, 4)
 
 
 def test_face_vertices_orientation(penrose_tess_p2):
     tess, _ = penrose_tess_p2
+    tess.angle = 0.2
     tess.tesselate_face()
     # Ensure vertices are EuclideanCoords instances
-    for f in tess.faces:
+    for f in tess.batches[0].faces():
         for v in f.vertices:
             assert isinstance(v, EuclideanCoords)
+        # Faces are oriented as Face would orient them
+        assert [(v.x, v.y) for v in Face(f.vertices).vertices] == [
+            (v.x, v.y) for v in f.vertices
+        ]
 
 
 def test_state_setters_inherited(penrose_tess_p2):
@@ -95,3 +106,86 @@ def test_state_setters_inherited(penrose_tess_p2):
     assert tess.assym_angle == 0.2
     assert tess.separated_site_mode is True
 
+
+
+@pytest.mark.parametrize("tile_class", [P2Penrose, P3Penrose])
+def test_inflate_arrays_matches_inflate(tile_class):
+    pen = tile_class.initialise(length=100, p=EuclideanCoords([50, 50]))
+    points, codes = tile_class.to_arrays(pen)
+
+    for _ in range(4):
+        pen = [t for p in pen for t in p.inflate()]
+        points, codes = tile_class.inflate_arrays(points, codes)
+
+    expected_points, expected_codes = tile_class.to_arrays(pen)
+    np.testing.assert_array_equal(points, expected_points)
+    np.testing.assert_array_equal(codes, expected_codes)
+
+    tiles = tile_class.from_arrays(points, codes)
+    assert all(isinstance(t, tile_class) for t in tiles)
+    assert tiles[3].code == pen[3].code
+    assert tiles[3].B.x == pen[3].B.x
+
+
+def test_draw_frame_draws_inflated_edges(penrose_tess_p2):
+    tess, writer = penrose_tess_p2
+    tess.level = 2
+    tess.tesselate_face()
+
+    # The level 0 tiles are kept, the inflated ones are stored as arrays
+    assert len(tess.pen) == 10
+    assert tess.points.shape == (len(tess.codes), 3, 2)
+    assert writer.calls == []
+
+    tess.draw_frame()
+
+    lines = [call for call in writer.calls if call[0] == "line"]
+    assert len(lines) == 2 * len(tess.codes)
+
+
+def test_draw_frame_draws_shared_edges_once(penrose_tess_p2):
+    tess, writer = penrose_tess_p2
+    tess.level = 2
+    tess.tesselate_face()
+    writer.welds_edges = lambda: True
+    writer.lines = lambda segments: writer.calls.append(("lines", segments))
+    writer.draw_edges = lambda mesh: writer.calls.append(("edges", mesh))
+
+    tess.draw_frame()
+
+    (segments,) = [call[1] for call in writer.calls if call[0] == "lines"]
+    # The triangles pair into faces, whose sides are shared
+    assert len(tess.codes) < len(segments) < 2 * len(tess.codes)
+    assert len(unique_segments(segments)) == len(segments)
+    assert not any(call[0] == "line" for call in writer.calls)
+
+
+def test_pair_triangles_matches_shared_sides():
+    a = [0.0, 0.0]
+    c = [1.0, 0.0]
+    points = np.array(
+        [
+            [a, [0.5, 1.0], c],
+            [[5.0, 5.0], [6.0, 5.0], [5.0, 6.0]],
+            # Same AC side, given as CA and with rounding noise
+            [[1.0 + 1e-12, 0.0], [0.5, -1.0], [0.0, -1e-12]],
+            [[5.0, 5.0], [6.0, 6.0], [7.0, 7.0]],
+        ]
+    )
+    first, second = PenroseTesselation.pair_triangles(points)
+    assert first.tolist() == [0]
+    assert second.tolist() == [2]
+
+
+def test_pair_triangles_across_grid_lines():
+    # Both points are equal up to 1e-12 but round to different grid cells
+    p = 0.5e-4
+    points = np.array(
+        [
+            [[p - 1e-12, 0.0], [0.0, 1.0], [1.0, 1.0]],
+            [[p + 1e-12, 0.0], [2.0, 1.0], [1.0, 1.0]],
+        ]
+    )
+    first, second = PenroseTesselation.pair_triangles(points)
+    assert first.tolist() == [0]
+    assert second.tolist() == [1]
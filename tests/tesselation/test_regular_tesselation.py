@@ -1,6 +1,6 @@
 import pytest
 from mortier.coords import LatticeCoords
-from mortier.face.face import Face
+from mortier.face import Face, FaceBatch
 from mortier.tesselation.regular_tesselation import RegularTesselation
 import numpy as np
 
@@ -12,10 +12,18 @@ class MockWriter:
         self.n_tiles = 1
         self.lacing_mode = False
         self.bands_mode = False
+        self.ornements = None
+        self.viewport = None
 
     def face(self, face, dotted=False):
         self.calls.append(("face", face, dotted))
 
+    def welds_edges(self):
+        return False
+
+    def face_batch(self, batch, dotted=False):
+        self.calls.append(("face_batch", batch, dotted))
+
     def point(self, p):
         self.calls.append(("point", p))
 
@@ -109,9 +117,214 @@ def test_tesselate_face_adds_faces(tessellation):
     # Override find_corners to fixed small range
     tess.find_corners = lambda: (0, 1, 0, 1)
     tess.tesselate_face()
-    assert len(tess.faces) > 0
-    # All faces added should be Face instances
-    assert all(isinstance(f, Face) for f in tess.faces)
+    assert len(tess.batches) > 0
+    # All faces are stored as batches of translated prototypes
+    assert all(isinstance(b, FaceBatch) for b in tess.batches)
+    assert sum(len(b) for b in tess.batches) > 0
+
+
+def test_tesselate_face_batches_match_lattice_coords(tessellation):
+    tess, writer = tessellation
+    tess.find_corners = lambda: (-1, 2, -1, 2)
+    tess.tesselate_face()
+
+    for batch in tess.batches:
+        assert batch.vertices.shape[1:] == (batch.n_vertices, 2)
+
+    # Every translated vertex lies on the lattice spanned by the seed
+    s = LatticeCoords(tess.seed[0])
+    p = s.translate(tess.T1.scale(1).translate(tess.T2.scale(-1)))
+    found = any(
+        np.any(np.all(b.vertices == [p.x, p.y], axis=-1)) for b in tess.batches
+    )
+    assert found
+
+
+def test_translation_key_is_translation_invariant():
+    writer = MockWriter()
+    tess_dict = {
+        "T1": [2, 0, -1, 0],
+        "T2": [-1, 0, 2, 0],
+        "Seed": [[0, 0, 0, 0], [0, 0, 1, 0]],
+    }
+    tess = RegularTesselation(writer, tess_dict, "t1001")
+    face = Face.generate(LatticeCoords([0, 0, 1, 0]), 0, 6)
+
+    for x, y in [(1, 0), (0, 1), (-3, 2)]:
+        t = tess.T1.scale(x).translate(tess.T2.scale(y))
+        moved = Face([v.translate(t) for v in face.vertices])
+        assert tess.translation_key(moved) == tess.translation_key(face)
+
+    other = Face.generate(LatticeCoords([0, 0, 0, 0]), 0, 6)
+    assert tess.translation_key(other) != tess.translation_key(face)
+
+
+def test_tesselate_face_skips_translated_duplicates():
+    tess_dict = {
+        "T1": [2, 0, -1, 0],
+        "T2": [-1, 0, 2, 0],
+        "Seed": [[0, 0, 0, 0], [0, 0, 1, 0]],
+    }
+    tess = RegularTesselation(MockWriter(), tess_dict, "t1001")
+    tess.find_corners = lambda: (0, 2, 0, 2)
+    tess.tesselate_face()
+    n_faces = sum(len(b) for b in tess.batches)
+
+    # Seeds listed again up to a lattice translation yield the same faces
+    tess_dict = dict(tess_dict)
+    tess_dict["Seed"] = tess_dict["Seed"] + [[-1, 0, 2, 0], [1, 0, -1, 0]]
+    tess = RegularTesselation(MockWriter(), tess_dict, "t1001")
+    tess.find_corners = lambda: (0, 2, 0, 2)
+    tess.tesselate_face()
+    assert sum(len(b) for b in tess.batches) == n_faces
+
+
+def test_tesselate_face_uses_precomputed_faces():
+    tess_dict = {
+        "T1": [2, 0, -1, 0],
+        "T2": [-1, 0, 2, 0],
+        "Seed": [[0, 0, 0, 0], [0, 0, 1, 0]],
+    }
+    tess = RegularTesselation(MockWriter(), tess_dict, "t1001")
+    faces = tess.prototype_faces()
+    tess.tesselate_face()
+
+    compiled = dict(tess_dict, Faces=[f.tolist() for f in faces])
+    precomputed = RegularTesselation(MockWriter(), compiled, "t1001")
+    precomputed.prototype_faces = None
+    precomputed.tesselate_face()
+
+    assert precomputed.prototype_bounds == tess.prototype_bounds
+    assert len(precomputed.batches) == len(tess.batches)
+    for a, b in zip(precomputed.batches, tess.batches):
+        np.testing.assert_array_equal(a.vertices, b.vertices)
+
+
+def test_draw_tesselation_uses_face_batch(tessellation):
+    tess, writer = tessellation
+    tess.find_corners = lambda: (0, 1, 0, 1)
+    writer.ornements = None
+    writer.set_caption = lambda caption: None
+    tess.draw_tesselation()
+    assert any(call[0] == "face_batch" for call in writer.calls)
+
+
+def test_draw_tesselation_culls_faces_outside_canvas(tessellation):
+    tess, writer = tessellation
+    tess.translations = lambda: np.array([[0, 0, 0, 0], [500, 0, 0, 0]])
+    writer.set_caption = lambda caption: None
+    tess.draw_tesselation()
+
+    drawn = [call[1] for call in writer.calls if call[0] == "face_batch"]
+    assert tess.n_faces_culled > 0
+    assert tess.n_faces_kept == sum(len(b) for b in drawn)
+    for batch in drawn:
+        assert np.all(batch.visible(writer.size, tess.cull_margin()))
+
+
+def test_draw_tesselation_culls_faces_before_the_ray_transform(
+    tessellation, monkeypatch
+):
+    tess, writer = tessellation
+    tess.translations = lambda: np.array([[0, 0, 0, 0], [500, 0, 0, 0]])
+    writer.set_caption = lambda caption: None
+    tess.set_angle(0.4)
+    transformed = []
+    ray_transform = FaceBatch.ray_transform
+
+    def record(batch, *args):
+        transformed.append(len(batch))
+        return ray_transform(batch, *args)
+
+    monkeypatch.setattr(FaceBatch, "ray_transform", record)
+    tess.draw_tesselation()
+
+    # The translated copies far from the canvas are never transformed
+    assert sum(transformed) == tess.n_faces_kept
+    assert tess.n_faces_culled == sum(len(b) for b in tess.batches) - sum(transformed)
+
+
+def test_draw_tesselation_counts_underlying_faces_once(tessellation):
+    tess, writer = tessellation
+    tess.translations = lambda: np.array([[0, 0, 0, 0], [500, 0, 0, 0]])
+    writer.set_caption = lambda caption: None
+    tess.draw_tesselation()
+    counts = tess.n_faces_kept, tess.n_faces_culled
+
+    tess.n_faces_kept = tess.n_faces_culled = 0
+    writer.calls = []
+    tess.set_show_underlying(True)
+    tess.draw_tesselation()
+
+    dotted = [call for call in writer.calls if call[0] == "face_batch" and call[2]]
+    assert len(dotted) > 0
+    assert (tess.n_faces_kept, tess.n_faces_culled) == counts
+
+
+def test_draw_tesselation_draws_edges_once(tessellation):
+    tess, writer = tessellation
+    tess.translations = lambda: np.array([[0, 0, 0, 0], [1, 0, 0, 0], [0, 1, 0, 0]])
+    writer.set_caption = lambda caption: None
+    writer.welds_edges = lambda: True
+    writer.draw_edges = lambda mesh: writer.calls.append(("edges", mesh))
+    tess.draw_tesselation()
+
+    drawn = [call[1] for call in writer.calls if call[0] == "face_batch"]
+    meshes = [call[1] for call in writer.calls if call[0] == "edges"]
+    assert len(meshes) == 1
+    assert meshes[0].n_faces == sum(len(b) for b in drawn)
+    # Neighbouring faces share their sides
+    assert len(meshes[0].edges()) < len(meshes[0].origin)
+
+
+def test_fill_neighbor_matches_shared_vertices(tessellation):
+    tess, _ = tessellation
+    # Squares of a 3 x 3 grid, split in two batches
+    squares = np.array(
+        [
+            [[x, y], [x + 1, y], [x + 1, y + 1], [x, y + 1]]
+            for x in range(3)
+            for y in range(3)
+        ],
+        dtype=float,
+    )
+    tess.batches = [FaceBatch(squares[:4]), FaceBatch(squares[4:])]
+
+    start, neighbors = tess.fill_neighbor()
+
+    assert np.diff(start).tolist() == [3, 5, 3, 5, 8, 5, 3, 5, 3]
+    assert neighbors[start[0] : start[1]].tolist() == [1, 3, 4]
+    assert 4 not in neighbors[start[4] : start[5]]
+    # Face to vertex IDs, four per square
+    assert np.diff(tess.mesh.face_start).tolist() == [4] * 9
+
+    start, neighbors = tess.fill_neighbor(by_edge=True)
+
+    assert neighbors[start[4] : start[5]].tolist() == [1, 3, 5, 7]
+
+
+def test_translations_cover_visible_region():
+    writer = MockWriter()
+    tess_dict = {
+        "T1": [-1, 0, 2, 3],
+        "T2": [2, 3, -1, -3],
+        "Seed": [[0, 0, 0, 0]],
+    }
+    tess = RegularTesselation(writer, tess_dict, "t1003")
+    writer.n_tiles = 10
+    tess.prototype_bounds = (-1, -1, 1, 1)
+
+    x_min, y_min, x_max, y_max = tess.visible_region()
+    found = {tuple(t) for t in tess.translations().tolist()}
+
+    # Brute force over a box much larger than the canvas
+    expected = set()
+    for i in range(-30, 30):
+        for j in range(-30, 30):
+            t = tess.B1.scale(i).translate(tess.B2.scale(j))
+            if x_min <= t.x <= x_max and y_min <= t.y <= y_max:
+                expected.add(t.key)
+    assert found == expected
 
 
 def test_find_corners_bounds(tessellation):
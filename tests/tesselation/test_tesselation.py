@@ -9,10 +9,14 @@ class MockWriter:
         self.calls = []
         self.size = (0, 0, 100, 100)
         self.ornements = None
+        self.viewport = None
 
     def face(self, face, dotted=False):
         self.calls.append(("face", face, dotted))
 
+    def welds_edges(self):
+        return False
+
     def circle(self, center, radius):
         self.calls.append(("circle", center, radius))
 
@@ -101,3 +105,32 @@ def test_set_angle():
     writer = MockWriter()
     tess = Tesselation(writer)
     tess.set_angle(angle = 0.2)
+
+
+def test_animate_tesselates_once():
+    writer = MockWriter()
+    writer.clear = lambda: writer.calls.append(("clear",))
+    writer.region = lambda: "image"
+    tess = Tesselation(writer)
+    tess.tesselate_face = lambda: writer.calls.append(("tesselate",))
+    tess.draw_frame = lambda frame_num: writer.calls.append(("frame", frame_num))
+
+    class Encoder:
+        frames = []
+
+        def add(self, image):
+            self.frames.append(image)
+
+    encoder = Encoder()
+    tess.animate(3, encoder)
+
+    assert writer.calls == [
+        ("tesselate",),
+        ("clear",),
+        ("frame", [0, 3]),
+        ("clear",),
+        ("frame", [1, 3]),
+        ("clear",),
+        ("frame", [2, 3]),
+    ]
+    assert encoder.frames == ["image"] * 3
@@ -0,0 +1,97 @@
+import json
+
+from click.testing import CliRunner
+
+from mortier.batch import batch, job_arguments, read_jobs, run_batch, run_job
+
+
+def test_job_arguments():
+    job = {
+        "tess_id": "t3006",
+        "angle": 0.4,
+        "lace": True,
+        "bands": False,
+        "colormap": None,
+        "output_size": [300, 200],
+    }
+
+    args = job_arguments(job)
+
+    assert args == [
+        "--tess_id",
+        "t3006",
+        "--angle",
+        "0.4",
+        "--lace",
+        "--output_size",
+        "300",
+        "200",
+    ]
+
+
+def test_read_jobs_skips_blank_lines():
+    lines = ['{"tess_id": "t3006"}\n', "\n", '{"scale": 20}\n']
+
+    assert read_jobs(lines) == [{"tess_id": "t3006"}, {"scale": 20}]
+
+
+def test_run_job_renders_output(tmp_path):
+    output = str(tmp_path / "img")
+    job = {"tess_id": "t3006", "output": output, "output_size": [64, 48]}
+
+    report = run_job(3, job)
+
+    assert report["job"] == 3
+    assert report["status"] == "ok"
+    assert report["time"] >= 0
+    assert report["faces_drawn"] > 0
+    assert (tmp_path / "img.png").exists()
+
+
+def test_run_job_reports_errors(tmp_path):
+    report = run_job(0, {"tess_id": "not_a_tiling", "output": str(tmp_path / "a")})
+
+    assert report["status"] == "error"
+    assert "--tess_id" in report["error"]
+
+
+def test_run_batch_reports_every_job(tmp_path):
+    jobs = [
+        {"tess_id": tess_id, "output": str(tmp_path / tess_id), "output_size": [64, 48]}
+        for tess_id in ["t3006", "PU_4", "t2005"]
+    ]
+
+    reports = list(run_batch(jobs, processes=2))
+
+    assert sorted(r["job"] for r in reports) == [0, 1, 2]
+    assert all(r["status"] == "ok" for r in reports)
+    assert all((tmp_path / f"{j['tess_id']}.png").exists() for j in jobs)
+
+
+def test_run_batch_cancels_queued_jobs_when_closed(tmp_path):
+    jobs = [
+        {"tess_id": "t3006", "output": str(tmp_path / str(i)), "output_size": [64, 48]}
+        for i in range(12)
+    ]
+
+    reports = run_batch(jobs, processes=1)
+    next(reports)
+    reports.close()
+
+    assert len(list(tmp_path.glob("*.png"))) < len(jobs)
+
+
+def test_batch_command(tmp_path):
+    jobs = tmp_path / "jobs.jsonl"
+    jobs.write_text(
+        json.dumps({"tess_id": "t3006", "output": str(tmp_path / "ok"), "scale": 20})
+        + "\n"
+        + json.dumps({"scale": "big", "output": str(tmp_path / "bad")})
+        + "\n"
+    )
+
+    result = CliRunner().invoke(batch, [str(jobs), "--processes", "1"])
+
+    reports = [json.loads(line) for line in result.stdout.splitlines()]
+    assert result.exit_code == 1
+    assert {r["status"] for r in reports} == {"ok", "error"}
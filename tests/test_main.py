@@ -0,0 +1,24 @@
+from mortier.main import LazyChoice
+
+
+def test_lazy_choice_lists_choices_on_first_access():
+    calls = []
+
+    def list_choices():
+        calls.append(1)
+        return ["a", "b"]
+
+    choice = LazyChoice(list_choices)
+
+    assert calls == []
+    assert choice.choices == ("a", "b")
+    assert choice.convert("b", None, None) == "b"
+    assert calls == [1]
+
+
+def test_lazy_choice_choices_can_be_set():
+    choice = LazyChoice(lambda: ["a"])
+
+    choice.choices = ["c"]
+
+    assert choice.choices == ("c",)
@@ -0,0 +1,117 @@
+import numpy as np
+
+from mortier.coords import EuclideanCoords
+from mortier.utils.crossings import CrossingTable, crossing_states, quantize
+
+
+def reference_faces(mid_points, mid_angles, vertices):
+    """Crossings keyed by the rounded string of the points, face after face."""
+    table = {}
+    crossing = np.zeros(vertices.shape[:2], dtype=bool)
+    angles = np.zeros(vertices.shape[:2])
+    states = np.zeros(vertices.shape[:2] + (2,), dtype=int)
+    for i in range(len(vertices)):
+        for p, angle in zip(mid_points[i], mid_angles[i]):
+            p = EuclideanCoords(p)
+            if str(p) not in table:
+                state = crossing_states(quantize([[p.x, p.y]])[0])[0]
+                table[str(p)] = {"state": state, "angle": angle}
+            elif table[str(p)]["state"].sum() % 2 == 0:
+                table[str(p)] = {"state": 1 - table[str(p)]["state"], "angle": angle}
+        for j, v in enumerate(vertices[i]):
+            entry = table.get(str(EuclideanCoords(v)))
+            if entry is not None:
+                crossing[i, j] = True
+                angles[i, j] = entry["angle"]
+                states[i, j] = entry["state"]
+    return table, crossing, angles, states
+
+
+def random_faces(rng, n_faces, n_points):
+    # Few distinct points, so that they are shared by many faces
+    grid = rng.integers(0, 6, size=(n_faces, n_points, 2)) * 0.37 + 0.5
+    jitter = rng.uniform(-0.004, 0.004, size=grid.shape)
+    mid_points = grid + jitter
+    mid_angles = rng.uniform(0, 1, size=(n_faces, n_points))
+    vertices = np.concatenate([mid_points, grid[:, ::-1] + 0.1], axis=1)
+    return mid_points, mid_angles, vertices
+
+
+def test_quantize_matches_round():
+    points = np.array([[0.125, 1.005], [2.675, -3.14159], [1e5 / 3, 0.015]])
+
+    keys, finite = quantize(points)
+
+    assert finite.all()
+    assert np.array_equal(keys / 100, np.round(points, 2))
+
+
+def test_quantize_non_finite():
+    keys, finite = quantize([[np.nan, 0], [1, np.inf], [1, 2]])
+
+    assert finite.tolist() == [False, False, True]
+    assert keys[2].tolist() == [100, 200]
+
+
+def test_crossing_states_are_bits():
+    keys, _ = quantize(np.random.default_rng(0).uniform(-100, 100, (1000, 2)))
+
+    states = crossing_states(keys)
+
+    assert states.shape == (1000, 2)
+    assert set(np.unique(states).tolist()) == {0, 1}
+    # Every state is drawn, so that the laces alternate
+    assert len(np.unique(states, axis=0)) == 4
+    # The state only depends on the point
+    assert np.array_equal(states[::-1], crossing_states(keys[::-1]))
+
+
+def test_register_faces_matches_reference():
+    rng = np.random.default_rng(1)
+    mid_points, mid_angles, vertices = random_faces(rng, 40, 4)
+
+    table = CrossingTable()
+    crossing, angles, states = table.register_faces(mid_points, mid_angles, vertices)
+    expected, *arrays = reference_faces(mid_points, mid_angles, vertices)
+
+    assert len(table) == len(expected)
+    for got, want in zip((crossing, angles, states), arrays):
+        assert np.array_equal(got, want)
+
+
+def test_batches_match_face_after_face():
+    rng = np.random.default_rng(2)
+    mid_points, mid_angles, vertices = random_faces(rng, 30, 3)
+
+    batched = CrossingTable()
+    batched.register_faces(mid_points[:10], mid_angles[:10], vertices[:10])
+    got = batched.register_faces(mid_points[10:], mid_angles[10:], vertices[10:])
+
+    single = CrossingTable()
+    for i in range(30):
+        single.register(mid_points[i], mid_angles[i])
+        expected = single.lookup(vertices[i])
+        if i >= 10:
+            for g, e in zip(got, expected):
+                assert np.array_equal(g[i - 10], e)
+
+    assert batched.keys() == single.keys()
+
+
+def test_lookup_missing_points():
+    table = CrossingTable()
+    table.register([[1.0, 2.0]], [0.5])
+
+    crossing, angles, states = table.lookup([[1.001, 2.0], [3, 4], [np.nan, 0]])
+
+    assert crossing.tolist() == [True, False, False]
+    assert angles.tolist() == [0.5, 0, 0]
+    assert EuclideanCoords([1.0, 2.0]) in table
+    assert EuclideanCoords([1.01, 2.0]) not in table
+
+
+def test_empty_table():
+    crossing, angles, states = CrossingTable().lookup(np.empty((0, 2)))
+
+    assert crossing.shape == (0,)
+    assert states.shape == (0, 2)
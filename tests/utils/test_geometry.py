@@ -11,10 +11,14 @@ from mortier.utils.geometry import (
     compute_cut_length,
     outline_lines,
     quadratic_bezier,
-    fill_intersect_points
+    fill_intersect_points,
+    crossing_arrays,
+    cut_lengths,
+    outline_rings,
 )
 from mortier.coords import EuclideanCoords
-from mortier.face import Face
+from mortier.utils.crossings import CrossingTable
+from mortier.face import Face, FaceBatch
 
 from mortier.writer.ornements import Ornements 
 
@@ -115,7 +119,7 @@ def test_compute_cut_length_values():
 
 def test_outline_lines_simple():
     pts = [EuclideanCoords([0, 0]), EuclideanCoords([1, 0]), EuclideanCoords([1, 1])]
-    intersect_points = {}
+    intersect_points = CrossingTable()
     ornements = Ornements()
     pos, neg = outline_lines(pts, intersect_points, ornements)
     assert len(pos) > 0
@@ -133,19 +137,20 @@ def test_fill_intersect_points_and_outline():
     face = Face(vertices)
     angle = 0.1
     face = face.ray_transform(angle)
-    intersect_points = {}
+    intersect_points = CrossingTable()
 
     # Fill intersect points
     fill_intersect_points(face, intersect_points)
 
-    # Test that each midpoint is in intersect_points with proper keys
-    for p, angle in face.mid_points:
-        key = str(p)
-        assert key in intersect_points
-        assert "state" in intersect_points[key]
-        assert "angle" in intersect_points[key]
-        assert intersect_points[key]["angle"] == angle
-        assert intersect_points[key]["state"].shape == (2,)
+    # Test that each midpoint is a crossing, with its angle
+    crossing, angles, states = crossing_arrays(
+        [p for p, _ in face.mid_points], intersect_points
+    )
+    for i, (p, angle) in enumerate(face.mid_points):
+        assert p in intersect_points
+        assert crossing[i]
+        assert angles[i] == angle
+        assert states[i].shape == (2,)
 
     # Now test outline_lines using these intersect points
     bands_width = 0.2
@@ -197,3 +202,103 @@ def test_line_offset_basic():
     assert np.isclose(p1a.y - p1.y, d)
     assert np.isclose(p0b.y - p0.y, -d)
     assert np.isclose(p1b.y - p1.y, -d)
+
+
+def test_fill_intersect_points_does_not_depend_on_random_state():
+    face = Face(
+        [
+            EuclideanCoords([0, 0]),
+            EuclideanCoords([0, 1]),
+            EuclideanCoords([1, 1]),
+            EuclideanCoords([1, 0]),
+        ]
+    ).ray_transform(0.1)
+
+    states = []
+    for seed in [0, 1]:
+        np.random.seed(seed)
+        intersect_points = CrossingTable()
+        fill_intersect_points(face, intersect_points)
+        points = [p for p, _ in face.mid_points]
+        states.append(crossing_arrays(points, intersect_points)[2].tolist())
+
+    assert states[0] == states[1]
+
+
+def test_cut_lengths_match_compute_cut_length():
+    theta = np.linspace(0.05, 1.5, 20)
+    for ornements in [Ornements(width=2), Ornements(width=2, type="laces")]:
+        cut, add = cut_lengths(theta, ornements)
+        for i, t in enumerate(theta):
+            assert (cut[i], add[i]) == compute_cut_length(t, ornements)
+
+
+def laced_square_faces():
+    corners = [(0, 0), (10, 0), (10, 10), (0, 10)]
+    faces = [
+        Face([EuclideanCoords([x + dx, y + dy]) for dx, dy in corners])
+        for x, y in [(0, 0), (10, 0), (0, 10)]
+    ]
+    return FaceBatch.from_faces(faces)[0].ray_transform(0.4, [0, 0, 30, 30])
+
+
+def test_outline_rings_match_scalar_helpers():
+    ornements = Ornements(width=2, type="laces", angle=0.4)
+    batch = laced_square_faces()
+    intersect_points = CrossingTable()
+    for face in batch.faces():
+        fill_intersect_points(face, intersect_points)
+
+    face = batch.faces()[1]
+    points = face.vertices
+    crossing, angles, states = crossing_arrays(points, intersect_points)
+    pos, neg, has_neg = outline_rings(
+        batch.vertices[1:2], crossing[None], angles[None], states[None], ornements
+    )
+
+    n = len(points)
+    # Closed faces start and end on a crossing, the other vertices are
+    # plain miter joins
+    assert crossing[0] and crossing[-1]
+    for i in range(1, n - 1):
+        miter_pos, miter_neg = vertex_miter(
+            points[i - 1], points[i], points[i + 1], ornements
+        )
+        assert np.array_equal(pos[0, i], miter_pos.numpy())
+        if has_neg[0, i]:
+            assert np.array_equal(neg[0, i, 1], miter_neg.numpy())
+
+    # Every point of the outer ring comes after a crossing
+    assert has_neg[0].tolist() == (~crossing & np.roll(crossing, -1)).tolist()
+    i = np.flatnonzero(has_neg[0])[0]
+    cut, add = compute_cut_length(angles[i + 1], ornements)
+    length = cut if states[i + 1][1] == 1 else add
+    end = offset_segment(points[i], points[i + 1], length, ornements, end_cut=True)
+    assert np.array_equal(neg[0, i, 2], end.numpy())
+
+    # Closing point, on the first and last sides
+    assert np.array_equal(pos[0, 0], pos[0, -1])
+
+
+def test_outline_lines_match_outline_rings():
+    ornements = Ornements(width=2, type="bands", angle=0.4)
+    batch = laced_square_faces()
+    intersect_points = CrossingTable()
+    for face in batch.faces():
+        fill_intersect_points(face, intersect_points)
+
+    for i, face in enumerate(batch.faces()):
+        crossing, angles, states = crossing_arrays(face.vertices, intersect_points)
+        pos, neg, has_neg = outline_rings(
+            batch.vertices[i : i + 1],
+            crossing[None],
+            angles[None],
+            states[None],
+            ornements,
+        )
+        pos_ring, neg_ring = outline_lines(face.vertices, intersect_points, ornements)
+
+        assert np.array_equal([p.numpy() for p in pos_ring], pos[0])
+        assert np.array_equal(
+            [p.numpy() for p in neg_ring], neg[has_neg].reshape(-1, 2)
+        )
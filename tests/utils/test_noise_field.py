@@ -0,0 +1,60 @@
+import numpy as np
+import pytest
+
+from mortier.coords import EuclideanCoords
+from mortier.enums import ParamType
+from mortier.utils.math_utils import angle_field, angle_parametrisation
+from mortier.utils.noise_field import pnoise3, snoise3
+
+
+@pytest.fixture
+def points():
+    rng = np.random.default_rng(0)
+    return np.concatenate(
+        [rng.uniform(-3, 5, size=(2000, 3)), rng.uniform(-300, 300, size=(200, 3))]
+    )
+
+
+@pytest.mark.parametrize("octaves", [1, 3])
+def test_pnoise3_matches_noise_package(points, octaves):
+    noise = pytest.importorskip("noise")
+
+    expected = [noise.pnoise3(*p, octaves=octaves) for p in points.tolist()]
+
+    values = pnoise3(points[:, 0], points[:, 1], points[:, 2], octaves=octaves)
+    assert np.array_equal(values, expected)
+
+
+@pytest.mark.parametrize("octaves", [1, 4])
+def test_snoise3_matches_noise_package(points, octaves):
+    noise = pytest.importorskip("noise")
+
+    expected = [noise.snoise3(*p, octaves=octaves) for p in points.tolist()]
+
+    values = snoise3(points[:, 0], points[:, 1], points[:, 2], octaves=octaves)
+    assert np.array_equal(values, expected)
+
+
+def test_noise_broadcasts_coordinates():
+    x = np.linspace(0, 2, 5)
+
+    values = pnoise3(x[:, None], x[None, :], 0.5)
+
+    assert values.shape == (5, 5)
+    assert values[1, 2] == pnoise3(x[1], x[2], 0.5)
+
+
+@pytest.mark.parametrize("mode", list(ParamType))
+def test_angle_field_matches_angle_parametrisation(mode):
+    rng = np.random.default_rng(1)
+    points = rng.uniform(-100, 1000, size=(50, 2))
+    bounds = (0, 0, 960, 540)
+
+    angles = angle_field(points, mode, bounds, [3, 10])
+
+    expected = [
+        angle_parametrisation(EuclideanCoords(p), mode, bounds, [3, 10])
+        for p in points
+    ]
+    assert np.array_equal(angles, expected)
+    assert ((angles >= 0) & (angles <= np.pi / 2)).all()
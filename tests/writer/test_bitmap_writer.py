@@ -1,6 +1,11 @@
+import numpy as np
 import pytest
+from PIL import Image
 
+from mortier.coords import EuclideanCoords
+from mortier.face import Face, FaceBatch, HalfEdgeMesh
 from mortier.writer import BitmapWriter
+from mortier.writer.ornements import Ornements
 
 class FakePoint:
     def __init__(self, x, y):
@@ -151,3 +156,176 @@ def test_new_resets_image():
     assert w.image.size == (200, 200)
     assert w.image is not old_image
 
+
+
+@pytest.mark.parametrize(
+    "fill, outline",
+    [((10, 200, 30), (255, 255, 255)), (None, (255, 0, 0)), ((5, 5, 5), (5, 5, 5))],
+)
+def test_polygons_match_polygon(fill, outline):
+    rng = np.random.default_rng(0)
+    # Overlapping polygons, with points out of the canvas
+    coords = rng.uniform(-10, 70, size=(40, 5, 2))
+    coords = np.concatenate([coords, coords[:, :1]], axis=1)
+
+    expected = BitmapWriter("test.png", size=(0, 0, 64, 48))
+    for xy in coords:
+        expected.polygon([tuple(p) for p in xy], fill=fill, outline=outline)
+
+    w = BitmapWriter("test.png", size=(0, 0, 64, 48))
+    w.polygons(coords, fill=fill, outline=outline)
+
+    assert np.array_equal(np.asarray(w.image), np.asarray(expected.image))
+
+
+def test_lines_and_points_match_single_calls():
+    rng = np.random.default_rng(2)
+    segments = rng.uniform(-10, 70, size=(30, 2, 2))
+    points = rng.uniform(-10, 70, size=(30, 2))
+
+    expected = BitmapWriter("test.png", size=(0, 0, 64, 48))
+    for p0, p1 in segments:
+        expected.line(FakePoint(*p0), FakePoint(*p1), color=(255, 0, 0))
+    for p in points:
+        expected.point(FakePoint(*p), color=(0, 255, 0))
+
+    w = BitmapWriter("test.png", size=(0, 0, 64, 48))
+    w.lines(segments, color=(255, 0, 0))
+    w.points(points, color=(0, 255, 0))
+
+    assert np.array_equal(np.asarray(w.image), np.asarray(expected.image))
+
+
+def test_points_stamp_discs():
+    w = BitmapWriter("test.png", size=(0, 0, 20, 20))
+
+    w.points(np.array([[10.6, 5.2], [-1.5, 18.0]]), color=(0, 0, 255), radius=2)
+
+    drawn = np.argwhere(np.asarray(w.image)[..., 2] == 255)
+    center = drawn[np.abs(drawn - [5, 10]).sum(axis=1) <= 2]
+    # Disc of radius 2 around (10, 5), clipped disc around (-1, 18)
+    assert len(center) == 13
+    assert {(y, x) for y, x in drawn.tolist()} - {
+        (y, x) for y, x in center.tolist()
+    } == {(17, 0), (18, 0), (19, 0), (18, 1)}
+
+
+def test_points_in_viewport_match_canvas():
+    rng = np.random.default_rng(3)
+    points = rng.uniform(-5, 70, size=(300, 2))
+
+    full = BitmapWriter("test.png", size=(0, 0, 64, 48))
+    full.points(points, color=(255, 0, 0), radius=1.5)
+
+    w = BitmapWriter("test.png", size=(0, 0, 64, 48), viewport=(20, 10, 30, 25))
+    w.points(points, color=(255, 0, 0), radius=1.5)
+
+    assert np.array_equal(np.asarray(w.region()), np.asarray(full.image)[10:35, 20:50])
+
+
+@pytest.mark.parametrize(
+    "fill, outline",
+    [(None, (255, 0, 0)), ((0, 255, 0), None), ((9, 9, 9), (9, 9, 9))],
+)
+def test_single_color_polygons_match_one_by_one(fill, outline):
+    rng = np.random.default_rng(4)
+    coords = rng.uniform(-10, 70, size=(40, 5, 2))
+
+    w = BitmapWriter("test.png", size=(0, 0, 64, 48))
+    w.polygons(coords, fill=fill, outline=outline)
+
+    expected = BitmapWriter("test.png", size=(0, 0, 64, 48))
+    for xy in coords:
+        expected.polygon([tuple(p) for p in xy], outline, fill)
+    assert np.array_equal(np.asarray(w.image), np.asarray(expected.image))
+
+
+def test_viewport_matches_crop_of_canvas():
+    rng = np.random.default_rng(1)
+    coords = rng.uniform(-10, 70, size=(40, 5, 2))
+    coords = np.concatenate([coords, coords[:, :1]], axis=1)
+
+    full = BitmapWriter("test.png", size=(0, 0, 64, 48))
+    full.polygons(coords, fill=(10, 200, 30), outline=(255, 255, 255))
+
+    w = BitmapWriter("test.png", size=(0, 0, 64, 48), viewport=(20, 10, 30, 25))
+    w.polygons(coords, fill=(10, 200, 30), outline=(255, 255, 255))
+
+    region = np.asarray(w.region())
+    assert region.shape == (25, 30, 3)
+    assert np.array_equal(region, np.asarray(full.image)[10:35, 20:50])
+
+
+def test_viewport_only_holds_its_region():
+    rng = np.random.default_rng(2)
+    segments = rng.uniform(-10, 70, size=(40, 2, 2))
+    centers = rng.uniform(-10, 70, size=(10, 2))
+    writers = [
+        BitmapWriter("test.png", size=(0, 0, 64, 48)),
+        BitmapWriter("test.png", size=(0, 0, 64, 48), viewport=(20, 10, 30, 25)),
+    ]
+    for w in writers:
+        w.lines(segments, color=(255, 0, 0))
+        w.line(EuclideanCoords([-3.5, 40.2]), EuclideanCoords([60.7, -2.5]))
+        for c in centers:
+            w.circle(EuclideanCoords(c), 7.3, color=(0, 0, 255))
+        w.polygon([(-4.5, 3.2), (30.5, 12.7), (25.1, 40.9)], (0, 255, 0))
+    full, w = writers
+
+    assert w.image.size == (30, 25)
+    assert np.array_equal(np.asarray(w.region()), np.asarray(full.image)[10:35, 20:50])
+
+
+def test_write_saves_viewport(tmp_path):
+    filename = str(tmp_path / "tile.png")
+    w = BitmapWriter(filename, size=(0, 0, 64, 48), viewport=(20, 10, 30, 25))
+
+    w.write()
+
+    assert Image.open(filename).size == (30, 25)
+
+
+@pytest.mark.parametrize("type", ["bands", "laces"])
+def test_face_batch_ornements_match_faces(type):
+    corners = [(0, 0), (10, 0), (10, 10), (0, 10)]
+    faces = [
+        Face([EuclideanCoords([x + dx, y + dy]) for dx, dy in corners])
+        for x in range(5, 45, 10)
+        for y in range(5, 35, 10)
+    ]
+    batch = FaceBatch.from_faces(faces)[0].ray_transform(0.4, [0, 0, 64, 48])
+
+    expected = BitmapWriter("test.png", size=(0, 0, 64, 48))
+    expected.set_ornements(Ornements(width=2, type=type, angle=0.4))
+    for face in batch.faces():
+        expected.face(face)
+
+    w = BitmapWriter("test.png", size=(0, 0, 64, 48))
+    w.set_ornements(Ornements(width=2, type=type, angle=0.4))
+    w.face_batch(batch)
+
+    assert np.array_equal(np.asarray(w.image), np.asarray(expected.image))
+    assert w.intersect_points.keys() == expected.intersect_points.keys()
+
+
+def test_edges_once_draws_the_same_grid():
+    squares = np.array(
+        [
+            [[x, y], [x + 10, y], [x + 10, y + 10], [x, y + 10]]
+            for x in range(5, 45, 10)
+            for y in range(5, 35, 10)
+        ],
+        dtype=float,
+    )
+    batch = FaceBatch(squares)
+
+    expected = BitmapWriter("test.png", size=(0, 0, 64, 48))
+    expected.face_batch(batch)
+
+    w = BitmapWriter("test.png", size=(0, 0, 64, 48))
+    w.edges_once = True
+    w.face_batch(batch)
+    assert not np.asarray(w.image).any()
+    w.draw_edges(HalfEdgeMesh.from_polygons(squares))
+
+    assert np.array_equal(np.asarray(w.image), np.asarray(expected.image))
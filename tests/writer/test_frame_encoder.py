@@ -0,0 +1,65 @@
+import numpy as np
+import pytest
+from PIL import Image
+
+from mortier.writer import FrameEncoder
+
+
+def frames(n=5):
+    return [Image.new("RGB", (32, 24), (40 * i, 255 - 40 * i, 0)) for i in range(n)]
+
+
+@pytest.mark.parametrize("extension", ["gif", "png"])
+def test_animation_file(tmp_path, extension):
+    filename = str(tmp_path / f"anim.{extension}")
+
+    with FrameEncoder(filename, duration=30) as encoder:
+        for frame in frames():
+            encoder.add(frame)
+
+    with Image.open(filename) as image:
+        assert image.n_frames == 5
+        assert image.size == (32, 24)
+
+
+def test_numbered_frames(tmp_path):
+    images = frames(3)
+
+    with FrameEncoder(str(tmp_path / "frame_{:02d}.png")) as encoder:
+        for frame in images:
+            encoder.add(frame)
+
+    for i, frame in enumerate(images):
+        saved = Image.open(tmp_path / f"frame_{i:02d}.png")
+        assert np.array_equal(np.asarray(saved), np.asarray(frame))
+
+
+def test_frames_are_copied(tmp_path):
+    frame = Image.new("RGB", (8, 8))
+
+    with FrameEncoder(str(tmp_path / "frame_{}.png")) as encoder:
+        encoder.add(frame)
+        frame.paste((255, 0, 0), (0, 0, 8, 8))
+        encoder.add(frame)
+
+    assert Image.open(tmp_path / "frame_0.png").getpixel((0, 0)) == (0, 0, 0)
+    assert Image.open(tmp_path / "frame_1.png").getpixel((0, 0)) == (255, 0, 0)
+
+
+def test_encoding_error_is_raised(tmp_path):
+    encoder = FrameEncoder(str(tmp_path / "missing" / "frame_{}.png"))
+    encoder.add(Image.new("RGB", (8, 8)))
+
+    with pytest.raises(OSError):
+        encoder.close()
+
+
+def test_nothing_saved_on_error(tmp_path):
+    filename = tmp_path / "anim.gif"
+
+    with pytest.raises(RuntimeError):
+        with FrameEncoder(str(filename)) as encoder:
+            encoder.add(Image.new("RGB", (8, 8)))
+            raise RuntimeError
+
+    assert not filename.exists()
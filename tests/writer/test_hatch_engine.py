@@ -0,0 +1,137 @@
+import numpy as np
+import pytest
+
+from mortier.writer.hatching import hatch_dots, hatch_lines, hatch_spans
+from mortier.writer.hatching.hatch_engine import rotated_bounds
+
+
+def scalar_spans(polygon, angle, spacing):
+    """Reference scanline hatching of a single polygon, one line at a time."""
+    cos, sin = np.cos(-angle), np.sin(-angle)
+    rotated = [(x * cos - y * sin, x * sin + y * cos) for x, y in polygon]
+    ys = [p[1] for p in rotated]
+    y_min, y_max = min(ys), max(ys)
+
+    spans = []
+    k = 1
+    while y_min + k * spacing < y_max:
+        y = y_min + k * spacing
+        xs = []
+        for j, p0 in enumerate(rotated):
+            p1 = rotated[(j + 1) % len(rotated)]
+            if (p0[1] <= y < p1[1]) or (p1[1] <= y < p0[1]):
+                t = (y - p0[1]) / (p1[1] - p0[1])
+                xs.append(p0[0] + t * (p1[0] - p0[0]))
+        xs.sort()
+        spans += [(xs[i], xs[i + 1], y) for i in range(0, len(xs) - 1, 2)]
+        k += 1
+    return spans
+
+
+def square(x, y, size=40):
+    return np.array([[x, y], [x + size, y], [x + size, y + size], [x, y + size]])
+
+
+def test_spans_of_square():
+    x0, x1, y, polygon = hatch_spans([square(0, 0)], 0.0, 10)
+
+    assert x0.tolist() == [0, 0, 0]
+    assert x1.tolist() == [40, 40, 40]
+    assert y.tolist() == [10, 20, 30]
+    assert polygon.tolist() == [0, 0, 0]
+
+
+@pytest.mark.parametrize("angle", [0.0, 0.3, np.pi / 2, 2.0])
+def test_spans_match_scalar_reference(angle):
+    rng = np.random.default_rng(0)
+    polygons = []
+    for n in [3, 5, 6, 6, 8]:
+        theta = np.sort(rng.uniform(0, 2 * np.pi, n))
+        radius = rng.uniform(10, 30, n)
+        center = rng.uniform(0, 100, 2)
+        ring = np.stack([np.cos(theta), np.sin(theta)], -1)
+        polygons.append(center + radius[:, None] * ring)
+
+    x0, x1, y, polygon = hatch_spans(polygons, angle, 3)
+
+    for i, p in enumerate(polygons):
+        expected = np.array(scalar_spans(p.tolist(), angle, 3)).reshape(-1, 3)
+        got = np.stack([x0, x1, y], -1)[polygon == i]
+        np.testing.assert_allclose(got, expected, atol=1e-9)
+
+
+def test_concave_polygon_has_two_spans_per_line():
+    # U shape, open upwards
+    u = np.array(
+        [[0, 0], [30, 0], [30, 30], [20, 30], [20, 10], [10, 10], [10, 30], [0, 30]]
+    )
+
+    x0, x1, y, _ = hatch_spans([u], 0.0, 5)
+
+    above = y > 10
+    assert np.all(np.isin(x0[above], [0, 20]))
+    assert np.all(np.isin(x1[above], [10, 30]))
+    assert np.count_nonzero(above) == 2 * np.count_nonzero(np.unique(y) > 10)
+
+
+def test_ragged_and_array_polygons_agree():
+    coords = np.stack([square(0, 0), square(50, 10)])
+
+    from_array = hatch_lines(coords, 0.4, 4)
+    from_list = hatch_lines(list(coords), 0.4, 4)
+
+    np.testing.assert_array_equal(from_array, from_list)
+
+
+def test_non_finite_polygons_are_skipped():
+    broken = square(0, 0).astype(float)
+    broken[2] = np.nan
+
+    x0, _, _, polygon = hatch_spans([broken, square(50, 50)], 0.0, 10)
+
+    assert len(x0) == 3
+    assert np.all(polygon == 1)
+
+
+def test_bounds_skip_invisible_lines():
+    polygons = [square(0, 0, 100), square(300, 300)]
+    bounds = (0, 0, 50, 50)
+    angle = 0.5
+
+    clipped = hatch_lines(polygons, angle, 5, bounds)
+    full = hatch_lines(polygons, angle, 5)
+
+    # Lines are kept whole, when their offset crosses the rotated bounds
+    _, lo, _, hi = rotated_bounds(bounds, -angle)
+    offset = full[:, 0, 1] * np.cos(angle) - full[:, 0, 0] * np.sin(angle)
+    visible = full[(lo - 1e-9 <= offset) & (offset <= hi + 1e-9)]
+    assert 0 < len(clipped) < len(full)
+    np.testing.assert_allclose(clipped, visible)
+
+
+def test_lines_are_rotated_back():
+    segments = hatch_lines([square(0, 0)], np.pi / 2, 10)
+
+    # Vertical lines, across the whole square
+    np.testing.assert_allclose(segments[:, 0, 0], segments[:, 1, 0], atol=1e-9)
+    np.testing.assert_allclose(np.abs(segments[:, 1, 1] - segments[:, 0, 1]), 40)
+    assert {10, 20, 30} <= set(np.round(segments[:, 0, 0], 9).tolist())
+
+
+def test_dots_are_spaced_along_lines():
+    dots = hatch_dots([square(0, 0)], 0.0, 10)
+
+    assert dots[:, 0].tolist() == [5, 15, 25, 35] * 3
+    assert dots[:, 1].tolist() == [10] * 4 + [20] * 4 + [30] * 4
+
+
+def test_dots_in_bounds():
+    dots = hatch_dots([square(0, 0, 100)], 0.0, 10, bounds=(0, 0, 30, 30))
+
+    assert dots[:, 0].max() < 40
+    assert dots[:, 1].max() <= 30
+
+
+def test_empty_input():
+    assert hatch_lines([], 0.3, 5).shape == (0, 2, 2)
+    assert hatch_dots([], 0.3, 5).shape == (0, 2)
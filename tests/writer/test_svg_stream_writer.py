@@ -0,0 +1,138 @@
+import xml.etree.ElementTree as ET
+
+import numpy as np
+import pytest
+
+from mortier.writer import SVGStreamWriter
+
+SVG_NS = "{http://www.w3.org/2000/svg}"
+
+
+class FakePoint:
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+
+
+def parse(path):
+    return ET.parse(path).getroot()
+
+
+def test_header_written_on_creation(tmp_path):
+    w = SVGStreamWriter(str(tmp_path / "out"), size=(0, 0, 100, 200))
+    w.file.flush()
+
+    content = (tmp_path / "out.svg").read_text()
+    assert content.startswith("<?xml")
+    assert 'viewBox="0,0,100,200"' in content
+    assert 'clipPath id="clip_area"' in content
+
+
+def test_write_produces_valid_svg(tmp_path):
+    w = SVGStreamWriter(str(tmp_path / "out"), size=(0, 0, 100, 100))
+    w.set_color_bg((10, 20, 30))
+    w.line(FakePoint(10, 10), FakePoint(50, 50), color=(0, 255, 0))
+    w.circle(FakePoint(50, 50), 10, color=(255, 0, 0))
+    w.write()
+
+    root = parse(tmp_path / "out.svg")
+    assert root.tag == SVG_NS + "svg"
+    rect = root.find(SVG_NS + "rect")
+    assert rect.get("fill") == "rgb(10,20,30)"
+
+    groups = root.find(SVG_NS + "g").findall(SVG_NS + "g")
+    assert groups[0].get("stroke") == "rgb(0,255,0)"
+    assert groups[0].find(SVG_NS + "path").get("d") == "M10.000,10.000 50.000,50.000"
+    assert groups[1].find(SVG_NS + "circle").get("r") == "10"
+
+
+def test_out_of_bounds_primitives_are_skipped(tmp_path):
+    w = SVGStreamWriter(str(tmp_path / "out"), size=(0, 0, 100, 100))
+    w.line(FakePoint(200, 200), FakePoint(300, 300))
+    w.circle(FakePoint(200, 200), 10)
+    w.write()
+
+    root = parse(tmp_path / "out.svg")
+    assert root.find(SVG_NS + "g") is None
+
+
+def test_polygons_grouped_per_style(tmp_path):
+    w = SVGStreamWriter(str(tmp_path / "out"), size=(0, 0, 100, 100), chunk_size=2)
+    square = np.array([[0, 0], [1, 0], [1, 1], [0, 1], [0, 0]], dtype=float)
+    coords = np.stack([square + k for k in range(5)])
+    coords[3, 0, 0] = np.nan
+
+    w.polygons(coords, fill=(1, 2, 3), outline=(4, 5, 6))
+    w.polygon([(0, 0), (2, 0), (2, 2)], outline=(4, 5, 6), fill=(1, 2, 3))
+    # Same positional order as Writer.polygon
+    w.polygon([(0, 0), (2, 0), (2, 2)], None, (4, 5, 6))
+    w.write()
+
+    groups = parse(tmp_path / "out.svg").find(SVG_NS + "g").findall(SVG_NS + "g")
+    assert [g.get("fill") for g in groups] == ["rgb(1,2,3)", "none"]
+    paths = [p.get("d") for p in groups[0].findall(SVG_NS + "path")]
+    # 5 polygons, one of them invalid, merged 2 by 2
+    assert len(paths) == 3
+    assert sum(d.count("Z") for d in paths) == 5
+    assert "nan" not in " ".join(paths)
+
+
+def test_lines_match_single_lines(tmp_path):
+    segments = np.array(
+        [[[10, 10], [50, 50]], [[200, 200], [300, 300]], [[-5, 20], [20, 20]]],
+        dtype=float,
+    )
+
+    expected = SVGStreamWriter(str(tmp_path / "expected"), size=(0, 0, 100, 100))
+    for p0, p1 in segments:
+        expected.line(FakePoint(*p0), FakePoint(*p1), color=(0, 255, 0))
+    expected.write()
+
+    w = SVGStreamWriter(str(tmp_path / "out"), size=(0, 0, 100, 100))
+    w.lines(segments, color=(0, 255, 0))
+    w.write()
+
+    assert (tmp_path / "out.svg").read_text() == (
+        tmp_path / "expected.svg"
+    ).read_text()
+
+
+def test_new_starts_a_new_file(tmp_path):
+    w = SVGStreamWriter(str(tmp_path / "first"), size=(0, 0, 100, 100))
+    w.line(FakePoint(10, 10), FakePoint(50, 50))
+
+    w.new(str(tmp_path / "second"), size=(0, 0, 200, 200))
+    w.write()
+
+    assert parse(tmp_path / "first.svg").find(SVG_NS + "g") is not None
+    second = parse(tmp_path / "second.svg")
+    assert second.get("viewBox") == "0,0,200,200"
+    assert w.filename == str(tmp_path / "second")
+
+
+def test_polylines_one_path_each(tmp_path):
+    paths = [
+        np.array([[10, 10], [20, 10], [20, 20]], dtype=float),
+        np.array([[200, 200], [300, 300]], dtype=float),
+        np.array([[-10, 50], [50, 50], [50, 150]], dtype=float),
+    ]
+
+    w = SVGStreamWriter(str(tmp_path / "out"), size=(0, 0, 100, 100), precision=0)
+    w.polylines(paths, color=(0, 255, 0))
+    w.write()
+
+    group = parse(tmp_path / "out.svg").find(SVG_NS + "g").find(SVG_NS + "g")
+    assert group.get("stroke") == "rgb(0,255,0)"
+    d = group.find(SVG_NS + "path").get("d")
+    assert d == "M10,10 20,10 20,20 M-10,50 50,50 50,150"
+
+
+def test_file_is_closed_when_drawing_fails(tmp_path):
+    with pytest.raises(RuntimeError):
+        with SVGStreamWriter(str(tmp_path / "out"), size=(0, 0, 100, 100)) as w:
+            w.polygons(np.zeros((1, 3, 2)), fill=(1, 2, 3), outline=None)
+            raise RuntimeError
+
+    assert w.file is None
+    root = parse(tmp_path / "out.svg")
+    assert len(root.find(SVG_NS + "g").findall(SVG_NS + "g")) == 1
@@ -100,7 +100,7 @@ def test_face_simple_polygon(monkeypatch):
         FakePoint(20, 20),
     ]
 
-    face = FakeFace(vertices, mid_points=[FakePoint(0, 0)])
+    face = FakeFace(vertices, mid_points=[(FakePoint(0, 0), 0.0)])
 
     w.face(face)
 
@@ -189,3 +189,79 @@ def test_new_resets_state():
     assert w.output == []
     assert "\\clip" in w.header
 
+
+
+def test_output_keeps_drawing_order():
+    w = TikzWriter("out.tex", size=(0, 0, 100, 100))
+
+    w.line(FakePoint(30, 30), FakePoint(40, 40))
+    w.line(FakePoint(10, 10), FakePoint(20, 20))
+    w.point(FakePoint(5, 6))
+
+    assert w.output == [
+        "\\draw [draw=black] (30, 30) -- (40, 40);",
+        "\\draw [draw=black] (10, 10) -- (20, 20);",
+        "\\filldraw[black] (5, 6) circle (2pt);",
+    ]
+
+
+def test_duplicates_are_skipped():
+    w = TikzWriter("out.tex", size=(0, 0, 100, 100))
+
+    w.line(FakePoint(10, 10), FakePoint(20, 20))
+    w.line(FakePoint(20, 20), FakePoint(10, 10))
+    w.line(FakePoint(10.001, 10), FakePoint(20, 20))
+    w.line(FakePoint(10, 10), FakePoint(20, 20), dotted=True)
+    w.point(FakePoint(5, 6))
+    w.point(FakePoint(5, 6))
+
+    assert len(w.output) == 3
+
+
+def test_dedup_is_bounded():
+    w = TikzWriter("unused.tex", size=(0, 0, 100, 100), dedup_size=2)
+
+    for i in [1, 2, 1, 3, 1, 2]:
+        w.point(FakePoint(i, i))
+
+    # 2 is forgotten once 1 and 3 were drawn after it, and drawn again
+    assert len(w.seen) == 2
+    assert list(w.seen) == [
+        ("point", "black", 100, 100),
+        ("point", "black", 200, 200),
+    ]
+    assert [line.count("(2, 2)") for line in w.output] == [0, 1, 0, 1]
+
+
+def test_output_is_streamed(tmp_path):
+    filename = tmp_path / "out.tex"
+    w = TikzWriter(str(filename), size=(0, 0, 100, 100), buffer_size=2)
+
+    for i in range(5):
+        w.point(FakePoint(i, i))
+
+    assert len(w.output) == 1
+    assert filename.read_text().count("circle") == 4
+
+    w.write()
+    content = filename.read_text()
+
+    assert content.startswith("\\begin{tikzpicture}")
+    assert content.rstrip().endswith("\\end{tikzpicture}")
+    assert [f"({i}, {i}) circle" in content for i in range(5)] == [True] * 5
+    assert content.index("(3, 3)") < content.index("(4, 4)")
+
+
+def test_edges_once_draws_polylines_instead_of_faces():
+    w = TikzWriter("out.tex", size=(0, 0, 100, 100))
+    w.edges_once = True
+
+    face = FakeFace([FakePoint(10, 10), FakePoint(20, 10), FakePoint(20, 20)])
+    w.face(face)
+    assert w.output == []
+
+    w.polylines([np.array([[10, 10], [20, 10], [200, 10], [20, 20], [10, 10]])])
+    assert w.output == [
+        "\\draw[black ] (10, 10)--(20, 10);",
+        "\\draw[black ] (20, 20)--(10, 10);",
+    ]
@@ -0,0 +1,66 @@
+import functools
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from mortier.database import TilingDatabase
+from mortier.tesselation import RegularTesselation
+from mortier.writer import BitmapWriter, render_tiles
+from mortier.writer.ornements import Ornements
+from mortier.writer.tile_writer import tile_viewports
+
+
+def draw(writer, tess_id="t3006", lace=False, n_tiles=20):
+    writer.n_tiles = n_tiles
+    writer.color_line = (255, 255, 255)
+    if lace:
+        ornements = Ornements(type="lace")
+        ornements.width = 2
+        writer.set_ornements(ornements)
+    tesselation = RegularTesselation(writer, TilingDatabase()[tess_id], tess_id)
+    tesselation.set_angle(0.4)
+    tesselation.draw_tesselation()
+
+
+def test_tile_viewports_cover_image():
+    size = (0, 0, 100, 70)
+
+    viewports = tile_viewports(size, 32)
+
+    covered = np.zeros((70, 100), dtype=int)
+    for x, y, w, h in viewports:
+        covered[y : y + h, x : x + w] += 1
+    assert len(viewports) == 4 * 3
+    assert (covered == 1).all()
+
+
+@pytest.mark.parametrize("lace", [False, True])
+def test_render_tiles_matches_single_render(tmp_path, lace):
+    size = (0, 0, 160, 120)
+    full = BitmapWriter(str(tmp_path / "full.png"), size=size)
+    draw(full, lace=lace)
+
+    filename = str(tmp_path / "tiles.png")
+    render_tiles(
+        functools.partial(draw, lace=lace), filename, size, tile_size=64, processes=2
+    )
+
+    tiled = np.asarray(Image.open(filename))
+    assert tiled.shape == (120, 160, 3)
+    assert np.array_equal(tiled, np.asarray(full.image))
+
+
+@pytest.mark.parametrize("tess_id", ["t2001", "t1003"])
+def test_render_tiles_matches_laces_on_the_canvas_border(tmp_path, tess_id):
+    # Large faces, whose crossings fall on the border of the canvas
+    size = (0, 0, 160, 120)
+    draw_laces = functools.partial(draw, tess_id=tess_id, lace=True, n_tiles=40)
+    full = BitmapWriter(str(tmp_path / "full.png"), size=size)
+    draw_laces(full)
+
+    filename = str(tmp_path / "tiles.png")
+    render_tiles(draw_laces, filename, size, tile_size=64, processes=2)
+
+    tiled = np.asarray(Image.open(filename))
+    assert np.array_equal(tiled, np.asarray(full.image))
@@ -6,7 +6,7 @@ from mortier.writer.writer import Writer
 from mortier.writer.hatching import Hatching
 from mortier.writer.ornements import Ornements 
 from mortier.coords import EuclideanCoords 
-from mortier.face import Face 
+from mortier.face import Face, FaceBatch
 
 
 class RecordingWriter(Writer):
@@ -23,6 +23,9 @@ class RecordingWriter(Writer):
     def point(self, p, color=(255, 255, 255)):
         self.points_drawn.append((p, color))
 
+    def circle(self, c, r, color=(255, 255, 255)):
+        self.points_drawn.append((c, color, r))
+
 
 class FakeFace:
     def __init__(self, vertices):
@@ -149,3 +152,62 @@ def test_face_with_hatching(monkeypatch):
     # polygon edges + hatch lines
     assert len(w.lines_drawn) >= 4
 
+
+def test_lines_forward_to_line():
+    w = RecordingWriter("test.png")
+    segments = np.array([[[0, 0], [1, 1]], [[2, 2], [3, 4]]], dtype=float)
+
+    w.lines(segments, color=(1, 2, 3))
+
+    assert [(a.x, a.y, b.x, b.y) for a, b, _ in w.lines_drawn] == [
+        (0, 0, 1, 1),
+        (2, 2, 3, 4),
+    ]
+    assert all(color == (1, 2, 3) for _, _, color in w.lines_drawn)
+
+
+def test_face_batch_hatches_every_face():
+    squares = [
+        [EuclideanCoords([x, 0]), EuclideanCoords([x + 10, 0]),
+         EuclideanCoords([x + 10, 10]), EuclideanCoords([x, 10])]
+        for x in (0, 20, 40)
+    ]
+    batch = FaceBatch.from_faces([Face(square) for square in squares])[0]
+
+    expected = RecordingWriter("test.png", size=(0, 0, 100, 100))
+    expected.hatching = Hatching(spacing=3, crosshatch=True)
+    for square in squares:
+        expected.hatch_fill(square)
+        expected.hatch_fill(square, True)
+
+    w = RecordingWriter("test.png", size=(0, 0, 100, 100))
+    w.hatching = Hatching(spacing=3, crosshatch=True)
+    w.polygons = lambda coords, fill, outline: None
+    w.face_batch(batch)
+
+    def ends(lines):
+        return sorted(
+            tuple(np.round([a.x, a.y, b.x, b.y], 9)) for a, b, _ in lines
+        )
+
+    assert len(w.lines_drawn) > 0
+    assert ends(w.lines_drawn) == ends(expected.lines_drawn)
+
+
+def test_hatch_dot_radius_is_forwarded():
+    from mortier.enums import HatchType
+
+    w = RecordingWriter("test.png")
+    w.hatching = Hatching(type=HatchType.DOT, spacing=4, radius=1.5)
+
+    square = [
+        EuclideanCoords([0, 0]),
+        EuclideanCoords([10, 0]),
+        EuclideanCoords([10, 10]),
+        EuclideanCoords([0, 10]),
+    ]
+
+    w.hatch_fill(square)
+
+    assert len(w.points_drawn) > 0
+    assert all(call[2] == 1.5 for call in w.points_drawn)